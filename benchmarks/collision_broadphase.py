@@ -0,0 +1,84 @@
+"""Counts the mask tests per frame done by the bullet-monster collision pass.
+
+Compares the old all-pairs loop against the spatial hash broadphase used by the
+CollisionHandler.
+
+Usage:
+    python -m benchmarks.collision_broadphase
+"""
+
+import random
+import time
+
+import pygame
+
+import settings
+from business.handlers.colission_handler import CollisionHandler
+from presentation.sprite import Sprite
+
+MONSTER_COUNTS = [500, 2000, 5000]
+BULLET_COUNT = 60
+FRAMES = 5
+
+
+class CountingMask(pygame.mask.Mask):
+    """A mask that counts how many times it takes part in an overlap test."""
+
+    tests = 0
+
+    def overlap(self, other, offset):
+        CountingMask.tests += 1
+        return super().overlap(other, offset)
+
+
+class BenchWorld:
+    """The subset of the game world the collision pass reads."""
+
+    def get_entity_by_sprite(self, _):
+        return None
+
+
+def create_sprites(count: int, size: tuple[int, int]) -> dict:
+    """Creates sprites scattered over the world and returns them with counting masks."""
+    masks = {}
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill((255, 255, 255, 255))
+    for _ in range(count):
+        center = (random.randint(0, settings.WORLD_WIDTH), random.randint(0, settings.WORLD_HEIGHT))
+        sprite = Sprite(image, image.get_rect(center=center))
+        masks[sprite] = CountingMask(size, fill=True)
+    return masks
+
+
+def brute_force(bullet_masks: dict, monster_masks: dict):
+    """The collision loop before the broadphase: every bullet against every monster."""
+    for bullet_sprite, bullet_mask in bullet_masks.items():
+        for monster_sprite, monster_mask in monster_masks.items():
+            bullet_mask.overlap(monster_mask, (monster_sprite.rect.x - bullet_sprite.rect.x, monster_sprite.rect.y - bullet_sprite.rect.y))
+
+
+def measure(function, *args) -> tuple[float, float]:
+    """Returns the average mask tests and milliseconds per frame."""
+    CountingMask.tests = 0
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        function(*args)
+    elapsed = time.perf_counter() - start
+    return CountingMask.tests / FRAMES, elapsed * 1000 / FRAMES
+
+
+def main():
+    random.seed(0)
+    world = BenchWorld()
+    bullet_masks = create_sprites(BULLET_COUNT, (24, 24))
+    print(f"{BULLET_COUNT} bullets, cell size {settings.TILE_WIDTH}x{settings.TILE_HEIGHT}")
+    print(f"{'monsters':>9} | {'all-pairs tests':>15} | {'ms':>7} | {'broadphase tests':>16} | {'ms':>7}")
+    for count in MONSTER_COUNTS:
+        monster_masks = create_sprites(count, settings.TILE_DIMENSION)
+        brute_tests, brute_ms = measure(brute_force, bullet_masks, monster_masks)
+        grid_tests, grid_ms = measure(CollisionHandler.handle_bullet_monster_collisions, world, bullet_masks, monster_masks)
+        print(f"{count:>9} | {brute_tests:>15.0f} | {brute_ms:>7.2f} | {grid_tests:>16.0f} | {grid_ms:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Reports the memory taken by collision masks with one mask per sprite and with shared masks.
+
+Builds a crowd of slimes, gems and bullets the way the game does and compares the bytes
+the masks would take if every sprite built its own, as `Sprite.__init__` used to, with
+the bytes of the distinct masks the asset cache hands out.
+
+Usage:
+    python -m benchmarks.mask_memory
+"""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from presentation.asset_cache import AssetCache
+from presentation.sprite import ExperienceGemSprite, ImageSprite, MonsterSprite
+
+ENTITY_COUNTS = [1000, 5000, 20000]
+MONSTERS = [
+    "black_slime", "black_tiny_slime", "blue_slime", "blue_tiny_slime", "green_slime", "green_tiny_slime",
+    "purple_slime", "purple_tiny_slime", "red_slime", "red_tiny_slime", "yellow_slime", "yellow_tiny_slime"
+]
+BULLETS = [
+    ("./assets/bullets/greenbullet.png", True), ("./assets/bullets/redbullet.png", True),
+    ("./assets/bullets/bigbullet.png", True), ("./assets/bullets/bible.png", False),
+    ("./assets/bullets/trail.png", False)
+]
+MASK_OVERHEAD = 48  # The Python object and the bitmask header
+WORD_BITS = 64
+
+
+def mask_bytes(mask: pygame.mask.Mask) -> int:
+    """Estimates the bytes a mask takes: its header plus rows of 64 bit words."""
+    width, height = mask.get_size()
+    return MASK_OVERHEAD + height * ((width - 1) // WORD_BITS + 1) * WORD_BITS // 8
+
+
+def build_crowd(count: int, rng: random.Random) -> list:
+    """Builds `count` sprites, half slimes, a quarter gems and a quarter bullets."""
+    sprites = []
+    for index in range(count):
+        kind = index % 4
+        if kind < 2:
+            sprite = MonsterSprite(0, 0, rng.choice(MONSTERS))
+            if rng.random() < 0.5:
+                sprite.flip(True)
+        elif kind == 2:
+            sprite = ExperienceGemSprite(0, 0, rng.randint(1, 9))
+        else:
+            path, rotates = rng.choice(BULLETS)
+            sprite = ImageSprite(0, 0, path)
+            sprite.scale_image(rng.choice([1, 1.2, 1.5]))
+            if rotates:
+                sprite.rotate(rng.uniform(-360, 0))
+        sprites.append(sprite)
+    return sprites
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    cache = AssetCache()
+    print(f"{'sprites':>8} | {'per sprite':>12} | {'shared':>10} | {'masks':>5} | {'saved':>12}")
+    for count in ENTITY_COUNTS:
+        cache.clear()
+        sprites = build_crowd(count, random.Random(0))
+        per_sprite = sum(mask_bytes(sprite.mask) for sprite in sprites)
+        distinct = {id(sprite.mask): sprite.mask for sprite in sprites}
+        shared = sum(mask_bytes(mask) for mask in distinct.values())
+        print(f"{count:>8} | {per_sprite:>12,} | {shared:>10,} | {len(distinct):>5} | {per_sprite - shared:>12,}")
+    print(f"masks built at {ENTITY_COUNTS[-1]} sprites: {cache.masks_built}, distinct after interning: {len(cache.get_interned_masks())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compares the cost of the monster update pass with and without level of detail tiers.
+
+Without tiers every monster gets the full update every tick, crowd separation included.
+With the tiers of the settings, monsters off screen move on the cheap path every few ticks.
+
+Usage:
+    python -m benchmarks.monster_lod
+"""
+
+import random
+import time
+
+import settings
+from business.entities.monster import Monster
+from business.weapons.stats import MonsterStats
+from business.world.crowd_separation import CrowdSeparation
+from business.world.monster_lod import MonsterLOD
+
+MONSTER_COUNTS = [2000, 5000]
+TICKS = 60
+FULL_DETAIL = [(None, 1)]
+
+
+class BenchPlayer:
+    """The player stands still in the middle of the world."""
+
+    pos_x = settings.WORLD_WIDTH / 2
+    pos_y = settings.WORLD_HEIGHT / 2
+
+
+class BenchWorld:
+    """The subset of the game world the monster update reads."""
+
+    def __init__(self):
+        self.player = BenchPlayer()
+        self.crowd_separation = CrowdSeparation()
+
+    def find_crowd_blocker(self, monster, rect):
+        return self.crowd_separation.find_blocker(monster, rect)
+
+
+def create_monsters(count: int) -> list[Monster]:
+    """Creates monsters scattered over an area four times the world, around it."""
+    random.seed(0)
+    stats = MonsterStats(speed=1.5, health=10, damage=1, attack_cooldown=1000, xp_drop=1)
+    return [
+        Monster.create(random.uniform(-settings.WORLD_WIDTH / 2, settings.WORLD_WIDTH * 1.5),
+                       random.uniform(-settings.WORLD_HEIGHT / 2, settings.WORLD_HEIGHT * 1.5), stats, "green_slime")
+        for _ in range(count)
+    ]
+
+
+def run(monsters: list[Monster], lod: MonsterLOD) -> tuple[float, float]:
+    """Runs the update pass of GameWorld and returns the milliseconds per tick and the full updates per tick."""
+    world = BenchWorld()
+    full_updates = 0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        full_detail, coarse = lod.split(monsters, world.player)
+        world.crowd_separation.rebuild(full_detail)
+        for monster in full_detail:
+            monster.update(world)
+        for monster, ticks in coarse:
+            monster.update_coarse(world, ticks)
+        full_updates += len(full_detail)
+    return (time.perf_counter() - start) * 1000 / TICKS, full_updates / TICKS
+
+
+def main():
+    print(f"{TICKS} ticks, tiers {settings.MONSTER_LOD_TIERS}, tick budget {1000 / settings.TICK_RATE:.2f} ms")
+    print(f"{'monsters':>9} | {'full ms/tick':>12} | {'lod ms/tick':>11} | {'full updates/tick':>17} | {'saving':>6}")
+    for count in MONSTER_COUNTS:
+        full_ms, _ = run(create_monsters(count), MonsterLOD(FULL_DETAIL))
+        lod_ms, full_updates = run(create_monsters(count), MonsterLOD())
+        print(f"{count:>9} | {full_ms:>12.2f} | {lod_ms:>11.2f} | {full_updates:>17.0f} | {1 - lod_ms / full_ms:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
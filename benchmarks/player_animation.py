@@ -0,0 +1,61 @@
+"""Compares the cost of swapping a player animation frame with and without the atlas.
+
+The old path loaded, scaled and flipped a PNG and rebuilt its mask on every swap. The
+atlas path only looks up a pre-built surface and mask.
+
+Usage:
+    python -m benchmarks.player_animation
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import settings
+from presentation.animation_atlas import AnimationAtlas
+from presentation.sprite import PlayerSprite
+
+SWAPS = 2000
+
+
+def load_frame(position: int, facing_right: bool) -> tuple[pygame.Surface, pygame.mask.Mask]:
+    """The frame swap before the atlas: disk read, decode, scale, flip and mask."""
+    image = pygame.image.load(PlayerSprite.ASSET_FOLDER + str(position) + ".png").convert_alpha()
+    scaled_dimensions = tuple(d * PlayerSprite.SCALE for d in settings.TILE_DIMENSION)
+    image = pygame.transform.scale(image, scaled_dimensions).convert_alpha()
+    image = pygame.transform.flip(image, facing_right, False)
+    return image, pygame.mask.from_surface(image)
+
+
+def measure(get_frame) -> float:
+    """Returns the average milliseconds per frame swap."""
+    positions = PlayerSprite.WALKING_POSITIONS
+    start = time.perf_counter()
+    for swap in range(SWAPS):
+        get_frame(positions[swap % 7], swap % 2 == 0)
+    return (time.perf_counter() - start) * 1000 / SWAPS
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    scaled_dimensions = tuple(d * PlayerSprite.SCALE for d in settings.TILE_DIMENSION)
+
+    start = time.perf_counter()
+    atlas = AnimationAtlas(PlayerSprite.ASSET_FOLDER, PlayerSprite.IDLE_POSITIONS + PlayerSprite.WALKING_POSITIONS, scaled_dimensions)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    load_ms = measure(load_frame)
+    atlas_ms = measure(atlas.get_frame)
+    frame_budget_ms = 1000 / settings.FPS
+    print(f"{SWAPS} swaps, frame budget {frame_budget_ms:.2f} ms, atlas built once in {build_ms:.2f} ms")
+    print(f"{'path':>10} | {'ms per swap':>11} | {'% of frame':>10}")
+    for name, swap_ms in (("png load", load_ms), ("atlas", atlas_ms)):
+        print(f"{name:>10} | {swap_ms:>11.4f} | {swap_ms / frame_budget_ms:>10.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Compares saving and loading entities in the columnar format with the JSON formats before it.
+
+Each section is measured three ways:
+
+    dao       one dict per entity with `indent=4`, as the per-DAO files were written
+    v1        the compact JSON of a version 1 save, written and synced as SaveSnapshot did,
+              and read back through SaveSnapshot, which turns the dicts into a table
+    columnar  through SaveSnapshot: the records are turned into a ColumnarTable, the save
+              file is written, then memory-mapped and decoded back to the values of every row
+
+The version 1 save is the baseline the columnar format replaced. Building the entities
+themselves costs the same either way, so it is left out.
+
+Usage:
+    python -m benchmarks.save_format
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+
+from persistance.bulletDAO import BulletDAO
+from persistance.columnar import ColumnarTable
+from persistance.monsterDAO import MonsterDAO
+from persistance.save_snapshot import SaveSnapshot
+from persistance.xpDAO import xpDAO
+
+ENTITIES = 10000
+REPEATS = 5
+MONSTERS = ["green_slime", "blue_slime", "red_slime", "purple_slime", "black_slime", "yellow_tiny_slime"]
+BULLETS = ["Normalbullet", "RandomBullet", "Bigbullet", "Rotatingbullet", "Trailbullet"]
+
+
+def make_sections(rng: random.Random) -> dict[str, tuple[list[dict], dict]]:
+    """Returns the records of each section, as `serialize` returns them, and its columns."""
+    monsters = [{
+        "pos_x": rng.uniform(-5000, 5000), "pos_y": rng.uniform(-5000, 5000), "health": rng.randint(1, 200),
+        "speed": rng.choice([1.0, 1.5, 2.0]), "damage": rng.randint(1, 20), "cooldown": 1000,
+        "xp_drop": rng.randint(1, 30), "name": rng.choice(MONSTERS)
+    } for _ in range(ENTITIES)]
+    gems = [{"pos_x": rng.uniform(-5000, 5000), "pos_y": rng.uniform(-5000, 5000), "amount": rng.randint(1, 100)} for _ in range(ENTITIES)]
+    bullets = [{
+        "pos_x": rng.uniform(-5000, 5000), "pos_y": rng.uniform(-5000, 5000), "damage": rng.randint(5, 50),
+        "velocity": rng.choice([5, 8, 10]), "area_of_effect": rng.choice([1, 1.2, 1.5]), "reload_time": 1000,
+        "pierce": rng.randint(1, 5), "duration": 3000, "bullet_type": rng.choice(BULLETS)
+    } for _ in range(ENTITIES)]
+    return {
+        "Monsters": (monsters, MonsterDAO.COLUMNS),
+        "Experience": (gems, xpDAO.COLUMNS),
+        "Bullets": (bullets, BulletDAO.COLUMNS)
+    }
+
+
+def best_of(action) -> float:
+    """Returns the fastest of a few runs of an action in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def measure_dao(folder: str, records: list[dict], columns: dict) -> tuple[float, float, int]:
+    path = os.path.join(folder, "section.json")
+
+    def save():
+        with open(path, 'w') as json_file:
+            json.dump({"records": records}, json_file, indent=4)
+
+    def load():
+        with open(path, 'r') as json_file:
+            rows = json.load(json_file)["records"]
+        for row in rows:
+            tuple(row.get(field, default) for field, default in columns.items())
+
+    return best_of(save), best_of(load), os.path.getsize(path)
+
+
+def measure_v1(folder: str, records: list[dict], columns: dict) -> tuple[float, float, int]:
+    path = os.path.join(folder, "section.v1.json")
+
+    def save():
+        encoded = json.dumps({"version": 1, "sections": {"section": records}}, separators=(',', ':'))
+        with open(path, 'w') as save_file:
+            save_file.write(encoded)
+            save_file.flush()
+            os.fsync(save_file.fileno())
+
+    def load():
+        for _ in SaveSnapshot(path).get_table("section", columns).rows(*columns):
+            pass
+
+    return best_of(save), best_of(load), os.path.getsize(path)
+
+
+def measure_columnar(folder: str, records: list[dict], columns: dict) -> tuple[float, float, int]:
+    path = os.path.join(folder, "section.dat")
+
+    def save():
+        SaveSnapshot(path).update({"section": ColumnarTable.from_records(records, columns)})
+
+    def load():
+        for _ in SaveSnapshot(path).get_table("section", columns).rows(*columns):
+            pass
+
+    return best_of(save), best_of(load), os.path.getsize(path)
+
+
+def main():
+    sections = make_sections(random.Random(0))
+    print(f"{ENTITIES} entities per section, best of {REPEATS} runs")
+    print(f"{'section':>10} | {'format':>8} | {'save ms':>8} | {'load ms':>8} | {'bytes':>10}")
+    measures = {"dao": measure_dao, "v1": measure_v1, "columnar": measure_columnar}
+    totals = {format_name: [0.0, 0.0, 0] for format_name in measures}
+    with tempfile.TemporaryDirectory() as folder:
+        for name, (records, columns) in sections.items():
+            for format_name, measure in measures.items():
+                save_ms, load_ms, size = measure(folder, records, columns)
+                totals[format_name] = [totals[format_name][0] + save_ms, totals[format_name][1] + load_ms, totals[format_name][2] + size]
+                print(f"{name:>10} | {format_name:>8} | {save_ms:>8.2f} | {load_ms:>8.2f} | {size:>10,}")
+    for format_name, (save_ms, load_ms, size) in totals.items():
+        print(f"{'total':>10} | {format_name:>8} | {save_ms:>8.2f} | {load_ms:>8.2f} | {size:>10,}")
+
+
+if __name__ == "__main__":
+    main()
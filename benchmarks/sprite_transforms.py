@@ -0,0 +1,71 @@
+"""Compares the cost of scaling and rotating projectile sprites with and without the transform cache.
+
+The old path scaled and rotated the image and rebuilt its mask for every bullet. The
+cached path builds each (scale, angle, flip) variant once and afterwards only looks it up.
+
+Usage:
+    python -m benchmarks.sprite_transforms
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import settings
+from presentation.asset_cache import AssetCache
+from presentation.sprite import ImageSprite
+
+BULLETS = 5000
+IMAGE = "./assets/bullets/greenbullet.png"
+AREA_OF_EFFECT = 1.5
+
+
+def transform_uncached(image: pygame.Surface, angle: float) -> tuple[pygame.Surface, pygame.mask.Mask]:
+    """The bullet setup before the cache: scale, rotate and mask per bullet."""
+    width, height = image.get_size()
+    image = pygame.transform.scale(image, (int(width * AREA_OF_EFFECT), int(height * AREA_OF_EFFECT)))
+    image = pygame.transform.rotate(image, angle)
+    return image, pygame.mask.from_surface(image)
+
+
+def measure_uncached(angles: list[float]) -> float:
+    """Returns the average milliseconds per bullet."""
+    image = AssetCache().get_image(IMAGE, settings.TILE_DIMENSION)
+    start = time.perf_counter()
+    for angle in angles:
+        transform_uncached(image, angle)
+    return (time.perf_counter() - start) * 1000 / len(angles)
+
+
+def measure_cached(angles: list[float]) -> float:
+    """Returns the average milliseconds per bullet, sprite creation included."""
+    start = time.perf_counter()
+    for angle in angles:
+        sprite = ImageSprite(0, 0, IMAGE)
+        sprite.scale_image(AREA_OF_EFFECT)
+        sprite.rotate(angle)
+    return (time.perf_counter() - start) * 1000 / len(angles)
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(0)
+    angles = [rng.uniform(-360, 0) for _ in range(BULLETS)]
+
+    uncached_ms = measure_uncached(angles)
+    cache = AssetCache()
+    misses = cache.misses
+    cached_ms = measure_cached(angles)
+    print(f"{BULLETS} bullets at random angles, {cache.misses - misses} variants built by the cache")
+    print(f"{'path':>10} | {'ms per bullet':>13} | {'ms for all':>10}")
+    for name, bullet_ms in (("uncached", uncached_ms), ("cached", cached_ms)):
+        print(f"{name:>10} | {bullet_ms:>13.4f} | {bullet_ms * BULLETS:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from business.entities.entity import Entity
 from business.entities.interfaces import IExperienceGem
+from business.world.object_pool import PoolRegistry
 from presentation.sprite import ExperienceGemSprite
 
 
@@ -13,6 +14,28 @@ class ExperienceGem(Entity, IExperienceGem):
         self._logger.debug("Created %s", self)
         self.__amount = amount
 
+    @staticmethod
+    def create(pos_x: float, pos_y: float, amount: int) -> "ExperienceGem":
+        """Returns a gem from the pool, as if it was just created.
+
+        Args:
+            pos_x (float): The x-coordinate of the gem.
+            pos_y (float): The y-coordinate of the gem.
+            amount (int): The experience the gem gives.
+        """
+        return PoolRegistry().acquire(
+            ExperienceGem,
+            lambda: ExperienceGem(pos_x, pos_y, amount),
+            lambda gem: gem.reset(pos_x, pos_y, amount)
+        )
+
+    def reset(self, pos_x: float, pos_y: float, amount: int):
+        """Reuses a released gem. See `create`."""
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self._sprite.reset(pos_x, pos_y, self.__determine_level(amount))
+        self.__amount = amount
+
     @property
     def amount(self) -> int:
         return self.__amount
@@ -37,6 +37,18 @@ class IDamageable(ABC):
         Args:
             amount (int): The damage an attack deals.
         """
+
+    @property
+    def incarnation(self) -> int:
+        """How many times the entity was reused from an object pool.
+
+        Attackers that remember who they hit keep it along with the entity, so they do not
+        mistake a reused entity for the one it was before.
+
+        Returns:
+            int: The incarnation of the entity, 0 for entities that are never reused.
+        """
+        return 0
     
 
 class ICanDealDamage(ABC):
@@ -145,6 +157,16 @@ class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage, ISerializable)
     def name(self) -> str:
         """Returns the name of the monster"""
 
+    @abstractmethod
+    def update_coarse(self, world, ticks: int):
+        """Moves the monster as a number of updates would, without animating it or keeping it
+        from overlapping other monsters. Used for monsters far off screen.
+
+        Args:
+            world (IGameWorld): The game world.
+            ticks (int): The number of ticks the update stands for.
+        """
+
 class IBullet(IUpdatable, ICanMove, ICanDealDamage, IDamageable, ISerializable):
     """Interface for bullet entities."""
 
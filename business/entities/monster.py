@@ -1,14 +1,16 @@
 """This module contains the Monster class, which represents a monster entity in the game."""
 
-from typing import List, Dict
+from math import hypot
+from typing import Dict
 
 from business.entities.entity import MovableEntity
-from business.entities.interfaces import IDamageable, IMonster, IPlayer, ICanDealDamage
+from business.entities.interfaces import IDamageable, IMonster
 from business.handlers.cooldown_handler import CooldownHandler
 from business.world.interfaces import IGameWorld
 from business.weapons.stats import MonsterStats
 from presentation.sprite import Sprite, MonsterSprite
 from business.entities.experience_gem import ExperienceGem
+from business.world.object_pool import PoolRegistry
 
 class Monster(MovableEntity, IMonster):
     """A monster entity in the game."""
@@ -31,13 +33,45 @@ class Monster(MovableEntity, IMonster):
         """
         super().__init__(src_x, src_y, monster_stats.speed, sprite)
         self.__sprite = sprite
+        self.__incarnation = 0
+        self.__setup(monster_stats, name)
+        self._logger.debug("Created %s", self)
+
+    def __setup(self, monster_stats: MonsterStats, name: str):
         self.__monster_stats = monster_stats
         self.__health: int = monster_stats.health
         self.__damage = monster_stats.damage
         self._speed = monster_stats.speed
         self.__attacked_enemies : Dict[IDamageable,CooldownHandler] = {}
         self.__name = name
-        self._logger.debug("Created %s", self)
+
+    @staticmethod
+    def create(pos_x: float, pos_y: float, monster_stats: MonsterStats, name: str) -> "Monster":
+        """Returns a monster from the pool, as if it was just created.
+
+        Args:
+            pos_x (float): Initial x-coordinate.
+            pos_y (float): Initial y-coordinate.
+            monster_stats (MonsterStats): The stats of the monster.
+            name (str): The name of the monster, which picks its image.
+        """
+        return PoolRegistry().acquire(
+            Monster,
+            lambda: Monster(pos_x, pos_y, MonsterSprite(pos_x, pos_y, name), monster_stats, name),
+            lambda monster: monster.reset(pos_x, pos_y, monster_stats, name)
+        )
+
+    def reset(self, pos_x: float, pos_y: float, monster_stats: MonsterStats, name: str):
+        """Reuses a released monster. See `create`."""
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self.__sprite.reset(pos_x, pos_y, name)
+        self.__incarnation += 1
+        self.__setup(monster_stats, name)
+
+    @property
+    def incarnation(self) -> int:
+        return self.__incarnation
 
     @property
     def damage_amount(self):
@@ -71,20 +105,14 @@ class Monster(MovableEntity, IMonster):
 
         return direction_x, direction_y
 
-    def __movement_collides_with_entities(
-        self, dx: float, dy: float, entities: List[IMonster], player : IPlayer
-    ) -> bool:
+    def __movement_collides_with_entities(self, dx: float, dy: float, world: IGameWorld) -> bool:
         new_position = self.sprite.rect.move(dx, dy).inflate(-10, -10)
-        priority = self._get_distance_to(player) - self.__monster_stats.speed 
-        for entity in entities:
-            entity : IMonster
-            other_priority = entity._get_distance_to(player)
-            if entity.sprite.rect.colliderect(new_position):
-                if priority < other_priority:
-                    return False
-                else:
-                    return True
-        return False
+        blocker = world.find_crowd_blocker(self, new_position)
+        if blocker is None:
+            return False
+        # The monster closer to the player moves first
+        priority = self._get_distance_to(world.player) - self.__monster_stats.speed
+        return priority >= blocker._get_distance_to(world.player)
 
     def update(self, world: IGameWorld):
         direction_x, direction_y = self.__get_direction_towards_the_player(world)
@@ -94,13 +122,20 @@ class Monster(MovableEntity, IMonster):
             self.__sprite.flip(False)
         elif direction_x == -1:
             self.__sprite.flip(True)
-        monsters = [m for m in world.monsters if m != self]
         dx, dy = direction_x * self.speed, direction_y * self.speed
-        if not self.__movement_collides_with_entities(dx, dy, monsters, world.player):
+        if not self.__movement_collides_with_entities(dx, dy, world):
             self.move(direction_x, direction_y)
 
         super().update(world)
 
+    def update_coarse(self, world: IGameWorld, ticks: int):
+        direction_x, direction_y = self.__get_direction_towards_the_player(world)
+        if (direction_x, direction_y) == (0, 0):
+            return
+        # The same straight step `ticks` full updates would take if nothing was in the way
+        step = self._speed * ticks / hypot(direction_x, direction_y)
+        self.update_position(self._pos_x + direction_x * step, self._pos_y + direction_y * step)
+
     def __str__(self):
         return f"Monster(hp={self.health}, pos={self.pos_x, self.pos_y})"
 
@@ -123,7 +158,7 @@ class Monster(MovableEntity, IMonster):
                 cooldown_handler.put_on_cooldown()
     
     def drop_loot(self, game_world):
-        exp_gem = ExperienceGem(self._pos_x, self._pos_y, amount=self.__monster_stats.xp_drop)
+        exp_gem = ExperienceGem.create(self._pos_x, self._pos_y, amount=self.__monster_stats.xp_drop)
         game_world.add_experience_gem(exp_gem)  
         self._logger.debug("Enemy died, dropping experience gem at %s", exp_gem)
     
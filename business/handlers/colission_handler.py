@@ -3,6 +3,7 @@ from typing import List
 from settings import WORLD_WIDTH, WORLD_HEIGHT
 from business.entities.interfaces import IBullet, IExperienceGem, IHasSprite, IMonster, IPlayer
 from business.world.interfaces import IGameWorld
+from business.world.spatial_hash import SpatialHash
 
 
 class CollisionHandler:
@@ -43,16 +44,22 @@ class CollisionHandler:
     def handle_bullet_monster_collisions(world: IGameWorld, bullet_masks: dict, monster_masks: dict):
         """Handles bullet-monster collisions using sprite masks.
 
+        The monsters are bucketed in a spatial hash first, so a bullet is only tested
+        against the monsters in its own and neighbouring cells.
+
         Args:
             world (IGameWorld): The game world.
             bullet_masks (dict): Dictionary of bullets' sprite masks.
             monster_masks (dict): Dictionary of monsters' sprite masks.
         """
+        monster_grid = SpatialHash()
+        monster_grid.rebuild((monster_sprite, monster_sprite.rect) for monster_sprite in monster_masks)
         for bullet_sprite, bullet_mask in bullet_masks.items():
-            for monster_sprite, monster_mask in monster_masks.items():
+            for monster_sprite in monster_grid.query(bullet_sprite.rect):
+                monster_mask = monster_masks[monster_sprite]
                 if bullet_mask.overlap(monster_mask, (monster_sprite.rect.x - bullet_sprite.rect.x, monster_sprite.rect.y - bullet_sprite.rect.y)):
-                    bullet = next((b for b in world.bullets if b.sprite == bullet_sprite), None)
-                    monster = next((m for m in world.monsters if m.sprite == monster_sprite), None)
+                    bullet = world.get_entity_by_sprite(bullet_sprite)
+                    monster = world.get_entity_by_sprite(monster_sprite)
                     if bullet and monster:
                         bullet.attack(monster)  # Monster takes damage from the bullet
 
@@ -65,9 +72,11 @@ class CollisionHandler:
             monster_masks (dict): Dictionary of monsters' sprite masks.
         """
         player_sprite = world.player.sprite
+        player_rect = player_sprite.rect
         for monster_sprite, monster_mask in monster_masks.items():
-            if monster_mask.overlap(player_sprite.mask, (player_sprite.rect.x - monster_sprite.rect.x, player_sprite.rect.y - monster_sprite.rect.y)):
-                monster = next((m for m in world.monsters if m.sprite == monster_sprite), None)
+            # Masks can only overlap where the rects do, and most monsters are nowhere near
+            if monster_sprite.rect.colliderect(player_rect) and monster_mask.overlap(player_sprite.mask, (player_sprite.rect.x - monster_sprite.rect.x, player_sprite.rect.y - monster_sprite.rect.y)):
+                monster = world.get_entity_by_sprite(monster_sprite)
                 if monster:
                     monster.attack(world.player)  # Monster attacks the player
 
@@ -82,7 +91,7 @@ class CollisionHandler:
         player_sprite = world.player.sprite
         for gem_sprite, gem_mask in gem_masks.items():
             if gem_mask.overlap(player_sprite.mask, (player_sprite.rect.x - gem_sprite.rect.x, player_sprite.rect.y - gem_sprite.rect.y)):
-                gem = next((g for g in world.experience_gems if g.sprite == gem_sprite), None)
+                gem = world.get_entity_by_sprite(gem_sprite)
                 if gem:
                     world.player.pickup_gem(gem)  # Player picks up the gem
                     world.remove_experience_gem(gem)  # Remove gem from the world
@@ -1,21 +1,54 @@
 """This module contains the CooldownHandler class."""
 
-import pygame
+from business.handlers.cooldown_scheduler import CooldownScheduler
 from business.world.ingameclock import InGameClock
 
 class CooldownHandler:
-    """A handler for cooldowns."""
+    """A handler for cooldowns.
+
+    Putting the handler on cooldown schedules it with the CooldownScheduler, which marks it
+    ready once the in-game clock passes the end of the cooldown. Asking whether it is ready
+    does not read the clock.
+    """
 
     def __init__(self, cooldown_time: int):
-        self.__last_action_time = InGameClock().time_elapsed
         self.__cooldown_time = cooldown_time
-        
+        self.__generation = 0  # Tells the scheduled callbacks of earlier cooldowns apart
+        self.__is_ready = False
+        self.put_on_cooldown()
+
+    @property
+    def cooldown_time(self) -> int:
+        """The length of the cooldown in milliseconds. Changing it applies from the next cooldown."""
+        return self.__cooldown_time
+
+    @cooldown_time.setter
+    def cooldown_time(self, cooldown_time: int):
+        self.__cooldown_time = cooldown_time
+
+    def __on_cooldown_over(self, generation: int):
+        if generation == self.__generation:
+            self.__is_ready = True
 
     def is_action_ready(self):
         """Check if the action is ready to be performed."""
-        current_time = InGameClock().time_elapsed
-        return current_time - self.__last_action_time >= self.__cooldown_time
+        return self.__is_ready
+
+    def reset(self, cooldown_time: int = None):
+        """Start counting from now again, as a new handler would.
+
+        Args:
+            cooldown_time (int): The new cooldown time, or None to keep the current one.
+        """
+        if cooldown_time is not None:
+            self.__cooldown_time = cooldown_time
+        self.put_on_cooldown()
 
     def put_on_cooldown(self):
         """Put the action on cooldown."""
-        self.__last_action_time = InGameClock().time_elapsed
\ No newline at end of file
+        self.__generation += 1
+        if self.__cooldown_time <= 0:
+            self.__is_ready = True
+            return
+        self.__is_ready = False
+        CooldownScheduler().schedule(InGameClock().time_elapsed, self.__cooldown_time, self.__on_cooldown_over, self.__generation)
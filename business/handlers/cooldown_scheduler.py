@@ -0,0 +1,52 @@
+"""This module contains the CooldownScheduler class."""
+
+import heapq
+from typing import Callable
+
+
+class CooldownScheduler:
+    """Singleton that calls back cooldowns when they run out.
+
+    The game world advances the scheduler once per tick, after advancing the in-game
+    clock, which pops the cooldowns that ran out from a heap ordered by the time they end. A cooldown waiting
+    for its turn is never looked at, and a cooldown nobody started is not in the heap.
+    """
+
+    _instance = None  # Private class attribute to hold the singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CooldownScheduler, cls).__new__(cls)
+            cls._instance.clear()
+        return cls._instance
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def clear(self):
+        """Forgets every scheduled callback."""
+        self.__heap: list[tuple[float, int, float, float, Callable[[int], None], int]] = []
+        self.__sequence = 0
+
+    def schedule(self, start: float, duration: float, callback: Callable[[int], None], token: int):
+        """Calls a callback once `duration` milliseconds have passed since `start`.
+
+        Args:
+            start (float): The in-game time the cooldown starts at, in milliseconds.
+            duration (float): The length of the cooldown in milliseconds.
+            callback (Callable[[int], None]): The function to call, given `token`.
+            token (int): A value for the callback to tell whether it is still interested.
+        """
+        self.__sequence += 1
+        heapq.heappush(self.__heap, (start + duration, self.__sequence, start, duration, callback, token))
+
+    def advance(self, now: float):
+        """Calls back the cooldowns that ran out by a time, in the order they ran out.
+
+        Args:
+            now (float): The in-game time in milliseconds.
+        """
+        heap = self.__heap
+        while heap and now - heap[0][2] >= heap[0][3]:
+            _, _, _, _, callback, token = heapq.heappop(heap)
+            callback(token)
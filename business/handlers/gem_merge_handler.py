@@ -0,0 +1,82 @@
+"""Module that contains the GemMergeHandler class."""
+
+from collections import defaultdict
+from typing import List
+
+import settings
+from business.entities.experience_gem import ExperienceGem
+from business.entities.interfaces import IExperienceGem
+from business.world.interfaces import IGameWorld
+from business.world.visible_area import VisibleArea
+
+
+class GemMergeHandler:
+    """Class that merges experience gems, so their number stays bounded however long the run is.
+
+    Merged gems are replaced by a single gem with the summed amount, whose level follows
+    from the amount as for any other gem.
+    """
+
+    @staticmethod
+    def __is_on_screen(gem: IExperienceGem, screen: tuple[float, float, float, float]) -> bool:
+        left, top, right, bottom = screen
+        return left <= gem.pos_x <= right and top <= gem.pos_y <= bottom
+
+    @staticmethod
+    def __merge(world: IGameWorld, gems: List[IExperienceGem], pos_x: float, pos_y: float):
+        for gem in gems:
+            world.remove_experience_gem(gem)
+        world.add_experience_gem(ExperienceGem.create(pos_x, pos_y, sum(gem.amount for gem in gems)))
+
+    @staticmethod
+    def merge_gems(world: IGameWorld, radius: int = settings.GEM_MERGE_RADIUS, max_gems: int = settings.MAX_EXPERIENCE_GEMS):
+        """Merges the gems that are close to each other and then the ones beyond the cap.
+
+        Args:
+            world (IGameWorld): The game world.
+            radius (int): The side of the squares close gems are grouped by.
+            max_gems (int): The number of gems the world keeps at most.
+        """
+        GemMergeHandler.merge_nearby_gems(world, radius)
+        GemMergeHandler.merge_excess_gems(world, max_gems)
+
+    @staticmethod
+    def merge_nearby_gems(world: IGameWorld, radius: int):
+        """Merges the off-screen gems that lie in the same square into one at their centre.
+
+        Gems on screen are left alone, so the player does not see them jump. The screen is
+        the area the camera shows, which is not centred on the player near the world edges.
+
+        Args:
+            world (IGameWorld): The game world.
+            radius (int): The side of the squares close gems are grouped by.
+        """
+        if not world.experience_gems:
+            return
+        cells: dict[tuple[int, int], List[IExperienceGem]] = defaultdict(list)
+        screen = VisibleArea.get_bounds(world.player.pos_x, world.player.pos_y)
+        for gem in world.experience_gems:
+            if not GemMergeHandler.__is_on_screen(gem, screen):
+                cells[(int(gem.pos_x // radius), int(gem.pos_y // radius))].append(gem)
+        for gems in cells.values():
+            if len(gems) > 1:
+                pos_x = sum(gem.pos_x for gem in gems) / len(gems)
+                pos_y = sum(gem.pos_y for gem in gems) / len(gems)
+                GemMergeHandler.__merge(world, gems, pos_x, pos_y)
+
+    @staticmethod
+    def merge_excess_gems(world: IGameWorld, max_gems: int):
+        """Merges the gems farthest from the player into one, so at most `max_gems` remain.
+
+        The merged gem is put where the closest of the merged gems was.
+
+        Args:
+            world (IGameWorld): The game world.
+            max_gems (int): The number of gems the world keeps at most.
+        """
+        if len(world.experience_gems) <= max_gems:
+            return
+        player = world.player
+        gems = sorted(world.experience_gems, key=lambda gem: (gem.pos_x - player.pos_x) ** 2 + (gem.pos_y - player.pos_y) ** 2)
+        excess = gems[max_gems - 1:]
+        GemMergeHandler.__merge(world, excess, excess[0].pos_x, excess[0].pos_y)
@@ -1,14 +1,14 @@
 import math
 import settings
-from typing import List
 from random import uniform, choice
-from business.entities.interfaces import IBullet, IMonster
+from business.entities.interfaces import IBullet
 from business.entities.entity import MovableEntity
 from business.world.interfaces import IGameWorld
 from business.weapons.stats import ProjectileStats
 from business.handlers.cooldown_handler import CooldownHandler
 from business.entities.interfaces import IDamageable
-from presentation.sprite import Sprite
+from business.world.object_pool import PoolRegistry
+from presentation.sprite import ImageSprite, Sprite
 
 class Bullet(MovableEntity, IBullet):
     """Base class for all bullet types."""
@@ -18,7 +18,35 @@ class Bullet(MovableEntity, IBullet):
         self._sprite = sprite
         self._stats = projectile_stats
         self._pierce = self._stats.pierce
-        self._attacked_enemies = []
+        self._attacked_enemies: dict[IDamageable, int] = {}  # The incarnation each enemy was hit in
+        self.bullet_type = bullet_type
+
+    @classmethod
+    def create(cls, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats, *args) -> "Bullet":
+        """Returns a bullet of the class from its pool, as if it was just created.
+
+        Args:
+            pos_x (float): The x-coordinate of the bullet.
+            pos_y (float): The y-coordinate of the bullet.
+            image_path (str): The path of the image of the bullet.
+            projectile_stats (ProjectileStats): The stats of the bullet.
+            *args: The arguments particular to the class.
+        """
+        return PoolRegistry().acquire(
+            cls,
+            lambda: cls(pos_x, pos_y, ImageSprite(pos_x, pos_y, image_path), projectile_stats, *args),
+            lambda bullet: bullet.reset(pos_x, pos_y, image_path, projectile_stats, *args)
+        )
+
+    def reset(self, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats, bullet_type: str):
+        """Reuses a released bullet. See `create`."""
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self._speed = projectile_stats.velocity
+        self._sprite.reset(pos_x, pos_y, image_path)
+        self._stats = projectile_stats
+        self._pierce = self._stats.pierce
+        self._attacked_enemies = {}
         self.bullet_type = bullet_type
 
 
@@ -34,9 +62,11 @@ class Bullet(MovableEntity, IBullet):
         pass
     
     def attack(self, damageable: IDamageable):
-        if damageable not in self._attacked_enemies:
+        # A pooled enemy that was reused since it was hit counts as a new one
+        incarnation = getattr(damageable, "incarnation", 0)
+        if self._attacked_enemies.get(damageable) != incarnation:
             damageable.take_damage(self._stats.damage)
-            self._attacked_enemies.append(damageable)
+            self._attacked_enemies[damageable] = incarnation
             self._pierce -= 1
     
     def serialize(self):
@@ -72,14 +102,22 @@ class NormalBullet(Bullet):
         if not type:
             type = self.TYPE
         super().__init__(pos_x, pos_y, sprite, projectile_stats, type)  
+        self.__setup()
+
+    def __setup(self):
         self.__direction = (0, 0)
         self._sprite.scale_image(self._stats.area_of_effect)
         self.__has_set_direction = False
 
-    def __set_direction(self, monsters: List[IMonster]):
-        if not monsters:
+    def reset(self, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats, type: str = None):
+        super().reset(pos_x, pos_y, image_path, projectile_stats, type or self.TYPE)
+        self.__setup()
+
+    def __set_direction(self, world: IGameWorld):
+        nearest_monsters = world.find_nearest_monsters(self._pos_x, self._pos_y)
+        if not nearest_monsters:
             raise ValueError("No hay monstruos para atacar")
-        nearest_monster = min(monsters, key=lambda monster: self._get_distance_to(monster))
+        nearest_monster = nearest_monsters[0]
         self.__direction = self._get_direction_to(nearest_monster.pos_x, nearest_monster.pos_y)
         direction_x, direction_y = self.__direction
         angle = math.degrees(math.atan2(direction_y, direction_x))
@@ -93,7 +131,7 @@ class NormalBullet(Bullet):
     def update(self, world: IGameWorld):
         if not self.__has_set_direction:
             try:
-                self.__set_direction(world.monsters)
+                self.__set_direction(world)
             except ValueError:
                 world.remove_bullet(self)
         self.move(self.__direction[0], self.__direction[1])
@@ -107,9 +145,16 @@ class RandomBullet(Bullet):
     TYPE = "RandomBullet"
     def __init__(self, pos_x: float, pos_y: float, sprite: Sprite, projectile_stats: ProjectileStats):
         super().__init__(pos_x, pos_y, sprite, projectile_stats, self.TYPE)  
+        self.__setup()
+
+    def __setup(self):
         self._sprite.scale_image(self._stats.area_of_effect)
         self.__direction = self.__get_random_direction()
 
+    def reset(self, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats):
+        super().reset(pos_x, pos_y, image_path, projectile_stats, self.TYPE)
+        self.__setup()
+
     def __get_random_direction(self):
         """Generate a random direction as a tuple (x, y)."""
         angle = uniform(0, 360)  # Random angle in degrees
@@ -139,13 +184,21 @@ class RotatingBullet(Bullet):
         self.__reset_attack_timer = CooldownHandler(self.BASE_ATTACK_RESET)
         self.__time_out_handler = CooldownHandler(projectile_stats.duration)
 
+    def reset(self, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats):
+        super().reset(pos_x, pos_y, image_path, projectile_stats, self.TYPE)
+        self._sprite.scale_image(self._stats.area_of_effect)
+        self._sprite.rotate(90)
+        self.__angle = 0
+        self.__reset_attack_timer.reset()
+        self.__time_out_handler.reset(projectile_stats.duration)
+
     def update(self, world: IGameWorld):
         if self.__time_out_handler.is_action_ready():
             world.remove_bullet(self)  
             return
         if self.__reset_attack_timer.is_action_ready():
             self.__reset_attack_timer.put_on_cooldown()
-            self._attacked_enemies = []
+            self._attacked_enemies = {}
         self.__angle += 0.07 * self._stats.velocity 
         player_pos_x = world.player.pos_x
         player_pos_y = world.player.pos_y
@@ -168,23 +221,20 @@ class SantaWaterBullet(Bullet):
         self.__time_out_handler = CooldownHandler(self._stats.duration)
         self.__has_chose_enemy = False
 
-    def __is_monster_on_screen(self, monster: IMonster, player, screen_width: int, screen_height: int) -> bool:
-        """Check if the monster is within the screen bounds."""
-        # Get the player's position as the center of the screen
-        player_x, player_y = player.pos_x, player.pos_y
-
-        # Calculate screen boundaries based on the player's position
-        screen_left = player_x - (screen_width // 2)
-        screen_right = player_x + (screen_width // 2)
-        screen_top = player_y - (screen_height // 2)
-        screen_bottom = player_y + (screen_height // 2)
-
-        # Check if the monster's position is within the screen bounds
-        return screen_left <= monster.pos_x <= screen_right and screen_top <= monster.pos_y <= screen_bottom
+    def reset(self, pos_x: float, pos_y: float, image_path: str, projectile_stats: ProjectileStats):
+        super().reset(pos_x, pos_y, image_path, projectile_stats, self.TYPE)
+        self._sprite.scale_image(self._stats.area_of_effect)
+        self.__time_out_handler.reset(self._stats.duration)
+        self.__has_chose_enemy = False
 
-    def __choose_enemy(self, monsters: List[IMonster], player, screen_width: int, screen_height: int):
+    def __choose_enemy(self, world: IGameWorld, screen_width: int, screen_height: int):
         """Choose a random monster on screen."""
-        on_screen_monsters = [monster for monster in monsters if self.__is_monster_on_screen(monster, player, screen_width, screen_height)]
+        # The player is at the center of the screen
+        player_x, player_y = world.player.pos_x, world.player.pos_y
+        on_screen_monsters = world.find_monsters_in_area(
+            player_x - (screen_width // 2), player_y - (screen_height // 2),
+            player_x + (screen_width // 2), player_y + (screen_height // 2)
+        )
         if not on_screen_monsters:
             raise ValueError
         random_monster = choice(on_screen_monsters)
@@ -195,7 +245,7 @@ class SantaWaterBullet(Bullet):
         if not self.__has_chose_enemy:
             try:
                 if world.monsters:
-                    self.__choose_enemy(world.monsters, world.player, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+                    self.__choose_enemy(world, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
                 else:
                     world.remove_bullet(self)
             except ValueError:
@@ -16,3 +16,10 @@ class ItemNotFoundError(Exception):
     """Raised when an item is not found in the inventory."""
     def __init__(self, item):
         super().__init__(f"Item '{item}' not found in inventory.")
+
+
+class InvalidItemDataError(Exception):
+    """Raised when the item data file describes an item wrongly."""
+    def __init__(self, item_name, message="Invalid item data"):
+        self.item_name = item_name
+        super().__init__(f"{message} for item '{item_name}'")
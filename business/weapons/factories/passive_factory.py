@@ -1,25 +1,12 @@
-import json
 from typing import List
 from business.weapons.stats import PlayerStats
 from business.weapons.passive_item import PassiveItem
+from business.weapons.item_catalog import ItemCatalog
 class PassiveItemFactory:
     
-    JSON_FILE = "data/upgrades/item_data.json"
     @staticmethod
     def get_all_passive_items() -> List[PassiveItem]:
-        passive_items = []
-        
-        # Load the JSON data
-        with open(PassiveItemFactory.JSON_FILE, 'r') as file:
-            items_data = json.load(file)
-        
-        # Iterate through the passive items in the JSON and create PassiveItem instances
-        for item_name, item_data in items_data.items():
-            if item_data["type"] == "passive":
-                passive_item = PassiveItem(item_name)
-                passive_items.append(passive_item)
-        
-        return passive_items
+        return [PassiveItem(item_name) for item_name in ItemCatalog().get_names("passive")]
 
     @staticmethod
     def get_passive_by_name(name, level):
@@ -2,6 +2,7 @@ from business.weapons.weapon import Weapon
 from business.weapons.interfaces import IWeapon
 from business.weapons.stats import ProjectileStats
 from business.weapons.attack_builder import GreenBulletFactory,RedBulletFactory, BigBulletFactory, CircularProjectileAttackFactory, TrailBulletFactory
+from business.weapons.item_catalog import ItemCatalog
 class WeaponFactory:
     
     @staticmethod
@@ -26,6 +27,8 @@ class WeaponFactory:
 
     @staticmethod
     def get_weapon_by_name(name,level):
+        if ItemCatalog().get_item(name).get("type") != "weapon":
+            raise ValueError(f"Unknown weapon: {name}")
         weapon = None
         if name == "Green Wand":
             weapon = WeaponFactory.get_green_wand()
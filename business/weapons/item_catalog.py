@@ -0,0 +1,110 @@
+"""This module contains the ItemCatalog class."""
+
+import json
+from types import MappingProxyType
+from typing import Mapping
+
+from business.weapons.exception import InvalidItemDataError
+
+
+class ItemCatalog:
+    """Singleton holding the upgrade data of every weapon and passive item.
+
+    The data file is parsed and validated once, the first time an item is looked up, and
+    the items are kept read-only so the upgrades of every inventory can share them. An
+    item is a mapping with the keys of its entry in the file: `type`, `max_level`,
+    `unlock_info`, and `levels` for weapons or `affects` and `increase` for passive items.
+    """
+
+    DEFAULT_PATH = "data/upgrades/item_data.json"
+    ITEM_TYPES = ("weapon", "passive")
+    __EMPTY_ITEM: Mapping = MappingProxyType({})
+
+    _instance = None  # Private class attribute to hold the singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ItemCatalog, cls).__new__(cls)
+            cls._instance.clear()
+        return cls._instance
+
+    def clear(self):
+        """Forgets the items, so the next lookup reads the data file again."""
+        self.__items: Mapping[str, Mapping] = None
+
+    def load(self, path: str = DEFAULT_PATH):
+        """Reads the items from a data file, replacing the ones already read.
+
+        Args:
+            path (str): The path of the data file.
+
+        Raises:
+            InvalidItemDataError: If an item in the file is not valid.
+        """
+        with open(path, 'r') as json_file:
+            data = json.load(json_file)
+        items = {}
+        for name, item in data.items():
+            self.__validate(name, item)
+            items[name] = self.__freeze(item)
+        self.__items = MappingProxyType(items)
+
+    @staticmethod
+    def __is_number(value) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    @staticmethod
+    def __validate(name: str, item: dict):
+        if not isinstance(item, dict):
+            raise InvalidItemDataError(name, "The item is not an object")
+        if item.get("type") not in ItemCatalog.ITEM_TYPES:
+            raise InvalidItemDataError(name, f"The type must be one of {ItemCatalog.ITEM_TYPES}")
+        max_level = item.get("max_level")
+        if not isinstance(max_level, int) or isinstance(max_level, bool) or max_level < 0:
+            raise InvalidItemDataError(name, "The max level must be a non negative integer")
+        if not isinstance(item.get("unlock_info", ""), str):
+            raise InvalidItemDataError(name, "The unlock info must be a string")
+        if item["type"] == "weapon":
+            levels = item.get("levels", [])
+            if not isinstance(levels, list) or not all(
+                isinstance(level, dict) and level and all(ItemCatalog.__is_number(delta) for delta in level.values())
+                for level in levels
+            ):
+                raise InvalidItemDataError(name, "The levels must be objects of stat increases")
+        elif not isinstance(item.get("affects"), str) or not ItemCatalog.__is_number(item.get("increase")):
+            raise InvalidItemDataError(name, "A passive item needs the stat it affects and its increase")
+
+    @staticmethod
+    def __freeze(value):
+        if isinstance(value, dict):
+            return MappingProxyType({key: ItemCatalog.__freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(ItemCatalog.__freeze(item) for item in value)
+        return value
+
+    def __get_items(self) -> Mapping[str, Mapping]:
+        if self.__items is None:
+            self.load()
+        return self.__items
+
+    def get_item(self, name: str) -> Mapping:
+        """Returns the data of an item.
+
+        Args:
+            name (str): The name of the item.
+
+        Returns:
+            Mapping: The read-only data of the item, empty if the catalog does not have it.
+        """
+        return self.__get_items().get(name, self.__EMPTY_ITEM)
+
+    def get_names(self, item_type: str) -> tuple[str, ...]:
+        """Returns the names of the items of a type, in the order of the data file.
+
+        Args:
+            item_type (str): "weapon" or "passive".
+
+        Returns:
+            tuple[str, ...]: The names.
+        """
+        return tuple(name for name, item in self.__get_items().items() if item["type"] == item_type)
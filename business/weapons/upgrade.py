@@ -1,20 +1,13 @@
 from business.weapons.stats import ProjectileStats, ProjectileStatsMultiplier, PlayerStats
 from business.weapons.exception import InvalidLevelUp
-import json
+from business.weapons.item_catalog import ItemCatalog
 
 class Upgrade:
-    DEFAULT_UPGRADE_PATH = "data/upgrades/item_data.json"
-    def __init__(self, weapon_name: str, json_file: str = "data/upgrades/item_data.json"):
+    def __init__(self, weapon_name: str):
         self.weapon_name = weapon_name
-        self.upgrades = self.__load_upgrades(json_file)
+        self.upgrades = ItemCatalog().get_item(weapon_name)  # Shared and read-only
         self.type = self.upgrades.get("type")
 
-    def __load_upgrades(self, json_file: str) -> dict:
-        """Load upgrades from a JSON file."""
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-        return data.get(self.weapon_name, {})
-
     def apply_upgrade(self, level: int, stats: ProjectileStats| PlayerStats) -> ProjectileStats | PlayerStats:
         """Apply the upgrade based on the weapon level."""
         if self.max_level < level:
@@ -16,7 +16,7 @@ class Weapon(IWeapon):
 
     def __shoot(self, world: IGameWorld):
         new_stats = self.__stats * world.player.stats.projectile_stats
-        self.__cooldown_handler = CooldownHandler(new_stats.reload_time)
+        self.__cooldown_handler.cooldown_time = new_stats.reload_time  # Applies when update puts it on cooldown
         bullet = self.__atack_shape.create_atack_shape(world.player.pos_x, world.player.pos_y, new_stats)
         world.add_bullet(bullet)
 
@@ -0,0 +1,41 @@
+"""This module contains the CrowdSeparation class."""
+
+from business.entities.interfaces import IMonster
+from business.world.spatial_hash import SpatialHash
+
+
+class CrowdSeparation:
+    """Keeps slimes from walking through each other while they chase the player.
+
+    The monsters are bucketed once per tick, so the check a monster makes before moving
+    only looks at the monsters around it instead of every monster in the world.
+    """
+
+    def __init__(self):
+        self.__grid = SpatialHash()
+
+    def rebuild(self, monsters: list[IMonster]):
+        """Buckets the monsters by their current position.
+
+        Monsters move a few pixels per tick at most, so the neighbouring cells returned by
+        the grid still contain every monster that can touch a queried rect later in the tick.
+
+        Args:
+            monsters (list[IMonster]): The monsters in the world, in update order.
+        """
+        self.__grid.rebuild((monster, monster.sprite.rect) for monster in monsters)
+
+    def find_blocker(self, monster: IMonster, rect) -> IMonster | None:
+        """Finds the first monster, in update order, that overlaps a rect.
+
+        Args:
+            monster (IMonster): The monster that wants to move, which is never returned.
+            rect (pygame.Rect): The area the monster wants to move into.
+
+        Returns:
+            IMonster | None: The overlapping monster, or None if the area is free.
+        """
+        for other in self.__grid.query(rect):
+            if other is not monster and other.sprite.rect.colliderect(rect):
+                return other
+        return None
@@ -0,0 +1,185 @@
+"""This module contains the EntityStore class, the handles it gives out and its views."""
+
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class EntityHandle:
+    """A stable reference to an entity in an EntityStore.
+
+    Slots are reused once their entity is removed, so a handle also keeps the generation
+    of the slot it was given for. Resolving a handle whose entity was removed returns None
+    instead of whatever entity lives in the slot now.
+    """
+
+    __slots__ = ("store", "slot", "generation")
+
+    def __init__(self, store: "EntityStore", slot: int, generation: int):
+        self.store = store
+        self.slot = slot
+        self.generation = generation
+
+    @property
+    def entity(self):
+        """The entity the handle points to, or None if it was removed."""
+        return self.store.get(self)
+
+    def __eq__(self, other):
+        return isinstance(other, EntityHandle) and (self.store, self.slot, self.generation) == (other.store, other.slot, other.generation)
+
+    def __hash__(self):
+        return hash((id(self.store), self.slot, self.generation))
+
+
+class EntityStore(Generic[T]):
+    """Keeps entities packed in a list and removes them in constant time.
+
+    Removing an entity only marks it: it is skipped by iteration and its handle stops
+    resolving right away, but the list is compacted in `commit_removals`, by moving the
+    last entity into the gap. Removing the same entity twice in a tick is harmless.
+    Iteration order is insertion order until entities are removed.
+
+    Iterating does not copy the entities. Adding or removing entities while iterating is
+    safe: an iteration stops at the entities that were there when it started, and removed
+    entities stay in place until the removals are committed, which must not happen while
+    something is iterating.
+    """
+
+    def __init__(self, entities: list[T] = None):
+        self.__entities: list[T] = []
+        self.__slot_of_index: list[int] = []  # The slot of each packed entity
+        self.__index_of_slot: list[int] = []  # The packed position of each slot, -1 if free
+        self.__generations: list[int] = []
+        self.__free_slots: list[int] = []
+        self.__slot_of_entity: dict[T, int] = {}
+        self.__pending: set[int] = set()  # Slots removed during this tick
+        for entity in entities or []:
+            self.add(entity)
+
+    def __len__(self):
+        return len(self.__entities) - len(self.__pending)
+
+    def __iter__(self) -> Iterator[T]:
+        # Removals can happen during the iteration, so every entity is checked when reached
+        entities, slot_of_index, pending = self.__entities, self.__slot_of_index, self.__pending
+        for index in range(len(entities)):
+            if slot_of_index[index] not in pending:
+                yield entities[index]
+
+    def __contains__(self, entity: T) -> bool:
+        slot = self.__slot_of_entity.get(entity)
+        return slot is not None and slot not in self.__pending
+
+    def add(self, entity: T) -> EntityHandle:
+        """Adds an entity to the store.
+
+        Args:
+            entity (T): The entity to add.
+
+        Returns:
+            EntityHandle: The handle of the entity.
+        """
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+        else:
+            slot = len(self.__generations)
+            self.__generations.append(0)
+            self.__index_of_slot.append(-1)
+        self.__index_of_slot[slot] = len(self.__entities)
+        self.__entities.append(entity)
+        self.__slot_of_index.append(slot)
+        self.__slot_of_entity[entity] = slot
+        return EntityHandle(self, slot, self.__generations[slot])
+
+    def get_handle(self, entity: T) -> EntityHandle | None:
+        """Returns the handle of an entity, or None if it is not in the store."""
+        if entity not in self:
+            return None
+        slot = self.__slot_of_entity[entity]
+        return EntityHandle(self, slot, self.__generations[slot])
+
+    def get(self, handle: EntityHandle) -> T | None:
+        """Resolves a handle.
+
+        Args:
+            handle (EntityHandle): The handle to resolve.
+
+        Returns:
+            T | None: The entity, or None if it was removed.
+        """
+        slot = handle.slot
+        if handle.store is not self or self.__generations[slot] != handle.generation or slot in self.__pending:
+            return None
+        index = self.__index_of_slot[slot]
+        return self.__entities[index] if index >= 0 else None
+
+    def remove(self, entity: T) -> bool:
+        """Marks an entity for removal at the end of the tick.
+
+        Args:
+            entity (T): The entity to remove.
+
+        Returns:
+            bool: True if the entity was alive, False if it was already removed or never added.
+        """
+        slot = self.__slot_of_entity.get(entity)
+        if slot is None or slot in self.__pending:
+            return False
+        self.__pending.add(slot)
+        return True
+
+    def commit_removals(self) -> list[T]:
+        """Takes the entities marked for removal out of the store.
+
+        Returns:
+            list[T]: The removed entities.
+        """
+        removed = []
+        for slot in self.__pending:
+            index = self.__index_of_slot[slot]
+            entity = self.__entities[index]
+            last = len(self.__entities) - 1
+            if index != last:
+                moved_slot = self.__slot_of_index[last]
+                self.__entities[index] = self.__entities[last]
+                self.__slot_of_index[index] = moved_slot
+                self.__index_of_slot[moved_slot] = index
+            self.__entities.pop()
+            self.__slot_of_index.pop()
+            self.__index_of_slot[slot] = -1
+            self.__generations[slot] += 1
+            self.__free_slots.append(slot)
+            if self.__slot_of_entity.get(entity) == slot:  # It may have been added again since
+                del self.__slot_of_entity[entity]
+            removed.append(entity)
+        self.__pending.clear()
+        return removed
+
+
+class EntityView(Generic[T]):
+    """A read-only view of the entities in an EntityStore.
+
+    The view follows the store, so it can be kept instead of asked for again, and it
+    never copies the entities. Use `list(view)` to keep a snapshot.
+    """
+
+    __slots__ = ("__store",)
+
+    def __init__(self, store: EntityStore[T]):
+        self.__store = store
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__store)
+
+    def __len__(self):
+        return len(self.__store)
+
+    def __bool__(self):
+        return len(self.__store) > 0
+
+    def __contains__(self, entity: T) -> bool:
+        return entity in self.__store
+
+    def __repr__(self):
+        return f"EntityView({list(self.__store)!r})"
@@ -1,23 +1,38 @@
 """This module contains the implementation of the game world."""
 
-from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
+from contextlib import nullcontext
+
+from business.handlers.cooldown_scheduler import CooldownScheduler
+from business.handlers.gem_merge_handler import GemMergeHandler
+from business.entities.interfaces import IBullet, IExperienceGem, IHasSprite, IMonster, IPlayer
 from business.world.interfaces import IGameWorld, IMonsterSpawner, ITileMap
+from business.world.crowd_separation import CrowdSeparation
+from business.world.entity_store import EntityHandle, EntityStore, EntityView
 from business.world.ingameclock import InGameClock
+from business.world.monster_locator import MonsterLocator
+from business.world.monster_lod import MonsterLOD
+from business.world.monster_store import MonsterStore
+from business.world.object_pool import PoolRegistry
 from persistance.monsterDAO import MonsterDAO
 from persistance.xpDAO import xpDAO
 from persistance.playerDAO import PlayerDAO
 from persistance.inventoryDAO import InventoryDao
 from persistance.clockDAO import ClockDAO
 from persistance.bulletDAO import BulletDAO
-from settings import FPS
+from persistance.save_snapshot import SaveSnapshot
+from presentation.sprite import Sprite
+from settings import AUTOSAVE_INTERVAL, GEM_MERGE_INTERVAL, TICK_RATE
+
 class GameWorld(IGameWorld):
     """Represents the game world."""
 
-    def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer, xp_dao : xpDAO, enemy_dao : MonsterDAO, inventory_dao : InventoryDao, player_dao : PlayerDAO, clock_dao : ClockDAO, bullet_dao : BulletDAO):
+    GEM_MERGE_TICKS = max(1, GEM_MERGE_INTERVAL * TICK_RATE // 1000)
+    AUTOSAVE_TICKS = AUTOSAVE_INTERVAL * TICK_RATE // 1000
+
+    def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer, xp_dao : xpDAO, enemy_dao : MonsterDAO, inventory_dao : InventoryDao, player_dao : PlayerDAO, clock_dao : ClockDAO, bullet_dao : BulletDAO, monster_store: MonsterStore = None, save_snapshot: SaveSnapshot = None):
         self.__player: IPlayer = player
-        self.__monsters: list[IMonster] = enemy_dao.load_monsters()
-        self.__bullets: list[IBullet] = bullet_dao.load_bullets()
-        self.__experience_gems: list[IExperienceGem] = xp_dao.load_xp()
+        self.__monster_store = monster_store
+        self.__create_stores(self.__store_monsters(enemy_dao.load_monsters()), bullet_dao.load_bullets(), xp_dao.load_xp())
 
         self.__clock = InGameClock()
         self.__clock.update(clock_dao.load_time() // 1000)
@@ -28,15 +43,70 @@ class GameWorld(IGameWorld):
         self.__player_dao = player_dao
         self.__clock_dao = clock_dao
         self.__bullet_dao = bullet_dao
+        self.__save_snapshot = save_snapshot
         self.__monster_spawner: IMonsterSpawner = spawner
+        self.__entities_by_sprite: dict[Sprite, EntityHandle] = {}
+        self.__register_all()
+        self.__crowd_separation = CrowdSeparation()
+        self.__monster_lod = MonsterLOD()
+        self.__ticks_until_gem_merge = self.GEM_MERGE_TICKS
+        self.__ticks_until_autosave = self.AUTOSAVE_TICKS
+
+    def __store_monsters(self, monsters: list[IMonster]) -> list[IMonster]:
+        if self.__monster_store is None:
+            return monsters
+        self.__monster_store.clear()
+        return [self.__monster_store.add(monster) for monster in monsters]
+
+    def __create_stores(self, monsters: list[IMonster], bullets: list[IBullet], experience_gems: list[IExperienceGem]):
+        self.__monsters: EntityStore[IMonster] = EntityStore(monsters)
+        self.__bullets: EntityStore[IBullet] = EntityStore(bullets)
+        self.__experience_gems: EntityStore[IExperienceGem] = EntityStore(experience_gems)
+        self.__monster_view = EntityView(self.__monsters)
+        self.__monster_locator = MonsterLocator(self.__monster_view)
+        self.__bullet_view = EntityView(self.__bullets)
+        self.__experience_gem_view = EntityView(self.__experience_gems)
+
+    def __register_all(self):
+        self.__entities_by_sprite = {}
+        for entities in (self.__monsters, self.__bullets, self.__experience_gems):
+            for entity in entities:
+                self.__entities_by_sprite[entity.sprite] = entities.get_handle(entity)
+
+    def __commit_removals(self):
+        # Removed entities are not referenced by the world anymore, so they can be reused
+        pools = PoolRegistry()
+        for monster in self.__monsters.commit_removals():
+            if self.__monster_store is not None:
+                self.__monster_store.remove(monster)
+            pools.release(monster)
+        for bullet in self.__bullets.commit_removals():
+            pools.release(bullet)
+        for experience_gem in self.__experience_gems.commit_removals():
+            pools.release(experience_gem)
 
     def update(self):
+        # Entities removed during the last tick are only taken out of the stores now
+        self.__commit_removals()
+
         # Update the clock only when the game is running
-        self.__clock.update(1 / FPS)
+        self.__clock.update(1 / TICK_RATE)
+        # Mark the cooldowns that ran out as ready before anything checks them
+        CooldownScheduler().advance(self.__clock.time_elapsed)
         self.__player.update(self)
 
-        for monster in self.__monsters:
-            monster.update(self)
+        if self.__monster_store is not None:
+            self.__monster_store.step(self.__player)
+        else:
+            full_detail, coarse = self.__monster_lod.split(self.__monsters, self.__player)
+            # Only monsters near the screen keep each other apart
+            self.__crowd_separation.rebuild(full_detail)
+            for monster in full_detail:
+                monster.update(self)
+            for monster, ticks in coarse:
+                monster.update_coarse(self, ticks)
+        # The bullets aim at where the monsters are now
+        self.__monster_locator.invalidate()
 
         for bullet in self.__bullets:
             bullet.update(self)
@@ -44,66 +114,130 @@ class GameWorld(IGameWorld):
         
         self.__monster_spawner.update(self)
 
+        self.__ticks_until_gem_merge -= 1
+        if self.__ticks_until_gem_merge <= 0:
+            self.__ticks_until_gem_merge = self.GEM_MERGE_TICKS
+            GemMergeHandler.merge_gems(self)
+
+        self.__ticks_until_autosave -= 1
+        if self.__ticks_until_autosave == 0:
+            self.__ticks_until_autosave = self.AUTOSAVE_TICKS
+            self.__autosave()
+
+    def snapshot_positions(self):
+        self.__player.sprite.snapshot_previous()
+        for entities in (self.__monsters, self.__bullets, self.__experience_gems):
+            for entity in entities:
+                entity.sprite.snapshot_previous()
+
+    def __autosave(self):
+        # Only worlds with a snapshot can write in the background, and a slow disk skips a save
+        if self.__save_snapshot is not None and not self.__save_snapshot.is_saving:
+            self.save_data(background=True)
+
     @property
     def time_elapsed(self):
         return self.__clock.time_elapsed
 
-    def add_monster(self, monster: IMonster):
-        self.__monsters.append(monster)
+    def __add(self, entities: EntityStore, entity: IHasSprite) -> EntityHandle:
+        handle = entities.add(entity)
+        self.__entities_by_sprite[entity.sprite] = handle
+        return handle
+
+    def __remove(self, entities: EntityStore, entity: IHasSprite):
+        if entities.remove(entity):
+            self.__entities_by_sprite.pop(entity.sprite, None)
+
+    def add_monster(self, monster: IMonster) -> EntityHandle:
+        if self.__monster_store is not None:
+            monster = self.__monster_store.add(monster)
+        self.__monster_locator.invalidate()
+        return self.__add(self.__monsters, monster)
 
     def remove_monster(self, monster: IMonster):
-        self.__monsters.remove(monster)
+        self.__monster_locator.invalidate()
+        self.__remove(self.__monsters, monster)
 
-    def add_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.append(gem)
+    def add_experience_gem(self, gem: IExperienceGem) -> EntityHandle:
+        return self.__add(self.__experience_gems, gem)
 
     def remove_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.remove(gem)
+        self.__remove(self.__experience_gems, gem)
 
-    def add_bullet(self, bullet: IBullet):
-        self.__bullets.append(bullet)
+    def add_bullet(self, bullet: IBullet) -> EntityHandle:
+        return self.__add(self.__bullets, bullet)
 
     def remove_bullet(self, bullet: IBullet):
-        self.__bullets.remove(bullet)
+        self.__remove(self.__bullets, bullet)
+
+    def get_entity_by_sprite(self, sprite: Sprite) -> IHasSprite | None:
+        handle = self.__entities_by_sprite.get(sprite)
+        return handle.entity if handle is not None else None
+
+    def find_nearest_monsters(self, pos_x: float, pos_y: float, count: int = 1) -> list[IMonster]:
+        return self.__monster_locator.find_nearest(pos_x, pos_y, count)
+
+    def find_monsters_within_radius(self, pos_x: float, pos_y: float, radius: float) -> list[IMonster]:
+        return self.__monster_locator.find_within_radius(pos_x, pos_y, radius)
+
+    def find_monsters_in_area(self, left: float, top: float, right: float, bottom: float) -> list[IMonster]:
+        return self.__monster_locator.find_in_area(left, top, right, bottom)
+
+    def find_crowd_blocker(self, monster: IMonster, rect) -> IMonster | None:
+        return self.__crowd_separation.find_blocker(monster, rect)
 
     @property
     def player(self) -> IPlayer:
         return self.__player
 
     @property
-    def monsters(self) -> list[IMonster]:
-        return self.__monsters[:]
+    def monsters(self) -> EntityView[IMonster]:
+        return self.__monster_view
 
     @property
-    def bullets(self) -> list[IBullet]:
-        return self.__bullets[:]
+    def bullets(self) -> EntityView[IBullet]:
+        return self.__bullet_view
 
     @property
-    def experience_gems(self) -> list[IExperienceGem]:
-        return self.__experience_gems[:]
+    def experience_gems(self) -> EntityView[IExperienceGem]:
+        return self.__experience_gem_view
     
-    def save_data(self):
-        self.__player_dao.save_player(self.__player)
-        self.__inventory_dao.save_inventory(self.__player.inventory)
-        self.__clock_dao.save_time()
-        self.__enemy_dao.save_monsters(self.__monsters)
-        self.__xp_dao.save_xp(self.__experience_gems)
-        self.__bullet_dao.save_bullets(self.__bullets)
+    def __batch(self, background: bool = False):
+        # The DAOs write sections of the snapshot, which is then written once for all of them
+        return self.__save_snapshot.batch(background) if self.__save_snapshot is not None else nullcontext()
+
+    @property
+    def save_timings(self) -> list:
+        return self.__save_snapshot.timings if self.__save_snapshot is not None else []
+
+    def wait_for_saves(self):
+        if self.__save_snapshot is not None:
+            self.__save_snapshot.wait()
+
+    def save_data(self, background: bool = False):
+        with self.__batch(background):
+            self.__player_dao.save_player(self.__player)
+            self.__inventory_dao.save_inventory(self.__player.inventory)
+            self.__clock_dao.save_time()
+            self.__enemy_dao.save_monsters(list(self.__monsters))
+            self.__xp_dao.save_xp(list(self.__experience_gems))
+            self.__bullet_dao.save_bullets(list(self.__bullets))
 
     def delete_data(self):
-        self.__player_dao.delete_all_data()
-        self.__inventory_dao.delete_all_data()
-        self.__clock_dao.delete_all_data()
-        self.__enemy_dao.delete_all_data()
-        self.__xp_dao.delete_all_data()
-        self.__bullet_dao.delete_all_data()
+        with self.__batch():
+            self.__player_dao.delete_all_data()
+            self.__inventory_dao.delete_all_data()
+            self.__clock_dao.delete_all_data()
+            self.__enemy_dao.delete_all_data()
+            self.__xp_dao.delete_all_data()
+            self.__bullet_dao.delete_all_data()
     
     def restart_game_world(self):
         self.__clock.reset()
         self.__monster_spawner.reset()
         self.delete_data()
         self.__player = self.__player_dao.load_player(self.__inventory_dao.load_inventory()) 
-        self.__monsters = self.__enemy_dao.load_monsters()  
-        self.__bullets = self.__bullet_dao.load_bullets() 
-        self.__experience_gems = self.__xp_dao.load_xp()
-        
\ No newline at end of file
+        self.__create_stores(self.__store_monsters(self.__enemy_dao.load_monsters()), self.__bullet_dao.load_bullets(), self.__xp_dao.load_xp())
+        self.__register_all()
+        self.__ticks_until_gem_merge = self.GEM_MERGE_TICKS
+        self.__ticks_until_autosave = self.AUTOSAVE_TICKS
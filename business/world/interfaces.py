@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 
-from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
+from business.entities.interfaces import IBullet, IExperienceGem, IHasSprite, IMonster, IPlayer
+from business.world.entity_store import EntityView
 
 
 class IGameWorld(ABC):
@@ -19,12 +20,18 @@ class IGameWorld(ABC):
 
         Args:
             monster (IMonster): The monster to add.
+
+        Returns:
+            EntityHandle: A handle that stops resolving once the monster is removed.
         """
 
     @abstractmethod
     def remove_monster(self, monster: IMonster):
         """Removes a monster from the world.
 
+        The monster disappears from the world right away, but it is only taken out of
+        storage when the next tick starts. Removing it twice does nothing.
+
         Args:
             monster (IMonster): The monster to remove.
         """
@@ -35,12 +42,18 @@ class IGameWorld(ABC):
 
         Args:
             gem (IExperienceGem): The experience gem to add.
+
+        Returns:
+            EntityHandle: A handle that stops resolving once the experience gem is removed.
         """
 
     @abstractmethod
     def remove_experience_gem(self, gem: IExperienceGem):
         """Removes an experience gem from the world.
 
+        The experience gem disappears from the world right away, but it is only taken out of
+        storage when the next tick starts. Removing it twice does nothing.
+
         Args:
             gem (IExperienceGem): The experience gem to remove.
         """
@@ -51,20 +64,97 @@ class IGameWorld(ABC):
 
         Args:
             bullet (IBullet): The bullet to add.
+
+        Returns:
+            EntityHandle: A handle that stops resolving once the bullet is removed.
         """
 
     @abstractmethod
     def remove_bullet(self, bullet: IBullet):
         """Removes a bullet from the world.
 
+        The bullet disappears from the world right away, but it is only taken out of
+        storage when the next tick starts. Removing it twice does nothing.
+
         Args:
             bullet (IBullet): The bullet to remove.
         """
 
+    @abstractmethod
+    def get_entity_by_sprite(self, sprite) -> IHasSprite | None:
+        """Gets the monster, bullet or experience gem that owns a sprite.
+
+        Args:
+            sprite (Sprite): The sprite to look up.
+
+        Returns:
+            IHasSprite | None: The entity, or None if no entity in the world owns the sprite.
+        """
+
+    @abstractmethod
+    def find_crowd_blocker(self, monster: IMonster, rect) -> IMonster | None:
+        """Finds the monster standing in the area another monster wants to move into.
+
+        Args:
+            monster (IMonster): The monster that wants to move.
+            rect (pygame.Rect): The area it wants to move into.
+
+        Returns:
+            IMonster | None: The first monster in the way, or None if the area is free.
+        """
+
+    @abstractmethod
+    def find_nearest_monsters(self, pos_x: float, pos_y: float, count: int = 1) -> list[IMonster]:
+        """Finds the monsters closest to a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            count (int): How many monsters to find.
+
+        Returns:
+            list[IMonster]: Up to `count` monsters, the closest first.
+        """
+
+    @abstractmethod
+    def find_monsters_within_radius(self, pos_x: float, pos_y: float, radius: float) -> list[IMonster]:
+        """Finds the monsters at most a distance away from a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            radius (float): The distance.
+
+        Returns:
+            list[IMonster]: The monsters in the circle.
+        """
+
+    @abstractmethod
+    def find_monsters_in_area(self, left: float, top: float, right: float, bottom: float) -> list[IMonster]:
+        """Finds the monsters whose position lies in an area, such as the one the camera sees.
+
+        Args:
+            left (float): The left edge of the area.
+            top (float): The top edge of the area.
+            right (float): The right edge of the area.
+            bottom (float): The bottom edge of the area.
+
+        Returns:
+            list[IMonster]: The monsters in the area, edges included.
+        """
+
     @abstractmethod
     def update(self):
         """Updates the state of the world and all updatable entities within it."""
 
+    @abstractmethod
+    def snapshot_positions(self):
+        """Remembers where the sprites of the player and the entities are.
+
+        Called at the start of each step, before the input and the update move anything,
+        so frames can be drawn between the positions before and after the step.
+        """
+
     @property
     @abstractmethod
     def player(self) -> IPlayer:
@@ -76,34 +166,54 @@ class IGameWorld(ABC):
 
     @property
     @abstractmethod
-    def monsters(self) -> list[IMonster]:
-        """Gets the list of monsters in the world.
+    def monsters(self) -> EntityView[IMonster]:
+        """Gets the monsters in the world.
 
         Returns:
-            list[IMonster]: A copy of the list of monsters in the world.
+            EntityView[IMonster]: A read-only view of the monsters in the world. It is not a copy,
+                but adding or removing monsters while iterating it is safe.
         """
 
     @property
     @abstractmethod
-    def bullets(self) -> list[IBullet]:
-        """Gets the list of bullets in the world.
+    def bullets(self) -> EntityView[IBullet]:
+        """Gets the bullets in the world.
 
         Returns:
-            list[IBullet]: A copy of the list of bullets in the world.
+            EntityView[IBullet]: A read-only view of the bullets in the world. It is not a copy,
+                but adding or removing bullets while iterating it is safe.
         """
 
     @property
     @abstractmethod
-    def experience_gems(self) -> list[IExperienceGem]:
-        """Gets the list of experience gems in the world.
+    def experience_gems(self) -> EntityView[IExperienceGem]:
+        """Gets the experience gems in the world.
 
         Returns:
-            list[IExperienceGem]: A copy of the list of experience gems in the world.
+            EntityView[IExperienceGem]: A read-only view of the experience gems in the world. It is not a copy,
+                but adding or removing experience gems while iterating it is safe.
         """
     
     @abstractmethod
-    def save_data(self):
-        """Saves the state of the gameworld"""
+    def save_data(self, background: bool = False):
+        """Saves the state of the gameworld
+
+        Args:
+            background (bool): If True, the state is only collected on the calling thread and
+                written to disk on another one.
+        """
+
+    @property
+    def save_timings(self) -> list:
+        """How long the saves of the gameworld took, the oldest first.
+
+        Returns:
+            list[SaveTimings]: The timings, empty if the world does not keep them.
+        """
+        return []
+
+    def wait_for_saves(self):
+        """Waits until the saves in progress are written to disk."""
 
     @abstractmethod
     def delete_data(self):
@@ -163,3 +273,22 @@ class ITileMap(ABC):
         Returns:
             int: The tile at the specified row and column.
         """
+
+    @abstractmethod
+    def set(self, row, col, tile_index: int):
+        """Sets the tile at the specified row and column.
+
+        Args:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            tile_index (int): The new tile.
+        """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """A number that changes every time a tile changes.
+
+        Returns:
+            int: The version of the tile map.
+        """
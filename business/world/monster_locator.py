@@ -0,0 +1,159 @@
+"""This module contains the MonsterLocator class."""
+
+from typing import Iterable
+
+import settings
+from business.entities.interfaces import IMonster
+
+
+class MonsterLocator:
+    """Answers the targeting queries of the weapons from a grid of monster positions.
+
+    The grid is built the first time it is queried after being invalidated, which the
+    world does once the monsters have moved, so every bullet of a tick shares it. Nearest
+    monster queries are also remembered until then, since the bullets of a volley are all
+    shot from the player's position.
+
+    Queries return monsters in the order the monsters were iterated when the grid was
+    built, and break distance ties the same way, so the results are those of a linear scan.
+    """
+
+    CELL_SIZE = 4 * settings.TILE_WIDTH
+
+    def __init__(self, monsters: Iterable[IMonster], cell_size: int = CELL_SIZE):
+        self.__monsters = monsters
+        self.__cell_size = cell_size
+        self.__cells: dict[tuple[int, int], list[tuple[int, IMonster, float, float]]] = {}
+        self.__bounds: tuple[int, int, int, int] = None  # First and last column and row with monsters
+        self.__nearest_cache: dict[tuple[float, float, int], list[IMonster]] = {}
+        self.__is_built = False
+
+    def invalidate(self):
+        """Forgets the grid, so the next query is answered from the current positions."""
+        self.__is_built = False
+
+    def __build(self):
+        size = self.__cell_size
+        cells = {}
+        for order, monster in enumerate(self.__monsters):
+            pos_x, pos_y = monster.pos_x, monster.pos_y
+            key = (int(pos_x // size), int(pos_y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [(order, monster, pos_x, pos_y)]
+            else:
+                cell.append((order, monster, pos_x, pos_y))
+        self.__cells = cells
+        if cells:
+            cols = [col for col, _ in cells]
+            rows = [row for _, row in cells]
+            self.__bounds = (min(cols), max(cols), min(rows), max(rows))
+        else:
+            self.__bounds = None
+        self.__nearest_cache.clear()
+        self.__is_built = True
+
+    def __get_cells(self) -> dict:
+        if not self.__is_built:
+            self.__build()
+        return self.__cells
+
+    def __collect(self, first_col: int, last_col: int, first_row: int, last_row: int, accept) -> list[IMonster]:
+        found = []
+        cells = self.__get_cells()
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                for entry in cells.get((col, row), ()):
+                    if accept(entry[2], entry[3]):
+                        found.append(entry)
+        found.sort(key=lambda entry: entry[0])
+        return [entry[1] for entry in found]
+
+    @staticmethod
+    def __ring(col: int, row: int, ring: int):
+        if ring == 0:
+            yield col, row
+            return
+        for offset in range(-ring, ring + 1):
+            yield col + offset, row - ring
+            yield col + offset, row + ring
+        for offset in range(-ring + 1, ring):
+            yield col - ring, row + offset
+            yield col + ring, row + offset
+
+    def find_nearest(self, pos_x: float, pos_y: float, count: int = 1) -> list[IMonster]:
+        """Finds the monsters closest to a point.
+
+        The grid is searched in rings of cells around the point, stopping once no monster
+        in the rings left can be closer than the ones found.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            count (int): How many monsters to find.
+
+        Returns:
+            list[IMonster]: Up to `count` monsters, the closest first.
+        """
+        cells = self.__get_cells()
+        key = (pos_x, pos_y, count)
+        cached = self.__nearest_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        best = []
+        if self.__bounds is not None:
+            size = self.__cell_size
+            col, row = int(pos_x // size), int(pos_y // size)
+            first_col, last_col, first_row, last_row = self.__bounds
+            last_ring = max(abs(col - first_col), abs(col - last_col), abs(row - first_row), abs(row - last_row))
+            for ring in range(last_ring + 1):
+                for cell in self.__ring(col, row, ring):
+                    for order, monster, monster_x, monster_y in cells.get(cell, ()):
+                        best.append(((monster_x - pos_x) ** 2 + (monster_y - pos_y) ** 2, order, monster))
+                if len(best) >= count:
+                    best.sort(key=lambda entry: (entry[0], entry[1]))
+                    del best[count:]
+                    # Monsters beyond this ring are at least `ring` cells away
+                    if best[-1][0] < (ring * size) ** 2:
+                        break
+            best.sort(key=lambda entry: (entry[0], entry[1]))
+        result = [monster for _, _, monster in best[:count]]
+        self.__nearest_cache[key] = result
+        return list(result)
+
+    def find_within_radius(self, pos_x: float, pos_y: float, radius: float) -> list[IMonster]:
+        """Finds the monsters at most a distance away from a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            radius (float): The distance.
+
+        Returns:
+            list[IMonster]: The monsters in the circle.
+        """
+        size = self.__cell_size
+        squared_radius = radius ** 2
+        return self.__collect(
+            int((pos_x - radius) // size), int((pos_x + radius) // size),
+            int((pos_y - radius) // size), int((pos_y + radius) // size),
+            lambda x, y: (x - pos_x) ** 2 + (y - pos_y) ** 2 <= squared_radius
+        )
+
+    def find_in_area(self, left: float, top: float, right: float, bottom: float) -> list[IMonster]:
+        """Finds the monsters whose position lies in an area, edges included.
+
+        Args:
+            left (float): The left edge of the area.
+            top (float): The top edge of the area.
+            right (float): The right edge of the area.
+            bottom (float): The bottom edge of the area.
+
+        Returns:
+            list[IMonster]: The monsters in the area.
+        """
+        size = self.__cell_size
+        return self.__collect(
+            int(left // size), int(right // size), int(top // size), int(bottom // size),
+            lambda x, y: left <= x <= right and top <= y <= bottom
+        )
@@ -0,0 +1,65 @@
+"""This module contains the MonsterLOD class."""
+
+import settings
+from business.entities.interfaces import IHasPosition, IMonster
+from business.world.visible_area import VisibleArea
+
+
+class MonsterLOD:
+    """Sorts monsters into level of detail tiers by how far off screen they are.
+
+    The screen is the area the camera shows while following the player, so near the edges
+    of the world it is not centred on the player.
+
+    Monsters in a tier updated every tick get the full update. The others are updated
+    every few ticks, for that many ticks at once, on the cheap path of the monster. The
+    monsters of a tier are spread over its ticks, so the cost of a tier is the same every tick.
+    """
+
+    def __init__(self, tiers: list[tuple[int | None, int]] = settings.MONSTER_LOD_TIERS):
+        self.__tiers = tiers
+        self.__tick = 0
+
+    def get_update_interval(self, monster: IHasPosition, player: IHasPosition) -> int:
+        """Returns how many ticks apart a monster is updated.
+
+        Args:
+            monster (IHasPosition): The monster.
+            player (IHasPosition): The player, whom the camera follows.
+
+        Returns:
+            int: The ticks between updates of the monster's tier.
+        """
+        return self.__get_interval(monster, VisibleArea.get_bounds(player.pos_x, player.pos_y))
+
+    def __get_interval(self, monster: IHasPosition, screen: tuple[float, float, float, float]) -> int:
+        left, top, right, bottom = screen
+        outside = max(left - monster.pos_x, monster.pos_x - right, top - monster.pos_y, monster.pos_y - bottom)
+        for limit, interval in self.__tiers:
+            if limit is None or outside <= limit:
+                return interval
+        return self.__tiers[-1][1]
+
+    def split(self, monsters: list[IMonster], player: IHasPosition) -> tuple[list[IMonster], list[tuple[IMonster, int]]]:
+        """Picks the monsters to update this tick.
+
+        Args:
+            monsters (list[IMonster]): The monsters in the world, in update order.
+            player (IHasPosition): The player.
+
+        Returns:
+            tuple[list[IMonster], list[tuple[IMonster, int]]]: The monsters to update fully, and
+                the monsters to update coarsely with the number of ticks their update stands for.
+        """
+        self.__tick += 1
+        full, coarse = [], []
+        if not monsters:
+            return full, coarse
+        screen = VisibleArea.get_bounds(player.pos_x, player.pos_y)
+        for index, monster in enumerate(monsters):
+            interval = self.__get_interval(monster, screen)
+            if interval <= 1:
+                full.append(monster)
+            elif (self.__tick + index) % interval == 0:
+                coarse.append((monster, interval))
+        return full, coarse
@@ -0,0 +1,256 @@
+"""This module contains the array-backed monster store and its monster views.
+
+The store needs NumPy, which is an optional dependency: when it is not installed
+`MonsterStore.is_available()` returns False and the game keeps using Monster objects.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+import settings
+from business.entities.experience_gem import ExperienceGem
+from business.entities.interfaces import IDamageable, IMonster, IPlayer
+from business.weapons.stats import MonsterStats
+from business.world.ingameclock import InGameClock
+from presentation.camera import Camera
+from presentation.sprite import Sprite
+
+
+class MonsterStore:
+    """Keeps the state of every monster in parallel NumPy arrays.
+
+    Chasing the player is done for all monsters at once in `step`, and only the sprites
+    the camera can see get their rect, facing and animation updated. The rest keep the
+    rect they had when they left the screen until they come back into view.
+    """
+
+    COLUMNS = ["pos_x", "pos_y", "speed", "health", "max_health", "damage", "cooldown", "xp_drop", "next_attack"]
+
+    @staticmethod
+    def is_available() -> bool:
+        """Returns True if NumPy is installed and the store can be used."""
+        return np is not None
+
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise ImportError("MonsterStore needs numpy to be installed")
+        self._columns: dict[str, "np.ndarray"] = {name: np.zeros(capacity) for name in self.COLUMNS}
+        self.__views: list["MonsterView"] = []
+        self.__camera = Camera()
+
+    def __len__(self):
+        return len(self.__views)
+
+    def __iter__(self):
+        return iter(self.__views)
+
+    def __grow(self):
+        capacity = len(self._columns["pos_x"]) * 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+
+    def add(self, monster: IMonster) -> "MonsterView":
+        """Copies a monster into the store.
+
+        Args:
+            monster (IMonster): The monster to copy. Its sprite is reused by the view.
+
+        Returns:
+            MonsterView: The view that stands in for the monster from now on.
+        """
+        row = len(self.__views)
+        if row == len(self._columns["pos_x"]):
+            self.__grow()
+        stats = monster.stats
+        values = {
+            "pos_x": monster.pos_x,
+            "pos_y": monster.pos_y,
+            "speed": stats.speed,
+            "health": monster.health,
+            "max_health": stats.health,
+            "damage": stats.damage,
+            "cooldown": stats.attack_cooldown,
+            "xp_drop": stats.xp_drop,
+            "next_attack": 0,
+        }
+        for name, value in values.items():
+            self._columns[name][row] = value
+        view = MonsterView(self, row, monster.sprite, monster.name)
+        self.__views.append(view)
+        return view
+
+    def remove(self, view: "MonsterView"):
+        """Removes a monster by moving the last row into its place.
+
+        Args:
+            view (MonsterView): The view of the monster to remove.
+        """
+        row = view.row
+        last = len(self.__views) - 1
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+            moved = self.__views[last]
+            moved.row = row
+            self.__views[row] = moved
+        self.__views.pop()
+        view.row = -1
+
+    def clear(self):
+        """Removes every monster from the store."""
+        for view in self.__views:
+            view.row = -1
+        self.__views = []
+
+    def step(self, player: IPlayer):
+        """Moves every monster one tick towards the player.
+
+        Args:
+            player (IPlayer): The player the monsters chase.
+        """
+        count = len(self.__views)
+        if count == 0:
+            return
+        pos_x = self._columns["pos_x"][:count]
+        pos_y = self._columns["pos_y"][:count]
+        speed = self._columns["speed"][:count]
+
+        # Same rules as Monster.update: a unit step per axis unless already within a pixel
+        distance_x = player.pos_x - pos_x
+        distance_y = player.pos_y - pos_y
+        direction_x = np.where(np.abs(distance_x) < 1, 0.0, np.sign(distance_x))
+        direction_y = np.where(np.abs(distance_y) < 1, 0.0, np.sign(distance_y))
+        magnitude = np.hypot(direction_x, direction_y)
+        step = np.divide(speed, magnitude, out=np.zeros(count), where=magnitude > 0)
+        pos_x += direction_x * step
+        pos_y += direction_y * step
+
+        self.__camera.update(player.sprite.rect)
+        visible = self.__camera.camera_rect
+        half_width, half_height = settings.TILE_WIDTH / 2, settings.TILE_HEIGHT / 2
+        on_screen = np.flatnonzero(
+            (pos_x >= visible.left - half_width) & (pos_x <= visible.right + half_width)
+            & (pos_y >= visible.top - half_height) & (pos_y <= visible.bottom + half_height)
+        )
+        for row in on_screen.tolist():
+            self.__views[row].sync_sprite(pos_x[row], pos_y[row], direction_x[row])
+
+
+class MonsterView(IMonster):
+    """A monster whose state lives in a row of a MonsterStore.
+
+    The view implements IMonster, so the handlers and DAOs that work with Monster
+    objects keep working with it. Its row changes when other monsters are removed.
+    """
+
+    def __init__(self, store: MonsterStore, row: int, sprite: Sprite, name: str):
+        self.__store = store
+        self.row = row
+        self.__sprite = sprite
+        self.__name = name
+
+    def __get(self, column: str) -> float:
+        return float(self.__store._columns[column][self.row])
+
+    def __set(self, column: str, value: float):
+        self.__store._columns[column][self.row] = value
+
+    def sync_sprite(self, pos_x: float, pos_y: float, direction_x: float):
+        """Copies the stored position into the sprite and updates its facing and animation."""
+        if direction_x > 0:
+            self.__sprite.flip(False)
+        elif direction_x < 0:
+            self.__sprite.flip(True)
+        self.__sprite.update_pos(pos_x, pos_y)
+        self.__sprite.update()
+
+    @property
+    def pos_x(self) -> float:
+        return self.__get("pos_x")
+
+    @property
+    def pos_y(self) -> float:
+        return self.__get("pos_y")
+
+    @property
+    def sprite(self) -> Sprite:
+        return self.__sprite
+
+    @property
+    def speed(self) -> float:
+        return self.__get("speed")
+
+    @property
+    def health(self) -> int:
+        return self.__get("health")
+
+    @property
+    def damage_amount(self) -> int:
+        return self.__get("damage")
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def stats(self) -> MonsterStats:
+        return MonsterStats(self.speed, self.__get("max_health"), self.damage_amount, self.__get("cooldown"), self.__get("xp_drop"))
+
+    def move(self, direction_x: float, direction_y: float):
+        magnitude = (direction_x ** 2 + direction_y ** 2) ** 0.5
+        if magnitude > 0:
+            direction_x /= magnitude
+            direction_y /= magnitude
+        self.update_position(self.pos_x + direction_x * self.speed, self.pos_y + direction_y * self.speed)
+
+    def update_position(self, new_x: float, new_y: float):
+        self.__set("pos_x", new_x)
+        self.__set("pos_y", new_y)
+        self.__sprite.update_pos(new_x, new_y)
+
+    def update(self, world):
+        """Movement is done for every monster at once by MonsterStore.step."""
+
+    def update_coarse(self, world, ticks: int):
+        """Movement is done for every monster at once by MonsterStore.step."""
+
+    def take_damage(self, amount: int):
+        self.__set("health", max(0, self.health - amount))
+        self.__sprite.take_damage()
+
+    def attack(self, damageable: IDamageable):
+        # Monsters only ever attack the player, so one cooldown per monster is enough
+        current_time = InGameClock().time_elapsed
+        if current_time >= self.__get("next_attack"):
+            damageable.take_damage(self.damage_amount)
+            self.__set("next_attack", current_time + self.__get("cooldown"))
+
+    def drop_loot(self, world):
+        world.add_experience_gem(ExperienceGem.create(self.pos_x, self.pos_y, amount=int(self.__get("xp_drop"))))
+
+    def _get_distance_to(self, an_entity) -> float:
+        return ((self.pos_x - an_entity.pos_x) ** 2 + (self.pos_y - an_entity.pos_y) ** 2) ** 0.5
+
+    def __str__(self):
+        return f"MonsterView(hp={self.health}, pos={self.pos_x, self.pos_y})"
+
+    def serialize(self):
+        stats = self.stats
+        return {
+            "pos_x": self.pos_x,
+            "pos_y": self.pos_y,
+            "health": self.health,
+            "speed": stats.speed,
+            "damage": stats.damage,
+            "cooldown": stats.attack_cooldown,
+            "xp_drop": stats.xp_drop,
+            "name": self.__name
+        }
+
+    def deserialize(data: dict):
+        from business.entities.monster import Monster
+        return Monster.deserialize(data)
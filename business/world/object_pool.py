@@ -0,0 +1,112 @@
+"""This module contains the object pools that recycle monsters, bullets and gems."""
+
+import weakref
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectPool(Generic[T]):
+    """Keeps released objects of one type to hand them out again instead of creating new ones.
+
+    Attributes:
+        created (int): The number of objects the pool had to create.
+        reused (int): The number of times a released object was handed out again.
+        high_water (int): The highest number of objects that were live at the same time.
+    """
+
+    def __init__(self):
+        self.__free: list[T] = []
+        self.__live: weakref.WeakSet = weakref.WeakSet()  # Objects dropped without being released are not kept alive
+        self.created = 0
+        self.reused = 0
+        self.high_water = 0
+
+    @property
+    def live(self) -> int:
+        """The number of objects handed out and not released yet."""
+        return len(self.__live)
+
+    @property
+    def free(self) -> int:
+        """The number of released objects waiting to be reused."""
+        return len(self.__free)
+
+    def acquire(self, create: Callable[[], T], reset: Callable[[T], None]) -> T:
+        """Returns a released object after resetting it, or a new one if there is none.
+
+        Args:
+            create (Callable[[], T]): Creates a new object.
+            reset (Callable[[T], None]): Puts a released object in the state `create` would have.
+
+        Returns:
+            T: The object.
+        """
+        if self.__free:
+            obj = self.__free.pop()
+            reset(obj)
+            self.reused += 1
+        else:
+            obj = create()
+            self.created += 1
+        self.__live.add(obj)
+        self.high_water = max(self.high_water, len(self.__live))
+        return obj
+
+    def release(self, obj: T):
+        """Gives an object back to the pool. It must not be used until it is acquired again.
+
+        Args:
+            obj (T): The object to release. Objects that were not created by the pool are adopted.
+        """
+        self.__live.discard(obj)
+        self.__free.append(obj)
+
+    def clear(self):
+        """Drops the released objects and resets the statistics."""
+        self.__free = []
+        self.__live = weakref.WeakSet()
+        self.created = 0
+        self.reused = 0
+        self.high_water = 0
+
+
+class PoolRegistry:
+    """Singleton that holds one object pool per pooled class."""
+
+    _instance = None  # Private class attribute to hold the singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PoolRegistry, cls).__new__(cls)
+            cls._instance.__pools = {}
+        return cls._instance
+
+    def acquire(self, cls: type, create: Callable[[], T], reset: Callable[[T], None]) -> T:
+        """Returns an object of a class from its pool. See `ObjectPool.acquire`."""
+        pool = self.__pools.get(cls)
+        if pool is None:
+            pool = self.__pools[cls] = ObjectPool()
+        return pool.acquire(create, reset)
+
+    def release(self, obj):
+        """Gives an object back to the pool of its class, if its class is pooled.
+
+        Args:
+            obj: The object to release.
+        """
+        pool = self.__pools.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    def get_pool(self, cls: type) -> ObjectPool | None:
+        """Returns the pool of a class, or None if nothing of the class was pooled yet."""
+        return self.__pools.get(cls)
+
+    def stats(self) -> dict[str, tuple[int, int, int]]:
+        """Returns the live, free and high-water counts of every pool, by class name."""
+        return {cls.__name__: (pool.live, pool.free, pool.high_water) for cls, pool in self.__pools.items()}
+
+    def clear(self):
+        """Drops every pool."""
+        self.__pools = {}
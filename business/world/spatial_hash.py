@@ -0,0 +1,90 @@
+"""This module contains the SpatialHash class."""
+
+import settings
+
+
+class SpatialHash:
+    """A uniform grid that buckets items by the cells their rects cover.
+
+    The grid is used as a collision broadphase: two items can only overlap when they
+    share a cell, so everything outside the queried cells never reaches the narrowphase.
+
+    Attributes:
+        cell_width (int): The width of a cell in pixels.
+        cell_height (int): The height of a cell in pixels.
+    """
+
+    def __init__(self, cell_width: int = settings.TILE_WIDTH, cell_height: int = settings.TILE_HEIGHT):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.__cells: dict[tuple[int, int], list[tuple[int, object]]] = {}
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def __cell_bounds(self, rect, margin: int) -> tuple[int, int, int, int]:
+        first_col = rect.left // self.cell_width - margin
+        last_col = (rect.right - 1) // self.cell_width + margin
+        first_row = rect.top // self.cell_height - margin
+        last_row = (rect.bottom - 1) // self.cell_height + margin
+        return first_col, last_col, first_row, last_row
+
+    def clear(self):
+        """Removes every item from the grid."""
+        self.__cells.clear()
+        self.__count = 0
+
+    def insert(self, item, rect):
+        """Adds an item to every cell its rect covers.
+
+        Args:
+            item: The item to store.
+            rect (pygame.Rect): The area the item occupies.
+        """
+        entry = (self.__count, item)
+        self.__count += 1
+        first_col, last_col, first_row, last_row = self.__cell_bounds(rect, 0)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self.__cells.get((col, row))
+                if cell is None:
+                    self.__cells[(col, row)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def rebuild(self, items_with_rects):
+        """Clears the grid and inserts the given items.
+
+        Args:
+            items_with_rects (Iterable[tuple[object, pygame.Rect]]): The items and the areas they occupy.
+        """
+        self.clear()
+        for item, rect in items_with_rects:
+            self.insert(item, rect)
+
+    def query(self, rect, margin: int = 1) -> list:
+        """Returns the items stored in the cells covered by a rect and their neighbours.
+
+        Items are returned once each, in the order they were inserted, so callers that
+        stop at the first hit behave the same as a linear scan over the inserted items.
+
+        Args:
+            rect (pygame.Rect): The area to look up.
+            margin (int): How many rings of neighbouring cells to include.
+
+        Returns:
+            list: The candidate items.
+        """
+        found: dict[int, object] = {}
+        first_col, last_col, first_row, last_row = self.__cell_bounds(rect, margin)
+        cells = self.__cells
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    for order, item in cell:
+                        found[order] = item
+        if len(found) < 2:
+            return list(found.values())
+        return [found[order] for order in sorted(found)]
@@ -0,0 +1,168 @@
+"""This module contains the spawn timeline the monster spawner follows.
+
+A timeline is read from a JSON file with this shape, times of day in seconds and periods
+in milliseconds:
+
+    {
+        "max_monsters": 300,
+        "waves": [
+            {"start": 0, "end": 60, "max_monsters": 100, "monsters": [
+                {"name": "green_tiny_slime", "every": 700, "count": 1,
+                 "stats": {"speed": 1.5, "health": 10, "damage": 2, "attack_cooldown": 1000, "xp_drop": 2}}
+            ]}
+        ],
+        "bursts": [
+            {"at": 120, "name": "blue_tiny_slime", "count": 8, "stats": {...}}
+        ]
+    }
+
+Each monster of a wave spawns `count` at a time every `every` milliseconds while the wave
+lasts, and each burst spawns `count` monsters once. A wave without an end lasts forever.
+No monsters are spawned while the world holds `max_monsters` or more, which a wave can
+lower or raise for itself.
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+
+from business.weapons.stats import MonsterStats
+
+
+class SpawnRule:
+    """A monster a wave spawns periodically.
+
+    Attributes:
+        name (str): The name of the monster.
+        stats (MonsterStats): The stats of the monster.
+        every (int): The milliseconds between spawns.
+        count (int): How many monsters are spawned each time.
+    """
+
+    def __init__(self, name: str, stats: MonsterStats, every: int, count: int = 1):
+        self.name = name
+        self.stats = stats
+        self.every = every
+        self.count = count
+
+
+class SpawnBurst:
+    """Monsters spawned all at once at a point of the run.
+
+    Attributes:
+        at (float): The in-game time of the burst in milliseconds.
+        name (str): The name of the monsters.
+        stats (MonsterStats): The stats of the monsters.
+        count (int): How many monsters are spawned.
+    """
+
+    def __init__(self, at: float, name: str, stats: MonsterStats, count: int):
+        self.at = at
+        self.name = name
+        self.stats = stats
+        self.count = count
+
+
+class Wave:
+    """The monsters spawned during a span of the run.
+
+    Attributes:
+        start (float): The in-game time the wave starts at in milliseconds.
+        end (float | None): The in-game time the wave ends at in milliseconds, or None if it never does.
+        rules (list[SpawnRule]): The monsters the wave spawns.
+        max_monsters (int): The number of monsters in the world the wave stops spawning at.
+    """
+
+    def __init__(self, start: float, end: float | None, rules: list[SpawnRule], max_monsters: int):
+        self.start = start
+        self.end = end
+        self.rules = rules
+        self.max_monsters = max_monsters
+
+
+class SpawnTimeline:
+    """The waves and bursts of a run, sorted once so they can be looked up by time."""
+
+    DEFAULT_PATH = "data/spawn_timeline.json"
+
+    def __init__(self, waves: list[Wave], bursts: list[SpawnBurst], max_monsters: int):
+        self.__waves = sorted(waves, key=lambda wave: wave.start)
+        self.__wave_starts = [wave.start for wave in self.__waves]
+        self.__bursts = sorted(bursts, key=lambda burst: burst.at)
+        self.__burst_times = [burst.at for burst in self.__bursts]
+        self.max_monsters = max_monsters
+
+    @staticmethod
+    def __read_stats(data: dict) -> MonsterStats:
+        return MonsterStats(data["speed"], data["health"], data["damage"], data["attack_cooldown"], data["xp_drop"])
+
+    @staticmethod
+    def from_dict(data: dict) -> "SpawnTimeline":
+        """Compiles a timeline from its JSON representation. See the module for the format.
+
+        Args:
+            data (dict): The timeline.
+
+        Returns:
+            SpawnTimeline: The compiled timeline.
+        """
+        max_monsters = data.get("max_monsters", 300)
+        waves = []
+        for wave in data.get("waves", []):
+            end = wave.get("end")
+            rules = [
+                SpawnRule(rule["name"], SpawnTimeline.__read_stats(rule["stats"]), rule["every"], rule.get("count", 1))
+                for rule in wave.get("monsters", [])
+            ]
+            waves.append(Wave(wave["start"] * 1000, end * 1000 if end is not None else None, rules, wave.get("max_monsters", max_monsters)))
+        bursts = [
+            SpawnBurst(burst["at"] * 1000, burst["name"], SpawnTimeline.__read_stats(burst["stats"]), burst.get("count", 1))
+            for burst in data.get("bursts", [])
+        ]
+        return SpawnTimeline(waves, bursts, max_monsters)
+
+    @staticmethod
+    def load(path: str = DEFAULT_PATH) -> "SpawnTimeline":
+        """Loads and compiles a timeline from a JSON file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            SpawnTimeline: The compiled timeline.
+        """
+        with open(path, "r") as file:
+            return SpawnTimeline.from_dict(json.load(file))
+
+    def get_wave(self, time: float) -> Wave | None:
+        """Finds the wave going on at a time.
+
+        Args:
+            time (float): The in-game time in milliseconds.
+
+        Returns:
+            Wave | None: The wave, or None if no wave is going on.
+        """
+        index = bisect_right(self.__wave_starts, time) - 1
+        if index < 0:
+            return None
+        wave = self.__waves[index]
+        if wave.end is not None and time >= wave.end:
+            return None
+        return wave
+
+    def get_burst_index(self, time: float) -> int:
+        """Returns the index of the first burst at or after a time, to start `get_bursts` from."""
+        return bisect_left(self.__burst_times, time)
+
+    def get_bursts(self, index: int, time: float) -> tuple[list[SpawnBurst], int]:
+        """Returns the bursts from an index on that are due by a time.
+
+        Args:
+            index (int): The index of the first burst that was not spawned yet.
+            time (float): The in-game time in milliseconds.
+
+        Returns:
+            tuple[list[SpawnBurst], int]: The bursts that are due, and the index to continue from.
+        """
+        end = bisect_right(self.__burst_times, time, lo=index)
+        return self.__bursts[index:end], end
@@ -9,6 +9,7 @@ class TileMap(ITileMap):
 
     def __init__(self):
         self.map_data = self.__generate_tile_map()
+        self.__version = 0
 
     def __generate_tile_map(self):
         tile_map = []
@@ -77,3 +78,12 @@ class TileMap(ITileMap):
     def get(self, row, col) -> int:
         # Get the tile index at a specific row and column
         return self.map_data[row][col]
+
+    def set(self, row, col, tile_index: int):
+        if self.map_data[row][col] != tile_index:
+            self.map_data[row][col] = tile_index
+            self.__version += 1
+
+    @property
+    def version(self) -> int:
+        return self.__version
@@ -0,0 +1,42 @@
+"""This module contains the VisibleArea class."""
+
+import settings
+
+
+class VisibleArea:
+    """Works out the part of the world the camera shows.
+
+    The camera is centred on its target but never scrolls past the edges of the world, so
+    near an edge the target is off centre and the screen shows more on the far side.
+    """
+
+    @staticmethod
+    def get_origin(center_x: float, center_y: float) -> tuple[float, float]:
+        """Returns the top left corner of the screen when the camera follows a point.
+
+        Args:
+            center_x (float): The x coordinate the camera follows.
+            center_y (float): The y coordinate the camera follows.
+
+        Returns:
+            tuple[float, float]: The world coordinates of the top left corner of the screen.
+        """
+        left = center_x - settings.SCREEN_WIDTH // 2
+        top = center_y - settings.SCREEN_HEIGHT // 2
+        left = max(0, min(left, settings.WORLD_WIDTH - settings.SCREEN_WIDTH))
+        top = max(0, min(top, settings.WORLD_HEIGHT - settings.SCREEN_HEIGHT))
+        return left, top
+
+    @staticmethod
+    def get_bounds(center_x: float, center_y: float) -> tuple[float, float, float, float]:
+        """Returns the edges of the screen when the camera follows a point.
+
+        Args:
+            center_x (float): The x coordinate the camera follows.
+            center_y (float): The y coordinate the camera follows.
+
+        Returns:
+            tuple[float, float, float, float]: The left, top, right and bottom of the screen.
+        """
+        left, top = VisibleArea.get_origin(center_x, center_y)
+        return left, top, left + settings.SCREEN_WIDTH, top + settings.SCREEN_HEIGHT
@@ -25,6 +25,7 @@ class Game:
         self.input_handler = input_handler
         self.running = True
         self.state = StartingState()
+        self.interpolation = 1.0  # How far between the last two simulation steps the frame is drawn
 
     def __process_game_events(self):
         for event in pygame.event.get():
@@ -36,12 +37,32 @@ class Game:
                     self.input_handler.toggle_pause()
 
     def run(self):
-        """Starts the game loop."""
+        """Starts the game loop.
+
+        The game is simulated in fixed steps of 1 / TICK_RATE seconds of real time and drawn
+        at up to FPS frames per second. A slow frame is caught up with at most
+        MAX_CATCH_UP_STEPS steps; the lag left after that is dropped so it cannot pile up.
+        """
         self.logger.debug("Starting the game loop.")
+        step = 1 / settings.TICK_RATE
+        accumulator = 0.0
         while self.running:
-            self.__clock.tick(settings.FPS) 
+            accumulator += self.__clock.tick(settings.FPS) / 1000
             self.__process_game_events()
-            self.state.update(self)
+            steps = 0
+            while accumulator >= step and steps < settings.MAX_CATCH_UP_STEPS:
+                state = self.state
+                self.state.update(self)
+                accumulator -= step
+                steps += 1
+                if self.state is not state:
+                    # The new state has to be drawn before it is updated, as menus set themselves up when drawn
+                    accumulator = 0.0
+                    break
+            if accumulator >= step:
+                self.logger.debug("Dropping %.3f s of lag", accumulator - accumulator % step)
+                accumulator %= step
+            self.interpolation = accumulator / step
             self.state.render(self)
     def change_state(self,new_state : IGameState):
         """Switch to a new gamestate"""
@@ -71,6 +71,8 @@ class RunningState(IGameState):
     """State for the game running"""
     def update(self, game):
         try:
+            # Frames are interpolated from where the sprites are before anything moves
+            game.world.snapshot_positions()
             game.input_handler.process_input()
             game.world.update()
             CollisionHandler.handle_collisions(game.world)
@@ -83,5 +85,5 @@ class RunningState(IGameState):
             game.change_state(PausedState())
 
     def render(self, game):
-        game.display.render_frame()
+        game.display.render_frame(game.interpolation)
         game.display.update_display()
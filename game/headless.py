@@ -0,0 +1,208 @@
+"""This module contains the headless simulation used to load test the game world.
+
+The simulation runs the same tick as the RunningState, without a window or a display,
+as fast as the machine allows. Input comes from a scripted policy and level ups pick a
+random upgrade, so a run only depends on its seed.
+"""
+
+import logging
+import math
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+import settings
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from business.exceptions import DeadPlayerException, LevelUpException, PausePressed
+from business.handlers.colission_handler import CollisionHandler
+from business.handlers.death_handler import DeathHandler
+from business.world.interfaces import IGameWorld
+from business.world.object_pool import PoolRegistry
+from persistance.save_snapshot import SaveTimings
+from presentation.interfaces import IInputHandler
+
+
+def _idle_policy(world: IGameWorld, tick: int, rng: random.Random, previous: tuple[int, int]) -> tuple[int, int]:
+    return 0, 0
+
+
+def _circle_policy(world: IGameWorld, tick: int, rng: random.Random, previous: tuple[int, int]) -> tuple[int, int]:
+    # Walks the eight directions in turn, a second each, which traces a rough circle
+    angle = (tick // 60 % 8) * math.pi / 4
+    return round(math.cos(angle)), round(math.sin(angle))
+
+
+def _random_policy(world: IGameWorld, tick: int, rng: random.Random, previous: tuple[int, int]) -> tuple[int, int]:
+    # Picks a new direction every half second
+    if tick % 30 == 0:
+        return rng.randint(-1, 1), rng.randint(-1, 1)
+    return previous
+
+
+def _kite_policy(world: IGameWorld, tick: int, rng: random.Random, previous: tuple[int, int]) -> tuple[int, int]:
+    # Walks away from the closest monster
+    player = world.player
+    closest = min(world.monsters, key=lambda monster: (monster.pos_x - player.pos_x) ** 2 + (monster.pos_y - player.pos_y) ** 2, default=None)
+    if closest is None:
+        return 0, 0
+    away_x, away_y = player.pos_x - closest.pos_x, player.pos_y - closest.pos_y
+    return (away_x > 0) - (away_x < 0), (away_y > 0) - (away_y < 0)
+
+
+# A policy gets the world, the tick, the random generator of the run and the direction it returned last tick
+POLICIES: dict[str, Callable[[IGameWorld, int, random.Random, tuple[int, int]], tuple[int, int]]] = {
+    "idle": _idle_policy,
+    "circle": _circle_policy,
+    "random": _random_policy,
+    "kite": _kite_policy,
+}
+
+
+class ScriptedInputHandler(IInputHandler):
+    """Moves the player as a policy tells it to instead of reading the keyboard."""
+
+    def __init__(self, world: IGameWorld, policy: str, rng: random.Random):
+        self.__world = world
+        self.__policy = POLICIES[policy]
+        self.__rng = rng
+        self.__tick = 0
+        self.__direction = (0, 0)
+
+    def toggle_pause(self):
+        """Scripted runs are never paused."""
+
+    def process_input(self):
+        direction = self.__policy(self.__world, self.__tick, self.__rng, self.__direction)
+        self.__direction = direction
+        self.__tick += 1
+        player = self.__world.player
+        if direction == (0, 0):
+            player.sprite.idle_sprite_update()
+        else:
+            player.sprite.walking_sprite_update()
+        if direction[0] == 1:
+            player.sprite.set_facing_left()
+        elif direction[0] == -1:
+            player.sprite.set_facing_right()
+        player.move(direction[0], direction[1])
+
+
+class SimulationReport:
+    """The results of a headless run.
+
+    Attributes:
+        ticks (int): The number of ticks that were simulated.
+        seconds (float): The wall time the ticks took.
+        samples (list[tuple[int, int, int, int]]): Tick, monsters, bullets and gems, taken periodically.
+        level_ups (int): The number of upgrades that were picked.
+        died_at (int | None): The tick the player died at, or None if they survived.
+        peak_memory (int | None): The peak memory allocated by Python during the run in bytes, if it was traced.
+        peak_rss (int | None): The peak resident memory of the process in bytes, where the platform reports it.
+        pools (dict[str, tuple[int, int, int]]): The live, free and high-water counts of the object pools at the end.
+        saves (list[SaveTimings]): How long the autosaves of the run took.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.seconds = 0.0
+        self.samples: list[tuple[int, int, int, int]] = []
+        self.level_ups = 0
+        self.died_at: int | None = None
+        self.peak_memory: int | None = None
+        self.peak_rss: int | None = None
+        self.pools: dict[str, tuple[int, int, int]] = {}
+        self.saves: list[SaveTimings] = []
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        lines = [f"{'tick':>8} | {'monsters':>8} | {'bullets':>7} | {'gems':>6}"]
+        lines += [f"{tick:>8} | {monsters:>8} | {bullets:>7} | {gems:>6}" for tick, monsters, bullets, gems in self.samples]
+        lines.append(f"{self.ticks} ticks in {self.seconds:.2f} s ({self.ticks_per_second:.0f} ticks/s), {self.level_ups} level ups")
+        if self.died_at is not None:
+            lines.append(f"The player died at tick {self.died_at}")
+        if self.peak_memory is not None:
+            lines.append(f"Peak traced memory during the run: {self.peak_memory / 1024 / 1024:.1f} MiB")
+        if self.peak_rss is not None:
+            lines.append(f"Peak resident memory of the process: {self.peak_rss / 1024 / 1024:.1f} MiB")
+        for name, (live, free, high_water) in sorted(self.pools.items()):
+            lines.append(f"{name} pool: {live} live, {free} free, high-water mark {high_water}")
+        if self.saves:
+            # Only the capture runs on the game thread, so only it has to fit in a tick
+            lines.append(f"{len(self.saves)} saves, tick budget {1000 / settings.TICK_RATE:.2f} ms")
+            for step in ("capture_ms", "encode_ms", "write_ms"):
+                durations = [getattr(timings, step) for timings in self.saves]
+                lines.append(f"{step[:-3]:>8}: mean {sum(durations) / len(durations):.2f} ms, max {max(durations):.2f} ms")
+        return "\n".join(lines)
+
+
+class HeadlessSimulation:
+    """Runs the game world tick by tick without rendering anything."""
+
+    def __init__(self, world: IGameWorld, input_handler: IInputHandler, rng: random.Random):
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__world = world
+        self.__input_handler = input_handler
+        self.__rng = rng
+
+    def __level_up(self):
+        # Stands in for the upgrade screen: pick any of the offered upgrades
+        actions = self.__world.player.inventory.get_possible_actions()
+        if actions:
+            self.__rng.choice(actions).do_action()
+        self.__world.player.update_stats()
+
+    def run(self, ticks: int, sample_every: int = 600, trace_memory: bool = False) -> SimulationReport:
+        """Simulates a number of ticks or until the player dies.
+
+        Args:
+            ticks (int): The number of ticks to simulate.
+            sample_every (int): How many ticks apart the entity counts are sampled.
+            trace_memory (bool): Whether to trace the memory Python allocates. It slows the run down a lot.
+
+        Returns:
+            SimulationReport: The results of the run.
+        """
+        report = SimulationReport()
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for tick in range(ticks):
+            if tick % sample_every == 0:
+                report.samples.append((tick, len(self.__world.monsters), len(self.__world.bullets), len(self.__world.experience_gems)))
+            report.ticks = tick + 1
+            try:
+                self.__world.snapshot_positions()
+                self.__input_handler.process_input()
+                self.__world.update()
+                CollisionHandler.handle_collisions(self.__world)
+                DeathHandler.check_deaths(self.__world)
+            except LevelUpException:
+                report.level_ups += 1
+                self.__level_up()
+            except DeadPlayerException:
+                report.died_at = tick
+                self.__logger.info("The player died at tick %d", tick)
+                break
+            except PausePressed:
+                pass
+        report.seconds = time.perf_counter() - start
+        if trace_memory:
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if resource is not None:
+            # Linux reports the peak in kilobytes
+            report.peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        report.samples.append((report.ticks, len(self.__world.monsters), len(self.__world.bullets), len(self.__world.experience_gems)))
+        report.pools = PoolRegistry().stats()
+        self.__world.wait_for_saves()
+        report.saves = list(self.__world.save_timings)
+        return report
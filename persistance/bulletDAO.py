@@ -1,38 +1,30 @@
-
-import json
 from typing import List
 from business.entities.interfaces import IBullet
-from business.weapons.attack_shape import Bullet
-from business.world.ingameclock import InGameClock
+from business.weapons.attack_builder import BulletFactory
+from business.weapons.stats import ProjectileStats
+from persistance.columnar import ColumnarTable
+from persistance.save_snapshot import SaveSnapshot
 class BulletDAO:
-    def __init__(self, json_path):
-        self.__json_path = json_path
+    # The fields of a saved bullet and their value when missing
+    COLUMNS = {
+        "pos_x": 0, "pos_y": 0, "damage": 0, "velocity": 0, "area_of_effect": 1,
+        "reload_time": 0, "pierce": 0, "duration": 0, "bullet_type": "Normalbullet"
+    }
+
+    def __init__(self, snapshot: SaveSnapshot):
+        self.__snapshot = snapshot
 
     def save_bullets(self, bullets : List[IBullet]):
-        data = self.__read_from_json()
-        bullets_dict = {"Bullets": []}
-        for bullet in bullets:
-            bullets_dict["Bullets"].append(bullet.serialize())
-        data.update(bullets_dict)
-        self.__write_to_json(data)        
+        records = [bullet.serialize() for bullet in bullets]
+        self.__snapshot.update({"Bullets": ColumnarTable.from_records(records, self.COLUMNS)})
     
     def load_bullets(self)-> List[IBullet]:
-        data = self.__read_from_json()
         bullets = []
-        for bullet_dict in data.get("Bullets",[]):
-            bullets.append(Bullet.deserialize(bullet_dict))
+        table = self.__snapshot.get_table("Bullets", self.COLUMNS)
+        for pos_x, pos_y, damage, velocity, area_of_effect, reload_time, pierce, duration, bullet_type in table.rows(*self.COLUMNS):
+            stats = ProjectileStats(damage, velocity, area_of_effect, reload_time, pierce, duration)
+            bullets.append(BulletFactory.get_factory_by_name(bullet_type).create_atack_shape(pos_x, pos_y, stats))
         return bullets
-    def delete_all_data(self):
-        self.__write_to_json({})
-    def __write_to_json(self, data):
-        with open(self.__json_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
 
-    def __read_from_json(self) -> dict:
-        try:
-            with open(self.__json_path, 'r') as json_file:
-                return json.load(json_file)
-        except FileNotFoundError:
-            print(f"The file {self.__json_path} does not exist. Creating a new file.")
-            self.__write_to_json({}) 
-            return {} 
\ No newline at end of file
+    def delete_all_data(self):
+        self.__snapshot.remove("Bullets")
@@ -0,0 +1,155 @@
+"""This module contains the ColumnarTable class and its binary encoding.
+
+A table is encoded as a header followed by its columns, all little-endian:
+
+    b"VSCT", rows (u32), columns (u16)
+    for each column:
+        name length (u16), name (utf-8), kind (1 byte)
+        kind b"q" or b"d": rows 64 bit integers or floats
+        kind b"s": strings (u32), then for each string its length (u16) and utf-8 bytes,
+                   then rows u32 indices into those strings
+
+Numeric columns are read back with one bulk copy into an `array`, so decoding does not
+depend on the number of rows in Python code, and any buffer can be decoded, an `mmap` of
+the save file included.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Iterator
+
+MAGIC = b"VSCT"
+_HEADER = struct.Struct("<4sIH")
+_LENGTH = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+
+class ColumnarTable:
+    """Rows of entity fields stored column by column, numbers in typed arrays and strings as
+    indices into a table of the distinct strings.
+
+    Attributes:
+        columns (dict[str, array | list[str]]): The values of each field, in row order.
+    """
+
+    def __init__(self, columns: dict[str, array | list[str]]):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @staticmethod
+    def from_records(records: list[dict], defaults: dict) -> "ColumnarTable":
+        """Builds a table from one dict per row.
+
+        A column holds strings if its default is a string, integers if all its values are
+        integers and floats otherwise.
+
+        Args:
+            records (list[dict]): The rows, as returned by the `serialize` of the entities.
+            defaults (dict): The fields to keep and the value of those missing from a row.
+
+        Returns:
+            ColumnarTable: The table.
+        """
+        columns = {}
+        for field, default in defaults.items():
+            values = [record.get(field, default) for record in records]
+            if isinstance(default, str):
+                columns[field] = values
+            elif all(type(value) is int for value in values) and isinstance(default, int):
+                columns[field] = array("q", values)
+            else:
+                columns[field] = array("d", values)
+        return ColumnarTable(columns)
+
+    def rows(self, *fields: str) -> Iterator[tuple]:
+        """Iterates the rows of the table.
+
+        Args:
+            *fields (str): The fields to return, in order.
+
+        Returns:
+            Iterator[tuple]: The values of the fields of each row.
+        """
+        return zip(*(self.columns[field] for field in fields))
+
+    def encode(self) -> bytes:
+        """Encodes the table in the format described in the module."""
+        parts = [_HEADER.pack(MAGIC, len(self), len(self.columns))]
+        for name, values in self.columns.items():
+            encoded_name = name.encode("utf-8")
+            parts.append(_LENGTH.pack(len(encoded_name)) + encoded_name)
+            if isinstance(values, array):
+                parts.append(values.typecode.encode("ascii"))
+                parts.append(self.__to_little_endian(values).tobytes())
+            else:
+                parts.append(b"s")
+                strings = list(dict.fromkeys(values))
+                index_of = {string: index for index, string in enumerate(strings)}
+                parts.append(_COUNT.pack(len(strings)))
+                for string in strings:
+                    encoded = string.encode("utf-8")
+                    parts.append(_LENGTH.pack(len(encoded)) + encoded)
+                parts.append(self.__to_little_endian(array("I", [index_of[value] for value in values])).tobytes())
+        return b"".join(parts)
+
+    @staticmethod
+    def __to_little_endian(values: array) -> array:
+        if _NEEDS_BYTESWAP:
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values
+
+    @staticmethod
+    def __read_array(buffer, offset: int, typecode: str, count: int) -> tuple[array, int]:
+        values = array(typecode)
+        end = offset + count * values.itemsize
+        values.frombytes(buffer[offset:end])
+        if _NEEDS_BYTESWAP:
+            values.byteswap()
+        return values, end
+
+    @staticmethod
+    def decode(buffer) -> "ColumnarTable":
+        """Decodes a table encoded by `encode`.
+
+        Args:
+            buffer: The encoded table: bytes, a memoryview or an mmap.
+
+        Returns:
+            ColumnarTable: The table. It does not reference the buffer.
+
+        Raises:
+            ValueError: If the buffer does not hold a table.
+        """
+        magic, rows, column_count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("The buffer does not hold a columnar table")
+        offset = _HEADER.size
+        columns = {}
+        for _ in range(column_count):
+            (length,) = _LENGTH.unpack_from(buffer, offset)
+            offset += _LENGTH.size
+            name = bytes(buffer[offset:offset + length]).decode("utf-8")
+            offset += length
+            kind = chr(buffer[offset])
+            offset += 1
+            if kind == "s":
+                (string_count,) = _COUNT.unpack_from(buffer, offset)
+                offset += _COUNT.size
+                strings = []
+                for _ in range(string_count):
+                    (length,) = _LENGTH.unpack_from(buffer, offset)
+                    offset += _LENGTH.size
+                    strings.append(bytes(buffer[offset:offset + length]).decode("utf-8"))
+                    offset += length
+                indices, offset = ColumnarTable.__read_array(buffer, offset, "I", rows)
+                columns[name] = [strings[index] for index in indices]
+            elif kind in ("q", "d"):
+                columns[name], offset = ColumnarTable.__read_array(buffer, offset, kind, rows)
+            else:
+                raise ValueError(f"Unknown column kind {kind!r} in the columnar table")
+        return ColumnarTable(columns)
@@ -1,39 +1,25 @@
-import json
 from typing import List
 from business.entities.interfaces import IMonster
 from business.entities.monster import Monster, MonsterStats
-from presentation.sprite import MonsterSprite
+from persistance.columnar import ColumnarTable
+from persistance.save_snapshot import SaveSnapshot
 class MonsterDAO:
-    def __init__(self, json_path):
-        self.__json_path = json_path
+    # The fields of a saved monster and their value when missing, as in Monster.deserialize
+    COLUMNS = {"pos_x": 1, "pos_y": 1, "health": 1, "speed": 1, "damage": 1, "cooldown": 1000, "xp_drop": 1, "name": "green_slime"}
+
+    def __init__(self, snapshot: SaveSnapshot):
+        self.__snapshot = snapshot
 
     def save_monsters(self, monsters: List[IMonster]):
-        data = self.__read_from_json()
-        monster_dict = {"Monsters": []}
-        for monster in monsters:
-            monster_dict["Monsters"].append(monster.serialize())
-        
-        data.update(monster_dict)
-        self.__write_to_json(data)        
+        records = [monster.serialize() for monster in monsters]
+        self.__snapshot.update({"Monsters": ColumnarTable.from_records(records, self.COLUMNS)})
     
     def load_monsters(self)-> List[IMonster]:
-        data = self.__read_from_json()
         monsters = []
-        for monster_dict in data.get("Monsters",[]):
-            monsters.append(Monster.deserialize(monster_dict))
+        table = self.__snapshot.get_table("Monsters", self.COLUMNS)
+        for pos_x, pos_y, health, speed, damage, cooldown, xp_drop, name in table.rows(*self.COLUMNS):
+            monsters.append(Monster.create(pos_x, pos_y, MonsterStats(speed, health, damage, cooldown, xp_drop), name))
         return monsters
 
     def delete_all_data(self):
-        self.__write_to_json({})
-    def __write_to_json(self, data):
-        with open(self.__json_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
-
-    def __read_from_json(self) -> dict:
-        try:
-            with open(self.__json_path, 'r') as json_file:
-                return json.load(json_file)
-        except FileNotFoundError:
-            print(f"The file {self.__json_path} does not exist. Creating a new file.")
-            self.__write_to_json({})  
-            return {}  
\ No newline at end of file
+        self.__snapshot.remove("Monsters")
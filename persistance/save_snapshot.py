@@ -0,0 +1,301 @@
+"""This module contains the SaveSnapshot class."""
+
+import copy
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from persistance.columnar import ColumnarTable
+
+
+class SaveTimings:
+    """How long the steps of a save took.
+
+    Attributes:
+        capture_ms (float): The milliseconds the game thread spent collecting the sections,
+            or 0 for a save that was not made in a batch.
+        encode_ms (float): The milliseconds spent encoding the sections to JSON.
+        write_ms (float): The milliseconds spent writing and renaming the file.
+        background (bool): Whether the encoding and the writing ran on the save thread
+            while the game went on.
+    """
+
+    def __init__(self, capture_ms: float, background: bool):
+        self.capture_ms = capture_ms
+        self.encode_ms = 0.0
+        self.write_ms = 0.0
+        self.background = background
+
+    def __str__(self):
+        return f"capture {self.capture_ms:.2f} ms, encode {self.encode_ms:.2f} ms, write {self.write_ms:.2f} ms"
+
+
+class SaveSnapshot:
+    """The saved game, kept as one versioned file that the DAOs read and write sections of.
+
+    The file is read once, the first time a section is needed, and written whole through a
+    temporary file that replaces the previous save, so a crash while saving leaves either
+    the old save or the new one, never a mix of both. Writes made inside `batch` are
+    committed together when the batch ends.
+
+    Files are encoded and written by a single save thread, in the order the commits were
+    made. A background commit only takes the sections as they are on the calling thread,
+    which is cheap because sections are replaced whole and never modified in place.
+
+    Sections holding a ColumnarTable are stored in its binary format and the rest as JSON:
+
+        b"VSAV", version (u16), header length (u32)
+        header: {"sections": {"Player": {...}, "Time": 0, ...}, "tables": {"Monsters": [offset, length], ...}}
+        the tables, at their offsets from the end of the header
+
+    Version 1 saves, a JSON file `{"version": 1, "sections": {...}}`, are still read, from
+    `path` or from `previous_path`, where they were kept, until the file exists. Without
+    either, the sections are read from `legacy_paths`, the per-DAO JSON files saves were
+    kept in before.
+
+    Attributes:
+        timings (list[SaveTimings]): How long each save took, the oldest first.
+    """
+
+    VERSION = 2
+    MAGIC = b"VSAV"
+    __PREFIX = struct.Struct("<4sHI")
+
+    def __init__(self, path: str, legacy_paths: list[str] = None, previous_path: str = None):
+        self.__path = path
+        self.__previous_path = previous_path
+        self.__legacy_paths = legacy_paths or []
+        self.__sections: dict = None
+        self.__batch_depth = 0
+        self.__is_dirty = False
+        self.__commits_in_background = False
+        self.__batch_started_at: float = None
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self.__pending: Future = None
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.timings: list[SaveTimings] = []
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def is_saving(self) -> bool:
+        """Whether a commit is still being written."""
+        return self.__pending is not None and not self.__pending.done()
+
+    def __read(self) -> dict:
+        for path in (self.__path, self.__previous_path):
+            if path is None:
+                continue
+            try:
+                return self.__read_file(path)
+            except FileNotFoundError:
+                continue
+        return self.__read_legacy()
+
+    def __read_file(self, path: str) -> dict:
+        try:
+            with open(path, 'rb') as save_file:
+                if os.fstat(save_file.fileno()).st_size == 0:
+                    return {}
+                with mmap.mmap(save_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if mapped[:1] == b"{":
+                        return self.__read_json(mapped)
+                    with memoryview(mapped) as buffer:
+                        return self.__read_binary(buffer)
+        except (ValueError, struct.error):
+            print(f"The file {path} is not a valid save. Starting a new game.")
+            return {}
+
+    def __read_json(self, buffer) -> dict:
+        data = json.loads(buffer[:])
+        if not isinstance(data, dict) or data.get("version") != 1:
+            raise ValueError("Unknown save version")
+        return data.get("sections", {})
+
+    def __read_binary(self, buffer: memoryview) -> dict:
+        magic, version, header_length = self.__PREFIX.unpack_from(buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Unknown save version")
+        start = self.__PREFIX.size + header_length
+        header = json.loads(bytes(buffer[self.__PREFIX.size:start]))
+        sections = header.get("sections", {})
+        for name, (offset, length) in header.get("tables", {}).items():
+            sections[name] = ColumnarTable.decode(buffer[start + offset:start + offset + length])
+        return sections
+
+    def __read_legacy(self) -> dict:
+        # The old files each held their own top level keys, so merging them gives the sections
+        sections = {}
+        for legacy_path in self.__legacy_paths:
+            try:
+                with open(legacy_path, 'r') as json_file:
+                    sections.update(json.load(json_file))
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+        return sections
+
+    def __get_sections(self) -> dict:
+        if self.__sections is None:
+            self.__sections = self.__read()
+        return self.__sections
+
+    def get(self, section: str, default=None):
+        """Returns a copy of a saved section, so callers may modify it.
+
+        Args:
+            section (str): The name of the section.
+            default: The value to return if the section was not saved.
+        """
+        sections = self.__get_sections()
+        if section not in sections:
+            return default
+        return copy.deepcopy(sections[section])
+
+    def get_table(self, section: str, defaults: dict) -> ColumnarTable:
+        """Returns a saved section of entities as a table.
+
+        Sections saved as lists of dicts, as older saves did, are converted.
+
+        Args:
+            section (str): The name of the section.
+            defaults (dict): The fields of the table and the value of those missing from a row.
+
+        Returns:
+            ColumnarTable: The table, empty if the section was not saved. It must not be modified.
+        """
+        value = self.__get_sections().get(section, [])
+        if isinstance(value, ColumnarTable):
+            return value
+        return ColumnarTable.from_records(value, defaults)
+
+    def update(self, sections: dict):
+        """Replaces sections of the save and commits them unless inside a batch.
+
+        Args:
+            sections (dict): The sections by name. The values must be serializable to JSON.
+        """
+        self.__get_sections().update(sections)
+        self.__is_dirty = True
+        if self.__batch_depth == 0:
+            self.commit()
+
+    def remove(self, *sections: str):
+        """Deletes sections of the save and commits unless inside a batch.
+
+        Args:
+            *sections (str): The names of the sections.
+        """
+        saved = self.__get_sections()
+        for section in sections:
+            saved.pop(section, None)
+        self.__is_dirty = True
+        if self.__batch_depth == 0:
+            self.commit()
+
+    @contextmanager
+    def batch(self, background: bool = False):
+        """Delays the commits of the writes made inside the block to its end.
+
+        Args:
+            background (bool): If True, the commit at the end of the block returns without
+                waiting for the file to be written.
+        """
+        if self.__batch_depth == 0:
+            self.__commits_in_background = background
+            self.__batch_started_at = time.perf_counter()
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__is_dirty:
+                capture_ms = (time.perf_counter() - self.__batch_started_at) * 1000
+                if self.__commits_in_background:
+                    self.commit_in_background(capture_ms)
+                else:
+                    self.commit(capture_ms)
+
+    def commit(self, capture_ms: float = 0):
+        """Writes the save file atomically: to a temporary file first, then renamed over the save.
+
+        Args:
+            capture_ms (float): The milliseconds spent collecting the sections, for the timings.
+        """
+        self.__submit(SaveTimings(capture_ms, False)).result()
+
+    def commit_in_background(self, capture_ms: float = 0) -> Future:
+        """Writes the save file like `commit` on the save thread, without waiting for it.
+
+        Args:
+            capture_ms (float): The milliseconds spent collecting the sections, for the timings.
+
+        Returns:
+            Future: Done when the file is written. Its result is the timings of the save.
+        """
+        future = self.__submit(SaveTimings(capture_ms, True))
+        future.add_done_callback(self.__log_failure)
+        return future
+
+    def wait(self):
+        """Waits until the commits made so far are written."""
+        if self.__pending is not None:
+            wait([self.__pending])
+
+    def __log_failure(self, future: Future):
+        if future.exception() is not None:
+            self.__logger.error("Could not save %s: %s", self.__path, future.exception())
+
+    def __submit(self, timings: SaveTimings) -> Future:
+        # A shallow copy is enough, sections are replaced and not modified
+        sections = dict(self.__get_sections())
+        self.__is_dirty = False
+        self.__pending = self.__executor.submit(self.__write, sections, timings)
+        return self.__pending
+
+    def __encode(self, sections: dict) -> bytes:
+        plain = {}
+        tables = {}
+        blocks = []
+        offset = 0
+        for name, value in sections.items():
+            if isinstance(value, ColumnarTable):
+                block = value.encode()
+                tables[name] = [offset, len(block)]
+                blocks.append(block)
+                offset += len(block)
+            else:
+                plain[name] = value
+        header = json.dumps({"sections": plain, "tables": tables}, separators=(',', ':')).encode("utf-8")
+        return b"".join([self.__PREFIX.pack(self.MAGIC, self.VERSION, len(header)), header] + blocks)
+
+    def __write(self, sections: dict, timings: SaveTimings) -> SaveTimings:
+        start = time.perf_counter()
+        encoded = self.__encode(sections)
+        encoded_at = time.perf_counter()
+        folder = os.path.dirname(os.path.abspath(self.__path))
+        os.makedirs(folder, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=folder, prefix=".save-", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as save_file:
+                save_file.write(encoded)
+                save_file.flush()
+                os.fsync(save_file.fileno())
+            os.chmod(temporary_path, 0o644)  # mkstemp only lets the owner read the file
+            os.replace(temporary_path, self.__path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        timings.encode_ms = (encoded_at - start) * 1000
+        timings.write_ms = (time.perf_counter() - encoded_at) * 1000
+        self.timings.append(timings)
+        self.__logger.debug("Saved %s: %s", self.__path, timings)
+        return timings
@@ -1,39 +1,22 @@
-import json
 from typing import List
 from business.entities.interfaces import IExperienceGem
 from business.entities.experience_gem import ExperienceGem
+from persistance.columnar import ColumnarTable
+from persistance.save_snapshot import SaveSnapshot
 class xpDAO:
-    def __init__(self, json_path):
-        self.__json_path = json_path
+    # The fields of a saved gem and their value when missing, as in ExperienceGem.deserialize
+    COLUMNS = {"pos_x": 0, "pos_y": 0, "amount": 1}
+
+    def __init__(self, snapshot: SaveSnapshot):
+        self.__snapshot = snapshot
     
     def save_xp(self, experience : List[IExperienceGem]):
-        data = self.__read_from_json()
-        experience_dict = {"Experience": []}
-        for xp in experience:
-            experience_dict["Experience"].append(xp.serialize())
-        data.update(experience_dict)
-        self.__write_to_json(data)
+        records = [xp.serialize() for xp in experience]
+        self.__snapshot.update({"Experience": ColumnarTable.from_records(records, self.COLUMNS)})
     
     def load_xp(self) ->  List[IExperienceGem]:
-        data = self.__read_from_json()
-        experience = []
-        for experience_dict in data.get("Experience",[]):
-            experience_dict : dict
-            experience.append(ExperienceGem.deserialize(experience_dict))
-        return experience
-
-    def __write_to_json(self, data):
-        with open(self.__json_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
-
-    def __read_from_json(self) -> dict:
-        try:
-            with open(self.__json_path, 'r') as json_file:
-                return json.load(json_file)
-        except FileNotFoundError:
-            print(f"The file {self.__json_path} does not exist. Creating a new file.")
-            self.__write_to_json({})  
-            return {} 
+        table = self.__snapshot.get_table("Experience", self.COLUMNS)
+        return [ExperienceGem.create(pos_x, pos_y, amount) for pos_x, pos_y, amount in table.rows(*self.COLUMNS)]
 
     def delete_all_data(self):
-        self.__write_to_json({})
\ No newline at end of file
+        self.__snapshot.remove("Experience")
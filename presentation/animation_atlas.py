@@ -0,0 +1,36 @@
+"""This module contains the AnimationAtlas class."""
+
+import pygame
+
+from presentation.asset_cache import AssetCache
+
+
+class AnimationAtlas:
+    """The frames of an animation, pre-scaled, with both facings and their masks.
+
+    Frames are read from numbered images in a folder, so `positions` are the file names
+    without the extension. Images are assumed to face left; the right facing variant is
+    the image flipped horizontally.
+    """
+
+    def __init__(self, folder: str, positions: list[int], size: tuple[int, int]):
+        cache = AssetCache()
+        self.__frames: dict[tuple[int, bool], tuple[pygame.Surface, pygame.mask.Mask]] = {}
+        for position in positions:
+            path = f"{folder}{position}.png"
+            image = cache.get_image(path, size)
+            flipped = cache.get_surface(("flipped", path, size), lambda: pygame.transform.flip(image, True, False))
+            self.__frames[(position, False)] = (image, cache.get_mask(image))
+            self.__frames[(position, True)] = (flipped, cache.get_mask(flipped))
+
+    def get_frame(self, position: int, facing_right: bool) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """Returns a frame and its mask.
+
+        Args:
+            position (int): The number of the frame.
+            facing_right (bool): Whether to return the right facing variant.
+
+        Returns:
+            tuple[pygame.Surface, pygame.mask.Mask]: The shared surface and mask of the frame.
+        """
+        return self.__frames[(position, facing_right)]
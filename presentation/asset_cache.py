@@ -0,0 +1,244 @@
+"""This module contains the AssetCache class."""
+
+import hashlib
+import weakref
+from typing import Callable
+
+import pygame
+
+from presentation.tileset import Tileset
+
+
+class AssetCache:
+    """Singleton cache of decoded, converted and scaled surfaces and their masks.
+
+    Sprites are created many times per second, so every image is read from disk, converted
+    and scaled once and then shared. Cached surfaces must be treated as read-only: sprites
+    that need to change an image work on a copy or a transformed variant.
+
+    Attributes:
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that had to build the asset.
+        masks_built (int): The number of masks built, before interning.
+    """
+
+    ROTATION_STEP = 5  # Rotations are rounded to multiples of this many degrees
+
+    _instance = None  # Private class attribute to hold the singleton instance
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetCache, cls).__new__(cls)
+            cls._instance.clear()
+        return cls._instance
+
+    def clear(self):
+        """Drops every cached asset and resets the counters."""
+        self.__surfaces: dict[tuple, pygame.Surface] = {}
+        self.__tilesets: dict[tuple, Tileset] = {}
+        self.__masks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.__interned_masks: dict[tuple, list[pygame.mask.Mask]] = {}
+        self.__variants: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.__tints: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.masks_built = 0
+
+    @staticmethod
+    def convert(image: pygame.Surface) -> pygame.Surface:
+        """Converts an image to the pixel format of the display, if there is one.
+
+        Without a display, as in headless simulations, the image is returned unchanged.
+
+        Args:
+            image (pygame.Surface): The image to convert.
+
+        Returns:
+            pygame.Surface: The converted image.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha()
+
+    def get_surface(self, key: tuple, create: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Returns the surface stored under a key, creating it on the first request.
+
+        Args:
+            key (tuple): The key that identifies the surface.
+            create (Callable[[], pygame.Surface]): Builds the surface on a miss.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+        surface = self.__surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = create()
+            self.__surfaces[key] = surface
+        else:
+            self.hits += 1
+        return surface
+
+    def get_image(self, path: str, size: tuple[int, int] = None) -> pygame.Surface:
+        """Returns an image file converted for fast blitting and optionally scaled.
+
+        Args:
+            path (str): The path of the image file.
+            size (tuple[int, int]): The size to scale the image to, or None to keep it.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+        def load():
+            image = self.convert(pygame.image.load(path))
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            return image
+        return self.get_surface((path, size), load)
+
+    def get_tileset(self, path: str, tile_width: int, tile_height: int, columns: int, rows: int) -> Tileset:
+        """Returns a tileset cut from a spritesheet.
+
+        Args:
+            path (str): The path of the spritesheet.
+            tile_width (int): The width of a tile.
+            tile_height (int): The height of a tile.
+            columns (int): The number of tile columns in the sheet.
+            rows (int): The number of tile rows in the sheet.
+
+        Returns:
+            Tileset: The shared tileset.
+        """
+        key = (path, tile_width, tile_height, columns, rows)
+        tileset = self.__tilesets.get(key)
+        if tileset is None:
+            self.misses += 1
+            tileset = Tileset(path, tile_width, tile_height, columns, rows)
+            self.__tilesets[key] = tileset
+        else:
+            self.hits += 1
+        return tileset
+
+    def __intern_mask(self, mask: pygame.mask.Mask) -> pygame.mask.Mask:
+        # Surfaces with the same shape, like the colors of a gem or the frames of a slime,
+        # get the same mask however they were built
+        self.masks_built += 1
+        pixels = pygame.image.tobytes(mask.to_surface(), "RGB")
+        key = (mask.get_size(), hashlib.blake2b(pixels, digest_size=16).digest())
+        candidates = self.__interned_masks.setdefault(key, [])
+        count = mask.count()
+        for candidate in candidates:
+            if candidate.count() == count and candidate.overlap_area(mask, (0, 0)) == count:
+                return candidate
+        candidates.append(mask)
+        return mask
+
+    def get_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Returns the collision mask of a surface, building it once per surface.
+
+        Masks are interned by their bits, so surfaces with the same shape share one.
+
+        Args:
+            surface (pygame.Surface): The surface, usually one returned by this cache.
+
+        Returns:
+            pygame.mask.Mask: The shared mask. It must not be modified.
+        """
+        mask = self.__masks.get(surface)
+        if mask is None:
+            self.misses += 1
+            mask = self.__intern_mask(pygame.mask.from_surface(surface))
+            self.__masks[surface] = mask
+        else:
+            self.hits += 1
+        return mask
+
+    def get_interned_masks(self) -> list[pygame.mask.Mask]:
+        """Returns the distinct masks handed out since the cache was cleared.
+
+        Returns:
+            list[pygame.mask.Mask]: The masks. They must not be modified.
+        """
+        return [mask for candidates in self.__interned_masks.values() for mask in candidates]
+
+    @classmethod
+    def quantize_angle(cls, angle: float) -> int:
+        """Rounds an angle to the rotation step the variants are built for.
+
+        Args:
+            angle (float): The angle in degrees.
+
+        Returns:
+            int: The rounded angle, from 0 to 360 excluded.
+        """
+        return int(round(angle / cls.ROTATION_STEP) * cls.ROTATION_STEP) % 360
+
+    def get_transformed(self, image: pygame.Surface, size: tuple[int, int] = None, angle: float = 0,
+                        flip_x: bool = False, flip_y: bool = False) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """Returns a scaled, rotated and flipped variant of a surface and its mask.
+
+        The image is scaled first, then rotated by the quantized angle and then flipped, and
+        each variant is built once per source surface, so sprites sharing an image share
+        their variants too.
+
+        Args:
+            image (pygame.Surface): The source surface, usually one returned by this cache.
+            size (tuple[int, int]): The size to scale the image to, or None to keep it.
+            angle (float): The counterclockwise rotation in degrees.
+            flip_x (bool): If True, the variant is flipped horizontally.
+            flip_y (bool): If True, the variant is flipped vertically.
+
+        Returns:
+            tuple[pygame.Surface, pygame.mask.Mask]: The shared variant and its mask.
+        """
+        if size == image.get_size():
+            size = None
+        key = (size, self.quantize_angle(angle), bool(flip_x), bool(flip_y))
+        if key == (None, 0, False, False):
+            return image, self.get_mask(image)
+        variants = self.__variants.get(image)
+        if variants is None:
+            variants = {}
+            self.__variants[image] = variants
+        variant = variants.get(key)
+        if variant is None:
+            self.misses += 1
+            size, angle, flip_x, flip_y = key
+            surface = image
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            if angle:
+                surface = pygame.transform.rotate(surface, angle)
+            if flip_x or flip_y:
+                surface = pygame.transform.flip(surface, flip_x, flip_y)
+            variant = (surface, self.__intern_mask(pygame.mask.from_surface(surface)))
+            variants[key] = variant
+        else:
+            self.hits += 1
+        return variant
+
+    def get_tinted(self, image: pygame.Surface, color: tuple[int, int, int]) -> pygame.Surface:
+        """Returns a surface multiplied by a color, building it once per surface and color.
+
+        Args:
+            image (pygame.Surface): The source surface, usually one returned by this cache.
+            color (tuple[int, int, int]): The color to multiply the image by.
+
+        Returns:
+            pygame.Surface: The shared tinted surface. It has the same shape as the image, so
+            the mask of the image applies to it.
+        """
+        tints = self.__tints.get(image)
+        if tints is None:
+            tints = {}
+            self.__tints[image] = tints
+        tinted = tints.get(color)
+        if tinted is None:
+            self.misses += 1
+            tinted = image.copy()
+            tinted.fill(color, special_flags=pygame.BLEND_MULT)
+            tinted.set_colorkey((0, 0, 0))  # Set transparency if necessary
+            tints[color] = tinted
+        else:
+            self.hits += 1
+        return tinted
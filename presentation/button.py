@@ -1,18 +1,26 @@
 import pygame
 from business.weapons.interfaces import IActionStrategy
+from presentation.asset_cache import AssetCache
 from typing import Callable, List
 
 class FramedImage:
     def __init__(self, image_path: str, size: tuple = (64,64), frame_color=(255, 215, 0), frame_thickness=4):
-        self.image = pygame.image.load(image_path).convert_alpha()  
-        self.image = pygame.transform.scale(self.image, size) 
+        cache = AssetCache()
+        self.image = cache.get_image(image_path, size)
         self.frame_color = frame_color  
         self.frame_thickness = frame_thickness 
+        # The frame and the icon are composited once and shared by every framed image that looks the same
+        self.framed_image = cache.get_surface(("framed", image_path, size, frame_color, frame_thickness), self.__compose)
+
+    def __compose(self) -> pygame.Surface:
+        framed_image = pygame.Surface(self.image.get_rect().inflate(self.frame_thickness, self.frame_thickness).size, pygame.SRCALPHA)
+        pygame.draw.rect(framed_image, self.frame_color, framed_image.get_rect(), self.frame_thickness)
+        framed_image.blit(self.image, (self.frame_thickness // 2, self.frame_thickness // 2))
+        return framed_image
 
     def draw(self, surface: pygame.Surface, position: tuple):
         image_rect = self.image.get_rect(midleft=position)
-        pygame.draw.rect(surface, self.frame_color, image_rect.inflate(self.frame_thickness, self.frame_thickness), self.frame_thickness)
-        surface.blit(self.image, image_rect)
+        surface.blit(self.framed_image, self.framed_image.get_rect(center=image_rect.center))
 
 
 
@@ -3,6 +3,7 @@
 import pygame
 
 import settings
+from business.world.visible_area import VisibleArea
 
 
 class Camera:
@@ -12,14 +13,10 @@ class Camera:
 
     Attributes:
         camera_rect (pygame.Rect): The rectangle representing the camera.
-        world_width (int): The width of the world.
-        world_height (int): The height of the world.
     """
 
     def __init__(self):
         self.camera_rect = pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
-        self.world_width = settings.WORLD_WIDTH
-        self.world_height = settings.WORLD_HEIGHT
 
     def apply(self, rect):
         """Apply the camera offset to a rectangle.
@@ -35,13 +32,8 @@ class Camera:
         Args:
             target_rect (pygame.Rect): The target rectangle to follow.
         """
-        # Center the camera on the target
-        x = target_rect.centerx - settings.SCREEN_WIDTH // 2
-        y = target_rect.centery - settings.SCREEN_HEIGHT // 2
-
-        # Limit scrolling to world boundaries
-        x = max(0, min(x, self.world_width - settings.SCREEN_WIDTH))
-        y = max(0, min(y, self.world_height - settings.SCREEN_HEIGHT))
+        # Center the camera on the target, without scrolling past the world boundaries
+        x, y = VisibleArea.get_origin(target_rect.centerx, target_rect.centery)
 
         # Update the camera rectangle
         self.camera_rect = pygame.Rect(x, y, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
@@ -8,6 +8,7 @@ from business.world.game_world import GameWorld
 from business.upgrades.upgradestrategy import ActionStrategy
 from presentation.camera import Camera
 from presentation.interfaces import IDisplay
+from presentation.ground_layer import GroundLayer
 from presentation.tileset import Tileset
 from presentation.button import UpgradeButton, FramedImage, MenuButton
 from business.weapons.interfaces import IInventory
@@ -16,11 +17,15 @@ from business.exceptions import PausePressed, GameStart
 class Display(IDisplay):
     """Class for displaying the game world."""
 
+    INVENTORY_ITEM_SIZE = (64, 64)
+    INVENTORY_FRAME_THICKNESS = 4
+
     def __init__(self):
         self.__screen = pygame.display.set_mode(settings.SCREEN_DIMENSION)
         pygame.display.set_caption(settings.GAME_TITLE)
         self.camera = Camera()
         self.__ground_tileset = self.__load_ground_tileset()
+        self.__ground_layer = GroundLayer(self.__ground_tileset)
         self.__world: GameWorld = None
         self.__font_large = pygame.font.Font(None, 48)
         self.__font_small = pygame.font.Font(None, 24)
@@ -32,6 +37,8 @@ class Display(IDisplay):
         self.__buttons = None
         self.__pause_buttons = None
         self.__frames_rendered = 0
+        self.__inventory_strip: pygame.Surface = None
+        self.__inventory_signature: tuple = None
 
     @property
     def is_in_menu(self):
@@ -42,36 +49,17 @@ class Display(IDisplay):
         )
 
     def __render_ground_tiles(self):
-        start_col = max(0, self.camera.camera_rect.left // settings.TILE_WIDTH)
-        end_col = min(
-            settings.WORLD_COLUMNS, (self.camera.camera_rect.right // settings.TILE_WIDTH) + 1
-        )
-        start_row = max(0, self.camera.camera_rect.top // settings.TILE_HEIGHT)
-        end_row = min(
-            settings.WORLD_ROWS, (self.camera.camera_rect.bottom // settings.TILE_HEIGHT) + 1
-        )
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                # Get the tile index from the tile map
-                tile_index = self.__world.tile_map.get(row, col)
-                tile_image = self.__ground_tileset.get_tile(tile_index)
-
-                # Calculate the position on the screen
-                x = col * settings.TILE_WIDTH - self.camera.camera_rect.left
-                y = row * settings.TILE_HEIGHT - self.camera.camera_rect.top
+        self.__ground_layer.draw(self.__screen, self.camera.camera_rect)
 
-                self.__screen.blit(tile_image, (x, y))
-
-    def __draw_player_health_bar(self):
+    def __draw_player_health_bar(self, player_rect: pygame.Rect):
         # Get the player's health
         player = self.__world.player
         
         # Define the health bar dimensions
         bar_width = settings.TILE_WIDTH
         bar_height = 5
-        bar_x = player.sprite.rect.centerx - bar_width // 2 - self.camera.camera_rect.left
-        bar_y = player.sprite.rect.bottom + 5 - self.camera.camera_rect.top
+        bar_x = player_rect.centerx - bar_width // 2 - self.camera.camera_rect.left
+        bar_y = player_rect.bottom + 5 - self.camera.camera_rect.top
 
         # Draw the background bar (red)
         bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
@@ -181,10 +169,10 @@ class Display(IDisplay):
         self.__screen.blit(cronometer_surface, (time_position_x, 10))
 
 
-    def __draw_player(self):
-        adjusted_rect = self.camera.apply(self.__world.player.sprite.rect)
+    def __draw_player(self, player_rect: pygame.Rect):
+        adjusted_rect = self.camera.apply(player_rect)
         self.__screen.blit(self.__world.player.sprite.image, adjusted_rect)
-        self.__draw_player_health_bar()
+        self.__draw_player_health_bar(player_rect)
         self.__draw_experience_bar()
 
     def __draw_experience_bar(self):
@@ -201,6 +189,7 @@ class Display(IDisplay):
 
     def load_world(self, world: GameWorld):
         self.__world = world
+        self.__ground_layer.bake(world.tile_map)
 
 
     def render_pause_screen(self):
@@ -352,82 +341,87 @@ class Display(IDisplay):
         
 
     def __render_inventory_items(self):
-        # Get weapons and passives from the inventory
+        # The strip is only rebuilt when the items in the inventory change
         inventory = self.__world.player.inventory
-        weapons = inventory.get_weapons()
-        passives = inventory.get_passives()
-        max_size = inventory.get_max_size()
-    
+        signature = (
+            tuple(weapon.name for weapon in inventory.get_weapons()),
+            tuple(passive.name for passive in inventory.get_passives()),
+            inventory.get_max_size()
+        )
+        if signature != self.__inventory_signature:
+            self.__inventory_signature = signature
+            self.__inventory_strip = self.__build_inventory_strip(*signature)
+        frame_margin = self.INVENTORY_FRAME_THICKNESS // 2
+        self.__screen.blit(self.__inventory_strip, (-frame_margin, -frame_margin))
+
+    def __build_inventory_strip(self, weapon_names: tuple, passive_names: tuple, max_size: int) -> pygame.Surface:
         # Set initial grid parameters
         padding = 0
-        x_offset, y_offset = 0, 32  # Initial position to start drawing items
-        item_size = (64, 64)
+        item_size = self.INVENTORY_ITEM_SIZE
+        frame_margin = self.INVENTORY_FRAME_THICKNESS // 2
+        columns = min(max_size, 5)
+        strip = pygame.Surface(
+            (columns * (item_size[0] + padding) + 2 * frame_margin, 2 * (item_size[1] + padding) + 2 * frame_margin),
+            pygame.SRCALPHA
+        )
+        # Positions are shifted by the frame margin so the frames are not cut off at the strip border
+        x_offset, y_offset = frame_margin, item_size[1] // 2 + frame_margin
 
         # Render weapons (first row)
         for i in range(max_size):
             x_position = x_offset + (i % 5) * (item_size[0] + padding)  # Arrange 5 items per row
-            y_position = y_offset  # Weapons in the first row (same y_offset)
-            try:
-                weapon = weapons[i]
-                self.__render_item(weapon.name, (x_position, y_position))
-            except IndexError:
-                self.__render_item("weapon",(x_position, y_position))
-
-                
-
+            item_name = weapon_names[i] if len(weapon_names) > i else "weapon"
+            self.__render_item(strip, item_name, (x_position, y_offset))
 
         # Update y_offset to place passives in the second row
         y_offset += item_size[1] + padding
 
         for i in range(max_size):
             x_position = x_offset + (i % 5) * (item_size[0] + padding)  # Arrange 5 items per row
-            y_position = y_offset  # Weapons in the first row (same y_offset)
-            if len(passives) > i:
-                passive = passives[i]
-                self.__render_item(passive.name, (x_position, y_position))
-            else:
-                self.__render_item("passive",(x_position, y_position))
+            item_name = passive_names[i] if len(passive_names) > i else "passive"
+            self.__render_item(strip, item_name, (x_position, y_offset))
+        return strip
 
-
-    
-    def __render_item(self, item_name, position: tuple):
+    def __render_item(self, surface: pygame.Surface, item_name: str, position: tuple):
         image_path = f"./assets/items/{item_name}.png"
-        framed_image = FramedImage(image_path, (64,64))
-        framed_image.draw(self.__screen, position)
+        framed_image = FramedImage(image_path, self.INVENTORY_ITEM_SIZE, frame_thickness=self.INVENTORY_FRAME_THICKNESS)
+        framed_image.draw(surface, position)
 
         
-    def render_frame(self):
+    def render_frame(self, alpha: float = 1.0):
+        # Sprites are drawn between where they were in the previous step and where they are now
+        player_rect = self.__world.player.sprite.get_interpolated_rect(alpha)
+
         # Update the camera to follow the player
-        self.camera.update(self.__world.player.sprite.rect)
+        self.camera.update(player_rect)
 
         # Render the ground tiles
         self.__render_ground_tiles()
 
         # Draw all the experience gems
         for gem in self.__world.experience_gems:
-            if self.camera.camera_rect.colliderect(gem.sprite.rect):
-                adjusted_rect = self.camera.apply(gem.sprite.rect)
-                self.__screen.blit(gem.sprite.image, adjusted_rect)
+            self.__draw_sprite(gem.sprite, alpha)
 
         # Draw all monsters
         for monster in self.__world.monsters:
-            if self.camera.camera_rect.colliderect(monster.sprite.rect):
-                adjusted_rect = self.camera.apply(monster.sprite.rect)
-                self.__screen.blit(monster.sprite.image, adjusted_rect)
+            self.__draw_sprite(monster.sprite, alpha)
 
         # Draw the bullets
         for bullet in self.__world.bullets:
-            if self.camera.camera_rect.colliderect(bullet.sprite.rect):
-                adjusted_rect = self.camera.apply(bullet.sprite.rect)
-                self.__screen.blit(bullet.sprite.image, adjusted_rect)
+            self.__draw_sprite(bullet.sprite, alpha)
         
         for gem in self.__world.experience_gems:
             gem.sprite.update()
 
         # Draw the player
         self.__render_inventory_items()
-        self.__draw_player()
+        self.__draw_player(player_rect)
         self.__draw_time()
+
+    def __draw_sprite(self, sprite, alpha: float):
+        rect = sprite.get_interpolated_rect(alpha)
+        if self.camera.camera_rect.colliderect(rect):
+            self.__screen.blit(sprite.image, self.camera.apply(rect))
         
     def update_display(self):
         pygame.display.flip()
\ No newline at end of file
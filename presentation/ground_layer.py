@@ -0,0 +1,76 @@
+"""This module contains the GroundLayer class."""
+
+import pygame
+
+import settings
+from business.world.interfaces import ITileMap
+from presentation.tileset import Tileset
+
+
+class GroundLayer:
+    """The ground of the world pre-rendered into square chunks of tiles.
+
+    Drawing the ground is then a blit of the visible part of each chunk the camera
+    touches instead of one blit per tile. The chunks are baked again when the version
+    of the tile map changes.
+    """
+
+    def __init__(self, tileset: Tileset, chunk_size: int = settings.GROUND_CHUNK_SIZE):
+        self.__tileset = tileset
+        self.__chunk_size = chunk_size
+        self.__chunk_width = chunk_size * settings.TILE_WIDTH
+        self.__chunk_height = chunk_size * settings.TILE_HEIGHT
+        self.__chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self.__tile_map: ITileMap = None
+        self.__baked_version: int = None
+
+    def bake(self, tile_map: ITileMap):
+        """Renders every tile of a tile map into the chunks.
+
+        Args:
+            tile_map (ITileMap): The tile map to render.
+        """
+        self.__tile_map = tile_map
+        self.__baked_version = tile_map.version
+        self.__chunks = {}
+        for chunk_row in range(0, settings.WORLD_ROWS, self.__chunk_size):
+            for chunk_col in range(0, settings.WORLD_COLUMNS, self.__chunk_size):
+                self.__chunks[(chunk_row, chunk_col)] = self.__bake_chunk(chunk_row, chunk_col)
+
+    def __bake_chunk(self, chunk_row: int, chunk_col: int) -> pygame.Surface:
+        rows = min(self.__chunk_size, settings.WORLD_ROWS - chunk_row)
+        columns = min(self.__chunk_size, settings.WORLD_COLUMNS - chunk_col)
+        chunk = pygame.Surface((columns * settings.TILE_WIDTH, rows * settings.TILE_HEIGHT)).convert()
+        for row in range(rows):
+            for col in range(columns):
+                tile_image = self.__tileset.get_tile(self.__tile_map.get(chunk_row + row, chunk_col + col))
+                chunk.blit(tile_image, (col * settings.TILE_WIDTH, row * settings.TILE_HEIGHT))
+        return chunk
+
+    def draw(self, surface: pygame.Surface, camera_rect: pygame.Rect):
+        """Draws the part of the ground the camera sees.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            camera_rect (pygame.Rect): The area of the world the camera sees.
+        """
+        if self.__tile_map.version != self.__baked_version:
+            self.bake(self.__tile_map)
+
+        first_chunk_col = max(0, camera_rect.left // self.__chunk_width)
+        last_chunk_col = camera_rect.right // self.__chunk_width
+        first_chunk_row = max(0, camera_rect.top // self.__chunk_height)
+        last_chunk_row = camera_rect.bottom // self.__chunk_height
+        for chunk_row in range(first_chunk_row, last_chunk_row + 1):
+            for chunk_col in range(first_chunk_col, last_chunk_col + 1):
+                chunk = self.__chunks.get((chunk_row * self.__chunk_size, chunk_col * self.__chunk_size))
+                if chunk is None:
+                    continue
+                chunk_rect = chunk.get_rect(topleft=(chunk_col * self.__chunk_width, chunk_row * self.__chunk_height))
+                visible = chunk_rect.clip(camera_rect)
+                if visible.width and visible.height:
+                    surface.blit(
+                        chunk,
+                        (visible.left - camera_rect.left, visible.top - camera_rect.top),
+                        visible.move(-chunk_rect.left, -chunk_rect.top)
+                    )
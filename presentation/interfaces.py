@@ -18,8 +18,12 @@ class IDisplay(ABC):
         """
 
     @abstractmethod
-    def render_frame(self):
-        """Render the current frame."""
+    def render_frame(self, alpha: float = 1.0):
+        """Render the current frame.
+
+        Args:
+            alpha (float): How far between the previous and the current simulation step to draw the sprites, from 0 to 1.
+        """
 
     @abstractmethod
     def render_pause_screen(self):
@@ -3,19 +3,41 @@
 import pygame
 import settings
 import random
-from presentation.tileset import Tileset
+from presentation.animation_atlas import AnimationAtlas
+from presentation.asset_cache import AssetCache
 
 
 class Sprite(pygame.sprite.Sprite):
     """A class representing a sprite."""
 
-    def __init__(self, image: pygame.Surface, rect: pygame.Rect, *groups):
+    DAMAGE_COLOR = (255, 0, 0)
+    DAMAGE_FLASH_TICKS = 30
+
+    def __init__(self, image: pygame.Surface, rect: pygame.Rect, *groups, mask: pygame.mask.Mask = None):
+        self._restart(image, rect, mask)
+        super().__init__(*groups)
+
+    def _restart(self, image: pygame.Surface, rect: pygame.Rect, mask: pygame.mask.Mask = None):
+        """Puts the sprite in the state of a new one, so pooled sprites can be reused.
+
+        Args:
+            image (pygame.Surface): The image of the sprite.
+            rect (pygame.Rect): The rect of the sprite.
+            mask (pygame.mask.Mask): The mask of the image, taken from the asset cache if not given.
+        """
         self._image: pygame.Surface = image
         self._rect: pygame.Rect = rect
-        super().__init__(*groups)
         self.__is_in_damage_countdown = 0
-        self.__original_image: pygame.Surface = image
-        self._mask: pygame.mask.Mask = pygame.mask.from_surface(image)
+        self.__plain_image: pygame.Surface = image  # The image without the damage tint
+        # The untransformed image and the transform applied to it, see `__apply_transform`
+        self.__source_image: pygame.Surface = image
+        self.__size: tuple[int, int] = None
+        self.__angle: float = 0
+        self.__flip_x = False
+        self.__flip_y = False
+        self._mask: pygame.mask.Mask = mask if mask is not None else AssetCache().get_mask(image)
+        self.__previous_center: tuple[int, int] = rect.center
+        self.__has_previous = False  # Whether a step started since the sprite was created
 
     @property
     def image(self) -> pygame.Surface:
@@ -52,26 +74,55 @@ class Sprite(pygame.sprite.Sprite):
             pos_y (float): The y-coordinate of the sprite.
         """
         self._rect.center = (int(pos_x), int(pos_y))
+        # A sprite created during this step has no previous position, it appears where it is put
+        if not self.__has_previous:
+            self.__previous_center = self._rect.center
+
+    def snapshot_previous(self):
+        """Remembers where the sprite is, to interpolate from it until the next snapshot.
 
-    def __restore_image(self):
-        self._image = self.__original_image.copy()
+        Called for every sprite at the start of each step, before anything moves.
+        """
+        self.__previous_center = self._rect.center
+        self.__has_previous = True
+
+    def get_interpolated_rect(self, alpha: float) -> pygame.Rect:
+        """The rect of the sprite between its position at the start of the step and the current one.
+
+        Args:
+            alpha (float): How far into the next tick the frame is drawn, from 0 to 1.
+
+        Returns:
+            pygame.Rect: The rect to draw the sprite at.
+        """
+        previous_x, previous_y = self.__previous_center
+        current_x, current_y = self._rect.center
+        return self._rect.move(round((previous_x - current_x) * (1 - alpha)), round((previous_y - current_y) * (1 - alpha)))
 
-    def __change_color(self, color: tuple[int, int, int]):
-        self._image = self._image.copy()  # Make a copy of the original image
-        self._image.fill(color, special_flags=pygame.BLEND_MULT)  # Change color
-        self._image.set_colorkey((0, 0, 0))  # Set transparency if necessary
+    def _set_image(self, image: pygame.Surface, mask: pygame.mask.Mask = None):
+        """Shows an image, tinted while the sprite flashes from damage.
+
+        Args:
+            image (pygame.Surface): The untinted image.
+            mask (pygame.mask.Mask): The mask of the image, or None to keep the current one.
+        """
+        self.__plain_image = image
+        if mask is not None:
+            self._mask = mask
+        if self.__is_in_damage_countdown > 0:
+            image = AssetCache().get_tinted(image, self.DAMAGE_COLOR)
+        self._image = image
 
     def __decrease_damage_countdown(self):
         self.__is_in_damage_countdown -= 1
         if self.__is_in_damage_countdown <= 0:
             self.__is_in_damage_countdown = 0
-            self.__restore_image()
+            self._image = self.__plain_image
 
     def take_damage(self):
         """Take damage."""
-        self.__original_image = self._image
-        self.__change_color((255, 0, 0))
-        self.__is_in_damage_countdown = 30
+        self.__is_in_damage_countdown = self.DAMAGE_FLASH_TICKS
+        self._image = AssetCache().get_tinted(self.__plain_image, self.DAMAGE_COLOR)
 
     def update(self, *args, **kwargs):
         """Update the sprite behavior"""
@@ -79,40 +130,33 @@ class Sprite(pygame.sprite.Sprite):
         if self.__is_in_damage_countdown > 0:
             self.__decrease_damage_countdown()
 
+    def __apply_transform(self):
+        # Variants are shared through the cache, so transforming never compounds resampling
+        self._set_image(*AssetCache().get_transformed(
+            self.__source_image, self.__size, self.__angle, self.__flip_x, self.__flip_y
+        ))
+        self._rect = self._image.get_rect(center=self._rect.center)
+
     def scale_image(self, scale_factor: float):
         """Scales the image by a scale factor.
 
         Args:
             scale_factor (float): The factor by which to scale the image.
         """
-        original_size = self.__original_image.get_size()
-        new_width = int(original_size[0] * scale_factor)
-        new_height = int(original_size[1] * scale_factor)
-        
-        # Scale the image
-        self._image = pygame.transform.scale(self._image, (new_width, new_height))
-        
-        # Update the mask
-        self._mask = pygame.mask.from_surface(self._image)
-        
-        # Update the rect size and center to maintain position
-        self._rect = self._image.get_rect(center=self.rect.center)
-
+        original_size = self.__source_image.get_size()
+        self.__size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
+        self.__apply_transform()
 
     def rotate(self, angle: float):
         """Rotate the sprite's image by the specified angle.
 
+        The total rotation is rounded to `AssetCache.ROTATION_STEP` degrees.
+
         Args:
             angle (float): The angle in degrees to rotate the image.
         """
-        # Rotate the image
-        self._image = pygame.transform.rotate(self._image, angle)
-        
-        # Update the mask
-        self._mask = pygame.mask.from_surface(self._image)
-        
-        # Update the rect to maintain the center position
-        self._rect = self._image.get_rect(center=self._rect.center)
+        self.__angle = (self.__angle + angle) % 360
+        self.__apply_transform()
 
     def flip(self, horizontal: bool = False, vertical: bool = False):
         """Flip the sprite's image horizontally and/or vertically.
@@ -121,14 +165,9 @@ class Sprite(pygame.sprite.Sprite):
             horizontal (bool): If True, flip the image horizontally.
             vertical (bool): If True, flip the image vertically.
         """
-        # Flip the image based on the arguments
-        self._image = pygame.transform.flip(self._image, horizontal, vertical)
-        
-        # Update the mask
-        self._mask = pygame.mask.from_surface(self._image)
-        
-        # Update the rect to maintain the center position
-        self._rect = self._image.get_rect(center=self._rect.center)
+        self.__flip_x ^= bool(horizontal)
+        self.__flip_y ^= bool(vertical)
+        self.__apply_transform()
 
 
 
@@ -139,17 +178,17 @@ class PlayerSprite(Sprite):
     IDLE_POSITIONS = [0,1,2,3,4,5,6,7]
     WALKING_POSITIONS = [8,9,10,11,12,13,14,15]
     SCALE = 2
+    _atlas: AnimationAtlas = None  # Built by the first player sprite and shared afterwards
 
     def __init__(self, pos_x: float, pos_y: float):
-        self._image: pygame.Surface =  pygame.image.load(self.ASSET_FOLDER + "1.png").convert_alpha()
-        self.__scale()
-        self._rect: pygame.Rect = self._image.get_rect(center=(int(pos_x), int(pos_y)))
+        image, mask = self.__get_atlas().get_frame(1, False)
+        self._rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         self.__frame_count = 0
         self.__frame_delay = 6
         self.__idle_frame = 0
         self.__walk_frames = 0
         self.__facing_right = False
-        super().__init__(self._image, self._rect)
+        super().__init__(image, self._rect, mask=mask)
     
     def set_facing_right(self):
         self.__facing_right = True
@@ -157,9 +196,15 @@ class PlayerSprite(Sprite):
     def set_facing_left(self):
         self.__facing_right = False
 
-    def __scale(self):
-        scaled_dimensions = tuple(d * self.SCALE for d in settings.TILE_DIMENSION)
-        self._image = pygame.transform.scale(self._image, scaled_dimensions).convert_alpha()
+    @classmethod
+    def __get_atlas(cls) -> AnimationAtlas:
+        if cls._atlas is None:
+            scaled_dimensions = tuple(d * cls.SCALE for d in settings.TILE_DIMENSION)
+            cls._atlas = AnimationAtlas(cls.ASSET_FOLDER, cls.IDLE_POSITIONS + cls.WALKING_POSITIONS, scaled_dimensions)
+        return cls._atlas
+
+    def __set_frame(self, position: int):
+        self._set_image(*self.__get_atlas().get_frame(position, self.__facing_right))
     
     def idle_sprite_update(self):
         self.__frame_count += 1
@@ -173,14 +218,10 @@ class PlayerSprite(Sprite):
             self.__walking_set_image()
 
     def __walking_set_image(self):
-        self._image: pygame.Surface =  pygame.image.load(self.ASSET_FOLDER + str(self.WALKING_POSITIONS[self.__walk_frames]) + ".png").convert_alpha()
-        self.__scale()
-        self.flip(self.__facing_right)
+        self.__set_frame(self.WALKING_POSITIONS[self.__walk_frames])
         self.__walk_frames = (self.__walk_frames + 1) % 7
     def __idle_set_image(self):
-        self._image: pygame.Surface =  pygame.image.load(self.ASSET_FOLDER + str(self.IDLE_POSITIONS[self.__idle_frame]) + ".png").convert_alpha()
-        self.__scale()
-        self.flip(self.__facing_right)
+        self.__set_frame(self.IDLE_POSITIONS[self.__idle_frame])
         self.__idle_frame = (self.__idle_frame + 1) % 7
 
 
@@ -190,17 +231,34 @@ class MonsterSprite(Sprite):
     ASSET_FOLDER = "./assets/enemies/"
 
     def __init__(self, pos_x: float, pos_y: float, file_name : str):
-        image: pygame.Surface = pygame.image.load(MonsterSprite.ASSET_FOLDER + file_name + ".png").convert_alpha()
-        image = pygame.transform.scale(image, settings.TILE_DIMENSION)
+        image, mask = self.__load(file_name)
         rect: pygame.rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         self.__flipped = False
-        super().__init__(image, rect)
-    
+        super().__init__(image, rect, mask=mask)
+
+    @staticmethod
+    def __load(file_name: str) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        cache = AssetCache()
+        image: pygame.Surface = cache.get_image(MonsterSprite.ASSET_FOLDER + file_name + ".png", settings.TILE_DIMENSION)
+        return image, cache.get_mask(image)
+
+    def reset(self, pos_x: float, pos_y: float, file_name: str):
+        """Reuses the sprite for another monster.
+
+        Args:
+            pos_x (float): The x-coordinate of the sprite.
+            pos_y (float): The y-coordinate of the sprite.
+            file_name (str): The name of the monster image.
+        """
+        image, mask = self.__load(file_name)
+        self.__flipped = False
+        self._restart(image, image.get_rect(center=(int(pos_x), int(pos_y))), mask)
 
     def flip(self, horizontal = False, _ = False):
+        """Faces the monster left if `horizontal` is True and right otherwise."""
         if horizontal != self.__flipped:
             self.__flipped = horizontal
-            return super().flip(horizontal, False)
+            return super().flip(True, False)
 
 
 
@@ -208,11 +266,24 @@ class MonsterSprite(Sprite):
 class ImageSprite(Sprite):
     """A simple sprite for loading images"""
     def __init__(self, pos_x: float, pos_y: float, image_to_load : str):
-        image : pygame.Surface  = pygame.image.load(image_to_load).convert_alpha()
-        image = pygame.transform.scale(image, settings.TILE_DIMENSION)
+        cache = AssetCache()
+        image : pygame.Surface = cache.get_image(image_to_load, settings.TILE_DIMENSION)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         self._path = image_to_load
-        super().__init__(image, rect)
+        super().__init__(image, rect, mask=cache.get_mask(image))
+
+    def reset(self, pos_x: float, pos_y: float, image_to_load: str):
+        """Reuses the sprite, with its image unscaled and unrotated.
+
+        Args:
+            pos_x (float): The x-coordinate of the sprite.
+            pos_y (float): The y-coordinate of the sprite.
+            image_to_load (str): The path of the image.
+        """
+        cache = AssetCache()
+        image = cache.get_image(image_to_load, settings.TILE_DIMENSION)
+        self._path = image_to_load
+        self._restart(image, image.get_rect(center=(int(pos_x), int(pos_y))), cache.get_mask(image))
     
     @property
     def image_path(self):
@@ -221,13 +292,19 @@ class ImageSprite(Sprite):
 class CircleBullet(Sprite):
     """A class representing a circle bullet."""
     def __init__(self, pos_x: float, pos_y: float, radius: int = 5, color = (0,0,0)):
-        # Create a surface with alpha transparency
-        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)  
-        # Draw a green circle
-        pygame.draw.circle(image, color, (radius, radius), radius)  
+        cache = AssetCache()
+        image = cache.get_surface(("circle", radius, tuple(color)), lambda: self.__draw_circle(radius, color))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
-        super().__init__(image, rect)
+        super().__init__(image, rect, mask=cache.get_mask(image))
+
+    @staticmethod
+    def __draw_circle(radius: int, color) -> pygame.Surface:
+        # Create a surface with alpha transparency
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        # Draw a green circle
+        pygame.draw.circle(image, color, (radius, radius), radius)
+        return image
 
 class ExperienceGemSprite(Sprite):
     """A class representing the experience gem sprite."""
@@ -251,24 +328,37 @@ class ExperienceGemSprite(Sprite):
 
 
     def __init__(self, pos_x: float, pos_y: float, level: int):
+        image = self.__load(level)
+        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+        super().__init__(image, rect, mask=AssetCache().get_mask(image))
+
+    def __load(self, level: int) -> pygame.Surface:
         color = random.choice(self.COLORS)
         gem_size, n_frames = self.GEM_SIZES.get(level, ((self.RESOLUTION, self.RESOLUTION), 10))
         self.__frames = n_frames
         self.__frame_counter = 0  # To track the frame delay
-        self.__tileset = Tileset(
+        self.__current_frame = 0
+        self.__tileset = AssetCache().get_tileset(
             ExperienceGemSprite.ASSET + f"GEM {level}/GEM {level} - {color} - Spritesheet.png",
             gem_size[0], gem_size[1], self.__frames, 1
         )
-        image = self.__tileset.get_tile(0)
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, rect)
-        self.__current_frame = 0
+        return self.__tileset.get_tile(0)
+
+    def reset(self, pos_x: float, pos_y: float, level: int):
+        """Reuses the sprite for another gem.
+
+        Args:
+            pos_x (float): The x-coordinate of the sprite.
+            pos_y (float): The y-coordinate of the sprite.
+            level (int): The level of the gem.
+        """
+        image = self.__load(level)
+        self._restart(image, image.get_rect(center=(int(pos_x), int(pos_y))), AssetCache().get_mask(image))
 
     def update(self, *args, **kwargs):
         self.__frame_counter += 1
         if self.__frame_counter >= self.FRAME_DELAY:
             self.__frame_counter = 0
             self.__current_frame = (self.__current_frame + 1) % self.__frames
-            image = self.__tileset.get_tile(self.__current_frame)
-            self._image = image
+            self._set_image(self.__tileset.get_tile(self.__current_frame))
         
\ No newline at end of file
@@ -11,7 +11,9 @@ class Tileset:
         self.tile_height = tile_height
         self.tiles = []
 
-        image = pygame.image.load(filename).convert_alpha()
+        image = pygame.image.load(filename)
+        if pygame.display.get_surface() is not None:  # Headless simulations have no display to convert to
+            image = image.convert_alpha()
         image = pygame.transform.scale(image, (columns * tile_width, rows * tile_height))
         image_width, image_height = image.get_size()
 
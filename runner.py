@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
-"""Runs the game"""
+"""Runs the game
+
+Usage:
+    python runner.py
+    python runner.py simulate --ticks 10000 --policy kite --seed 42
+"""
+import argparse
 import logging
+import random
+import tempfile
 
 import pygame
 
+import settings
 from business.world.game_world import GameWorld
 from business.world.monster_spawner import MonsterSpawner
+from business.world.monster_store import MonsterStore
 from business.world.tile_map import TileMap
 from game.game import Game
+from game.headless import POLICIES, HeadlessSimulation, ScriptedInputHandler
 from presentation.display import Display
 from presentation.input_handler import InputHandler
 from persistance.playerDAO import PlayerDAO
@@ -16,39 +27,50 @@ from persistance.xpDAO import xpDAO
 from persistance.monsterDAO import MonsterDAO
 from persistance.clockDAO import ClockDAO
 from persistance.bulletDAO import BulletDAO
+from persistance.save_snapshot import SaveSnapshot
 
 SAVE_FOLDER = "data/"
-XP_FILE = "xp.json"
-ENEMY_FILE = 'monster.json'
-INVENTORY_FILE = 'inventory.json'
-PLAYER_FILE = 'player.json'
-CLOCK_FILE = 'clock.json'
-BULLET_FILE = 'bullet.json'
+SAVE_FILE = "save.dat"
+# The version 1 save, read until the game saves again
+PREVIOUS_SAVE_FILE = "save.json"
+# The files each DAO kept its part of the save in before the snapshot, read to migrate old saves
+LEGACY_SAVE_FILES = ["xp.json", 'monster.json', 'inventory.json', 'player.json', 'clock.json', 'bullet.json']
 
 
-def initialize_game_world():
+def initialize_game_world(save_folder: str = SAVE_FOLDER):
     """Initializes the game world"""
     monster_spawner = MonsterSpawner()
     tile_map = TileMap()
-    xp_dao = xpDAO(SAVE_FOLDER + XP_FILE)
-    enemy_dao = MonsterDAO(SAVE_FOLDER + ENEMY_FILE)
-    inventory_dao = InventoryDao(SAVE_FOLDER + INVENTORY_FILE)
-    player_dao = PlayerDAO(SAVE_FOLDER + PLAYER_FILE)
-    clock_dao = ClockDAO(SAVE_FOLDER + CLOCK_FILE)
-    bullet_dao = BulletDAO(SAVE_FOLDER + BULLET_FILE)
-    return GameWorld(monster_spawner, tile_map, player_dao.load_player(inventory_dao.load_inventory()),xp_dao,enemy_dao,inventory_dao,player_dao, clock_dao, bullet_dao)
+    snapshot = SaveSnapshot(save_folder + SAVE_FILE, [save_folder + file for file in LEGACY_SAVE_FILES], save_folder + PREVIOUS_SAVE_FILE)
+    xp_dao = xpDAO(snapshot)
+    enemy_dao = MonsterDAO(snapshot)
+    inventory_dao = InventoryDao(snapshot)
+    player_dao = PlayerDAO(snapshot)
+    clock_dao = ClockDAO(snapshot)
+    bullet_dao = BulletDAO(snapshot)
+    monster_store = MonsterStore() if settings.USE_MONSTER_ARRAY_STORE and MonsterStore.is_available() else None
+    return GameWorld(monster_spawner, tile_map, player_dao.load_player(inventory_dao.load_inventory()),xp_dao,enemy_dao,inventory_dao,player_dao, clock_dao, bullet_dao, monster_store, snapshot)
 
 
-def main():
-    """Main function to run the game"""
+def simulate(ticks: int, policy: str, seed: int, sample_every: int, trace_memory: bool):
+    """Runs the game world without a window and prints a report"""
+    random.seed(seed)
+    # A fresh save folder, so the run neither loads nor overwrites the player's game
+    with tempfile.TemporaryDirectory() as save_folder:
+        world = initialize_game_world(save_folder + "/")
+        rng = random.Random(seed)
+        simulation = HeadlessSimulation(world, ScriptedInputHandler(world, policy, rng), rng)
+        report = simulation.run(ticks, sample_every, trace_memory)
+    print(f"policy {policy}, seed {seed}")
+    print(report)
+
+
+def play():
+    """Runs the game in a window"""
     # Initialize pygame
     pygame.init()
     icon = pygame.image.load("icon.png")
     pygame.display.set_icon(icon)
-    logging.basicConfig(
-        level=logging.INFO,  # Change between INFO, WARNING or DEBUG as needed
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
 
     # Initialize the game objects
     display = Display()
@@ -62,5 +84,27 @@ def main():
     pygame.quit()
 
 
+def main():
+    """Main function to run the game"""
+    parser = argparse.ArgumentParser(description=settings.GAME_TITLE)
+    subparsers = parser.add_subparsers(dest="command")
+    simulate_parser = subparsers.add_parser("simulate", help="run the game world headless and report its performance")
+    simulate_parser.add_argument("--ticks", type=int, default=3600, help="number of ticks to simulate")
+    simulate_parser.add_argument("--policy", choices=POLICIES.keys(), default="random", help="how the player moves")
+    simulate_parser.add_argument("--seed", type=int, default=0, help="seed for every random choice of the run")
+    simulate_parser.add_argument("--sample-every", type=int, default=600, help="ticks between entity count samples")
+    simulate_parser.add_argument("--trace-memory", action="store_true", help="trace the memory Python allocates, which slows the run down")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,  # Change between INFO, WARNING or DEBUG as needed
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if args.command == "simulate":
+        simulate(args.ticks, args.policy, args.seed, args.sample_every, args.trace_memory)
+    else:
+        play()
+
+
 if __name__ == "__main__":
     main()
@@ -1,6 +1,15 @@
 # Display
 GAME_TITLE = "Vampire survivors"
 FPS = 60
+TICK_RATE = 60  # Simulation steps per second; speeds are in pixels per step
+MAX_CATCH_UP_STEPS = 5  # Steps a slow frame may run before the rest of the lag is dropped
+
+# Simulation
+USE_MONSTER_ARRAY_STORE = False  # Moves monsters with NumPy when it is installed
+GEM_MERGE_INTERVAL = 1000  # Milliseconds between passes that merge experience gems
+GEM_MERGE_RADIUS = 96  # Off-screen gems in the same square of this side are merged
+MAX_EXPERIENCE_GEMS = 200  # The farthest gems beyond this count are merged into one
+AUTOSAVE_INTERVAL = 60000  # Milliseconds of play between autosaves, or 0 to disable them
 
 # Tile dimensions
 TILE_HEIGHT = 48  # 32
@@ -14,12 +23,18 @@ SCREEN_WIDTH = SCREEN_COLUMNS * TILE_WIDTH
 SCREEN_HEIGHT = SCREEN_ROWS * TILE_HEIGHT
 SCREEN_DIMENSION = (SCREEN_WIDTH, SCREEN_HEIGHT)
 
+# Monster level of detail tiers, nearest first: (pixels outside the screen, ticks between updates).
+# Monsters in a tier updated every tick get the full update; the others move on a cheap path
+# without animation or crowd separation. Monsters beyond every limit use the last tier.
+MONSTER_LOD_TIERS = [(2 * TILE_WIDTH, 1), (SCREEN_WIDTH // 2, 3), (None, 6)]
+
 # World dimensions
 WORLD_COLUMNS = 35
 WORLD_ROWS = 35
 WORLD_WIDTH = WORLD_COLUMNS * TILE_WIDTH
 WORLD_HEIGHT = WORLD_ROWS * TILE_HEIGHT
 WORLD_DIMENSION = (WORLD_WIDTH, WORLD_HEIGHT)
+GROUND_CHUNK_SIZE = 16  # Tiles per side of each pre-rendered ground chunk
 
 # Colors
 BG_COLOR = (0, 0, 0)  # Black
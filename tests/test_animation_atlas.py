@@ -0,0 +1,33 @@
+import os
+import unittest
+import pygame
+from presentation.animation_atlas import AnimationAtlas
+from presentation.sprite import PlayerSprite
+
+
+class TestAnimationAtlas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_right_facing_frame_is_the_flipped_image(self):
+        atlas = AnimationAtlas(PlayerSprite.ASSET_FOLDER, [8], (32, 32))
+        left, left_mask = atlas.get_frame(8, False)
+        right, right_mask = atlas.get_frame(8, True)
+        self.assertEqual(right.get_at((0, 0)), left.get_at((31, 0)))
+        self.assertEqual(right_mask.count(), left_mask.count())
+
+    def test_player_animation_swaps_shared_frames(self):
+        first = PlayerSprite(0, 0)
+        second = PlayerSprite(0, 0)
+        for _ in range(7):
+            first.walking_sprite_update()
+            second.walking_sprite_update()
+        self.assertIs(first.image, second.image)
+        self.assertIs(first.mask, second.mask)
+
+
+if __name__ == "__main__":
+    unittest.main()
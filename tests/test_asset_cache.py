@@ -0,0 +1,134 @@
+import unittest
+import pygame
+from presentation.asset_cache import AssetCache
+from presentation.sprite import Sprite
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = AssetCache()
+        self.cache.clear()
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_cache_is_a_singleton(self):
+        self.assertIs(AssetCache(), self.cache)
+
+    def test_get_surface_builds_each_key_once(self):
+        calls = []
+
+        def create():
+            calls.append(1)
+            return pygame.Surface((4, 4))
+
+        first = self.cache.get_surface(("square", 4), create)
+        second = self.cache.get_surface(("square", 4), create)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_get_mask_is_shared_per_surface(self):
+        surface = self.cache.get_surface(("square", 4), lambda: pygame.Surface((4, 4), pygame.SRCALPHA))
+        self.assertIs(self.cache.get_mask(surface), self.cache.get_mask(surface))
+        self.assertIsNot(self.cache.get_mask(surface), self.cache.get_mask(pygame.Surface((4, 4))))
+
+    def test_clear_resets_counters(self):
+        self.cache.get_surface(("square", 4), lambda: pygame.Surface((4, 4)))
+        self.cache.clear()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_get_transformed_shares_variants_per_quantized_angle(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        surface, mask = self.cache.get_transformed(image, (16, 8), 44.2)
+        same_surface, same_mask = self.cache.get_transformed(image, (16, 8), 45.9)
+        self.assertIs(surface, same_surface)
+        self.assertIs(mask, same_mask)
+        self.assertIsNot(self.cache.get_transformed(image, (16, 8), 90)[0], surface)
+        self.assertIsNot(self.cache.get_transformed(image, (16, 8), 45, flip_x=True)[0], surface)
+
+    def test_get_transformed_builds_scale_rotation_and_mask(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        image.fill((255, 255, 255, 255))
+        surface, mask = self.cache.get_transformed(image, (16, 8), 90)
+        self.assertEqual(surface.get_size(), (8, 16))
+        self.assertEqual(mask.get_size(), (8, 16))
+        self.assertEqual(mask.count(), 8 * 16)
+
+    def test_get_transformed_returns_the_image_without_a_transform(self):
+        image = pygame.Surface((8, 4))
+        surface, mask = self.cache.get_transformed(image, (8, 4), 360)
+        self.assertIs(surface, image)
+        self.assertIs(mask, self.cache.get_mask(image))
+
+    def test_sprites_share_transformed_images(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        first = Sprite(image, image.get_rect())
+        second = Sprite(image, image.get_rect())
+        for sprite in (first, second):
+            sprite.scale_image(2)
+            sprite.rotate(-30)
+        self.assertIs(first.image, second.image)
+        self.assertIs(first.mask, second.mask)
+
+    def test_flipping_twice_restores_the_image(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        sprite = Sprite(image, image.get_rect())
+        sprite.flip(True)
+        self.assertIsNot(sprite.image, image)
+        sprite.flip(True)
+        self.assertIs(sprite.image, image)
+
+    def test_get_tinted_is_shared_per_surface_and_color(self):
+        image = pygame.Surface((4, 4))
+        image.fill((255, 255, 255))
+        tinted = self.cache.get_tinted(image, (255, 0, 0))
+        self.assertIs(self.cache.get_tinted(image, (255, 0, 0)), tinted)
+        self.assertIsNot(self.cache.get_tinted(image, (0, 255, 0)), tinted)
+        self.assertEqual(tuple(tinted.get_at((0, 0)))[:3], (255, 0, 0))
+        self.assertEqual(tuple(image.get_at((0, 0)))[:3], (255, 255, 255))
+
+    def test_damage_flash_swaps_in_the_tint_and_back(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        sprite = Sprite(image, image.get_rect())
+        sprite.take_damage()
+        tinted = sprite.image
+        self.assertIs(tinted, self.cache.get_tinted(image, Sprite.DAMAGE_COLOR))
+        sprite.take_damage()
+        self.assertIs(sprite.image, tinted)
+        for _ in range(Sprite.DAMAGE_FLASH_TICKS):
+            sprite.update()
+        self.assertIs(sprite.image, image)
+
+    def test_transforming_during_the_flash_keeps_the_tint(self):
+        image = pygame.Surface((8, 4), pygame.SRCALPHA)
+        sprite = Sprite(image, image.get_rect())
+        sprite.take_damage()
+        sprite.flip(True)
+        flipped, _ = self.cache.get_transformed(image, flip_x=True)
+        self.assertIs(sprite.image, self.cache.get_tinted(flipped, Sprite.DAMAGE_COLOR))
+        for _ in range(Sprite.DAMAGE_FLASH_TICKS):
+            sprite.update()
+        self.assertIs(sprite.image, flipped)
+
+    def test_masks_are_interned_by_shape(self):
+        red = pygame.Surface((4, 4))
+        red.fill((255, 0, 0))
+        blue = pygame.Surface((4, 4))
+        blue.fill((0, 0, 255))
+        self.assertIs(self.cache.get_mask(red), self.cache.get_mask(blue))
+        self.assertEqual(self.cache.masks_built, 2)
+        self.assertEqual(len(self.cache.get_interned_masks()), 1)
+
+    def test_symmetric_variants_share_the_mask(self):
+        image = pygame.Surface((4, 4))
+        _, mask = self.cache.get_transformed(image, flip_x=True)
+        self.assertIs(mask, self.cache.get_mask(image))
+
+    def test_sprites_without_a_mask_use_the_shared_one(self):
+        image = pygame.Surface((4, 4))
+        self.assertIs(Sprite(image, image.get_rect()).mask, Sprite(image, image.get_rect()).mask)
+
+
+if __name__ == "__main__":
+    unittest.main()
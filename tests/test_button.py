@@ -0,0 +1,26 @@
+import os
+import unittest
+import pygame
+from presentation.button import FramedImage
+
+
+class TestFramedImage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_same_icon_shares_the_composited_surface(self):
+        first = FramedImage("./assets/items/Armor.png", (64, 64))
+        second = FramedImage("./assets/items/Armor.png", (64, 64))
+        self.assertIs(first.framed_image, second.framed_image)
+        self.assertEqual(first.framed_image.get_size(), (68, 68))
+
+    def test_frame_is_drawn_around_the_icon(self):
+        framed = FramedImage("./assets/items/Armor.png", (64, 64), frame_color=(255, 215, 0))
+        self.assertEqual(framed.framed_image.get_at((0, 0)), pygame.Color(255, 215, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from business.handlers.cooldown_handler import CooldownHandler
+from business.handlers.cooldown_scheduler import CooldownScheduler
+from business.world.ingameclock import InGameClock
+
+
+class TestCooldownHandler(unittest.TestCase):
+    def setUp(self):
+        InGameClock().reset()
+        CooldownScheduler().clear()
+
+    def advance(self, seconds):
+        InGameClock().update(seconds)
+        CooldownScheduler().advance(InGameClock().time_elapsed)
+
+    def test_ready_once_the_cooldown_runs_out(self):
+        handler = CooldownHandler(500)
+        self.advance(0.4)
+        self.assertFalse(handler.is_action_ready())
+        self.advance(0.1)
+        self.assertTrue(handler.is_action_ready())
+        self.assertEqual(len(CooldownScheduler()), 0)
+
+    def test_restarting_the_cooldown_ignores_the_earlier_one(self):
+        handler = CooldownHandler(500)
+        self.advance(0.3)
+        handler.put_on_cooldown()
+        self.advance(0.3)
+        self.assertFalse(handler.is_action_ready())
+        self.advance(0.2)
+        self.assertTrue(handler.is_action_ready())
+
+    def test_new_cooldown_time_applies_from_the_next_cooldown(self):
+        handler = CooldownHandler(1000)
+        handler.cooldown_time = 100
+        self.advance(0.1)
+        self.assertFalse(handler.is_action_ready())
+        handler.put_on_cooldown()
+        self.advance(0.1)
+        self.assertTrue(handler.is_action_ready())
+
+    def test_zero_cooldown_is_always_ready(self):
+        self.assertTrue(CooldownHandler(0).is_action_ready())
+        self.assertEqual(len(CooldownScheduler()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,53 +1,154 @@
+import json
+import os
+import tempfile
 import unittest
-import pygame
-from unittest.mock import patch, mock_open, MagicMock, PropertyMock
+from unittest.mock import patch, MagicMock, PropertyMock
 from persistance.clockDAO import ClockDAO
 from persistance.xpDAO import xpDAO
-from presentation.sprite import Sprite
+from persistance.columnar import ColumnarTable
+from persistance.save_snapshot import SaveSnapshot
 from business.world.ingameclock import InGameClock
 from business.entities.interfaces import IExperienceGem
 
 
-class TestClockDAO(unittest.TestCase):
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "save.json")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def read_save(self, section: str):
+        return SaveSnapshot(self.path).get(section)
+
+
+class TestClockDAO(SnapshotTestCase):
 
-    @patch('builtins.open', new_callable=mock_open)
     @patch.object(InGameClock, 'time_elapsed', new_callable=PropertyMock)
-    @patch.object(ClockDAO, '_ClockDAO__read_from_json')  # Mock the reading method
-    def test_save_time(self, mock_read_json, mock_time_elapsed, mock_file):
+    def test_save_time(self, mock_time_elapsed):
         expected_value = 42
         mock_time_elapsed.return_value = expected_value
-        mock_read_json.return_value = {}  
-        clock_dao = ClockDAO('mock_path.json')
+        clock_dao = ClockDAO(SaveSnapshot(self.path))
         clock_dao.save_time()
         self.assertEqual(clock_dao.load_time(),expected_value)
+        self.assertEqual(ClockDAO(SaveSnapshot(self.path)).load_time(), expected_value)
 
-
-    @patch('builtins.open', new_callable=mock_open, read_data='{"Time": 42.0}')
-    def test_load_time(self, mock_file):
-        clock_dao = ClockDAO('mock_path.json')
+    def test_load_time(self):
+        with open(self.path, 'w') as json_file:
+            json.dump({"version": 1, "sections": {"Time": 42.0}}, json_file)
+        clock_dao = ClockDAO(SaveSnapshot(self.path))
         time = clock_dao.load_time()
         self.assertEqual(time, 42.0)
 
-class TestXpDAO(unittest.TestCase):
+class TestXpDAO(SnapshotTestCase):
     
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.dump') 
-    @patch('json.load')  
-    def test_save_xp(self, mock_load, mock_dump, mock_file):
-        mock_load.return_value = {}  
-        xp_dao = xpDAO('mock_path.json')
+    def test_save_xp(self):
+        xp_dao = xpDAO(SaveSnapshot(self.path))
         experience_gems = [MagicMock(spec=IExperienceGem) for _ in range(2)]
         experience_gems[0].serialize.return_value = {"pos_x": 10, "pos_y": 20, "amount": 100}
         experience_gems[1].serialize.return_value = {"pos_x": 30, "pos_y": 40, "amount": 200}
         xp_dao.save_xp(experience_gems)
-        expected_data = {
-            "Experience": [
-                {"pos_x": 10, "pos_y": 20, "amount": 100},
-                {"pos_x": 30, "pos_y": 40, "amount": 200}
-            ]
-        }
-        mock_dump.assert_called_once_with(expected_data, mock_file(), indent=4)
+        table = SaveSnapshot(self.path).get_table("Experience", xpDAO.COLUMNS)
+        self.assertEqual(list(table.rows("pos_x", "pos_y", "amount")), [(10, 20, 100), (30, 40, 200)])
+        self.assertEqual(table.columns["amount"].typecode, "q")
+
+
+class TestSaveSnapshot(SnapshotTestCase):
+
+    def test_batch_writes_once(self):
+        snapshot = SaveSnapshot(self.path)
+        with patch('persistance.save_snapshot.os.replace', wraps=os.replace) as mock_replace:
+            with snapshot.batch():
+                snapshot.update({"Time": 1})
+                snapshot.update({"Bullets": []})
+                snapshot.remove("Time")
+            mock_replace.assert_called_once()
+        self.assertIsNone(self.read_save("Time"))
+        self.assertEqual(self.read_save("Bullets"), [])
+
+    def test_failed_write_keeps_the_previous_save(self):
+        snapshot = SaveSnapshot(self.path)
+        snapshot.update({"Time": 1})
+        with patch('persistance.save_snapshot.json.dumps', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                snapshot.update({"Time": 2})
+        self.assertEqual(self.read_save("Time"), 1)
+        self.assertEqual(os.listdir(self.folder.name), ["save.json"])
+
+    def test_file_is_read_once_and_sections_are_copies(self):
+        SaveSnapshot(self.path).update({"Player": {"health": 10}})
+        snapshot = SaveSnapshot(self.path)
+        with patch('builtins.open', wraps=open) as mock_open:
+            snapshot.get("Player")["health"] = 0
+            self.assertEqual(snapshot.get("Player"), {"health": 10})
+            self.assertEqual(mock_open.call_count, 1)
+
+    def test_other_versions_start_a_new_game(self):
+        with open(self.path, 'w') as json_file:
+            json.dump({"version": 3, "sections": {"Time": 42.0}}, json_file)
+        self.assertIsNone(SaveSnapshot(self.path).get("Time"))
+
+    def test_background_commit_writes_on_the_save_thread(self):
+        snapshot = SaveSnapshot(self.path)
+        with snapshot.batch(background=True):
+            snapshot.update({"Time": 1})
+        snapshot.wait()
+        self.assertFalse(snapshot.is_saving)
+        self.assertEqual(self.read_save("Time"), 1)
+        self.assertEqual(len(snapshot.timings), 1)
+        self.assertTrue(snapshot.timings[0].background)
+        self.assertGreater(snapshot.timings[0].write_ms, 0)
+
+    def test_commits_are_written_in_order(self):
+        snapshot = SaveSnapshot(self.path)
+        for time in range(5):
+            with snapshot.batch(background=True):
+                snapshot.update({"Time": time})
+        snapshot.update({"Time": 5})
+        self.assertEqual(self.read_save("Time"), 5)
+        self.assertEqual(len(snapshot.timings), 6)
+
+    def test_tables_round_trip_through_the_binary_format(self):
+        records = [{"pos_x": 1.5, "pos_y": 2, "name": "red_slime"}, {"pos_x": -3.25, "pos_y": 4, "name": "blue_slime"},
+                   {"pos_x": 0.0, "name": "red_slime"}]
+        defaults = {"pos_x": 0, "pos_y": 7, "name": "green_slime"}
+        snapshot = SaveSnapshot(self.path)
+        snapshot.update({"Monsters": ColumnarTable.from_records(records, defaults), "Time": 3})
+        saved = SaveSnapshot(self.path)
+        table = saved.get_table("Monsters", defaults)
+        self.assertEqual(list(table.rows("pos_x", "pos_y", "name")), [(1.5, 2, "red_slime"), (-3.25, 4, "blue_slime"), (0.0, 7, "red_slime")])
+        self.assertEqual(saved.get("Time"), 3)
+
+    def test_lists_of_records_are_read_as_tables(self):
+        snapshot = SaveSnapshot(self.path)
+        snapshot.update({"Experience": [{"pos_x": 1, "pos_y": 2}]})
+        table = snapshot.get_table("Experience", xpDAO.COLUMNS)
+        self.assertEqual(list(table.rows("pos_x", "pos_y", "amount")), [(1, 2, 1)])
+        self.assertEqual(len(snapshot.get_table("Bullets", {"pos_x": 0})), 0)
+
+    def test_legacy_files_are_migrated(self):
+        legacy_paths = []
+        for name, data in (("clock.json", {"Time": 42.0}), ("xp.json", {"Experience": []})):
+            legacy_paths.append(os.path.join(self.folder.name, name))
+            with open(legacy_paths[-1], 'w') as json_file:
+                json.dump(data, json_file)
+        snapshot = SaveSnapshot(self.path, legacy_paths + [os.path.join(self.folder.name, "missing.json")])
+        self.assertEqual(snapshot.get("Time"), 42.0)
+        self.assertEqual(snapshot.get("Experience"), [])
 
+    def test_version_1_save_is_read_before_the_legacy_files(self):
+        previous_path = os.path.join(self.folder.name, "previous.json")
+        with open(previous_path, 'w') as json_file:
+            json.dump({"version": 1, "sections": {"Time": 42.0}}, json_file)
+        legacy_path = os.path.join(self.folder.name, "clock.json")
+        with open(legacy_path, 'w') as json_file:
+            json.dump({"Time": 7.0}, json_file)
+        snapshot = SaveSnapshot(self.path, [legacy_path], previous_path)
+        self.assertEqual(snapshot.get("Time"), 42.0)
+        snapshot.update({"Bullets": []})
+        self.assertEqual(self.read_save("Time"), 42.0)
+        self.assertEqual(SaveSnapshot(self.path, [legacy_path], previous_path).get("Bullets"), [])
         
 
 if __name__ == "__main__":
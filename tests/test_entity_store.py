@@ -0,0 +1,81 @@
+import unittest
+from business.world.entity_store import EntityStore, EntityView
+
+
+class TestEntityStore(unittest.TestCase):
+    def setUp(self):
+        self.store = EntityStore(["a", "b", "c"])
+
+    def test_removed_entity_is_hidden_before_the_commit(self):
+        self.assertTrue(self.store.remove("b"))
+        self.assertEqual(list(self.store), ["a", "c"])
+        self.assertEqual(len(self.store), 2)
+        self.assertNotIn("b", self.store)
+
+    def test_removing_twice_is_ignored(self):
+        self.store.remove("b")
+        self.assertFalse(self.store.remove("b"))
+        self.assertFalse(self.store.remove("missing"))
+        self.assertEqual(self.store.commit_removals(), ["b"])
+
+    def test_commit_moves_the_last_entity_into_the_gap(self):
+        self.store.remove("a")
+        self.store.commit_removals()
+        self.assertEqual(list(self.store), ["c", "b"])
+
+    def test_handle_of_removed_entity_does_not_resolve_to_the_slot_reuser(self):
+        handle = self.store.get_handle("b")
+        self.store.remove("b")
+        self.assertIsNone(handle.entity)
+        self.store.commit_removals()
+        new_handle = self.store.add("d")
+        self.assertEqual(new_handle.slot, handle.slot)
+        self.assertIsNone(handle.entity)
+        self.assertEqual(new_handle.entity, "d")
+
+    def test_entity_added_again_before_the_commit_stays(self):
+        self.store.remove("b")
+        self.store.add("b")
+        self.store.commit_removals()
+        self.assertIn("b", self.store)
+        self.assertEqual(sorted(self.store), ["a", "b", "c"])
+
+    def test_iteration_skips_entities_added_while_iterating(self):
+        visited = []
+        for entity in self.store:
+            visited.append(entity)
+            self.store.add(entity + "!")
+        self.assertEqual(visited, ["a", "b", "c"])
+        self.assertEqual(len(self.store), 6)
+
+    def test_removing_while_iterating_keeps_the_remaining_entities(self):
+        self.store.remove("c")
+        visited = []
+        for entity in self.store:
+            visited.append(entity)
+            self.store.remove(entity)
+        self.assertEqual(visited, ["a", "b"])
+
+    def test_entity_removed_later_in_the_iteration_is_skipped(self):
+        visited = []
+        for entity in self.store:
+            visited.append(entity)
+            if entity == "a":
+                self.store.remove("b")
+        self.assertEqual(visited, ["a", "c"])
+
+
+class TestEntityView(unittest.TestCase):
+    def test_view_follows_the_store_without_copying(self):
+        store = EntityStore(["a"])
+        view = EntityView(store)
+        store.add("b")
+        store.remove("a")
+        self.assertEqual(list(view), ["b"])
+        self.assertEqual(len(view), 1)
+        self.assertIn("b", view)
+        self.assertFalse(hasattr(view, "add"))
+
+
+if __name__ == "__main__":
+    unittest.main()
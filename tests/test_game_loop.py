@@ -0,0 +1,75 @@
+import unittest
+import pygame
+from unittest.mock import MagicMock, patch
+import settings
+from game.game import Game
+from presentation.sprite import Sprite
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def __run_frames(self, frame_times_ms: list[float]):
+        """Runs one loop iteration per frame time and returns the game and its state."""
+        with patch("game.game.pygame") as mock_pygame:
+            mock_pygame.event.get.return_value = []
+            mock_pygame.time.Clock.return_value.tick.side_effect = frame_times_ms
+            game = Game(MagicMock(), MagicMock(), MagicMock())
+            state = MagicMock()
+            game.state = state
+            interpolations = []
+
+            def render(game):
+                interpolations.append(game.interpolation)
+                if len(interpolations) == len(frame_times_ms):
+                    game.running = False
+            state.render.side_effect = render
+            game.run()
+        return state, interpolations
+
+    def test_steps_follow_real_time(self):
+        step_ms = 1000 / settings.TICK_RATE
+        state, interpolations = self.__run_frames([step_ms * 0.5, step_ms * 0.5, step_ms * 2])
+        self.assertEqual(state.update.call_count, 3)
+        self.assertAlmostEqual(interpolations[0], 0.5)
+
+    def test_catch_up_is_capped_and_lag_is_dropped(self):
+        state, interpolations = self.__run_frames([5000, 1])
+        self.assertEqual(state.update.call_count, settings.MAX_CATCH_UP_STEPS)
+        self.assertLess(interpolations[0], 1)
+
+    def test_catch_up_stops_when_the_state_changes(self):
+        with patch("game.game.pygame") as mock_pygame:
+            mock_pygame.event.get.return_value = []
+            mock_pygame.time.Clock.return_value.tick.return_value = 1000 / settings.TICK_RATE * 4
+            game = Game(MagicMock(), MagicMock(), MagicMock())
+            first, second = MagicMock(), MagicMock()
+            first.update.side_effect = lambda game: game.change_state(second)
+            second.render.side_effect = lambda game: setattr(game, "running", False)
+            game.state = first
+            game.run()
+        first.update.assert_called_once()
+        second.update.assert_not_called()
+
+
+class TestSpriteInterpolation(unittest.TestCase):
+    def setUp(self):
+        self.sprite = Sprite(pygame.Surface((10, 10)), pygame.Rect(0, 0, 10, 10))
+        self.sprite.update_pos(100, 100)
+        self.sprite.snapshot_previous()
+
+    def test_interpolates_from_the_snapshot(self):
+        self.sprite.update_pos(110, 100)
+        self.sprite.update_pos(120, 100)
+        self.assertEqual(self.sprite.get_interpolated_rect(0.5).center, (110, 100))
+        self.assertEqual(self.sprite.get_interpolated_rect(1).center, (120, 100))
+
+    def test_sprite_that_did_not_move_this_step_is_drawn_where_it_is(self):
+        self.assertEqual(self.sprite.get_interpolated_rect(0).center, (100, 100))
+
+    def test_new_sprite_is_drawn_where_it_is_put(self):
+        sprite = Sprite(pygame.Surface((10, 10)), pygame.Rect(50, 47, 10, 10))
+        sprite.update_pos(105, 100)
+        self.assertEqual(sprite.get_interpolated_rect(0).center, (105, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import MagicMock
+
+import settings
+from business.entities.experience_gem import ExperienceGem
+from business.handlers.gem_merge_handler import GemMergeHandler
+
+
+class GemWorld:
+    def __init__(self, gems):
+        self.experience_gems = list(gems)
+        self.player = MagicMock(pos_x=0, pos_y=0)
+
+    def add_experience_gem(self, gem):
+        self.experience_gems.append(gem)
+
+    def remove_experience_gem(self, gem):
+        self.experience_gems.remove(gem)
+
+
+class TestGemMergeHandler(unittest.TestCase):
+    def test_close_gems_off_screen_are_merged_into_one(self):
+        world = GemWorld([ExperienceGem(1000, 1000, 2), ExperienceGem(1010, 1020, 3), ExperienceGem(1500, 1000, 9)])
+        GemMergeHandler.merge_nearby_gems(world, 96)
+        self.assertEqual(sorted(gem.amount for gem in world.experience_gems), [5, 9])
+        merged = next(gem for gem in world.experience_gems if gem.amount == 5)
+        self.assertEqual((merged.pos_x, merged.pos_y), (1005, 1010))
+
+    def test_gems_on_screen_are_not_merged(self):
+        world = GemWorld([ExperienceGem(10, 10, 2), ExperienceGem(12, 12, 3)])
+        GemMergeHandler.merge_nearby_gems(world, 96)
+        self.assertEqual(len(world.experience_gems), 2)
+
+    def test_gems_shown_near_the_edge_of_the_world_are_not_merged(self):
+        # The camera stops at x 0, so a player at x 100 sees up to the screen width
+        pos_y = settings.WORLD_HEIGHT / 2
+        world = GemWorld([ExperienceGem(settings.SCREEN_WIDTH - 60, pos_y, 2), ExperienceGem(settings.SCREEN_WIDTH - 50, pos_y, 3)])
+        world.player = MagicMock(pos_x=100, pos_y=pos_y)
+        GemMergeHandler.merge_nearby_gems(world, 96)
+        self.assertEqual(len(world.experience_gems), 2)
+
+    def test_farthest_gems_beyond_the_cap_are_merged(self):
+        world = GemWorld([ExperienceGem(distance, 0, 1) for distance in (100, 200, 300, 400)])
+        GemMergeHandler.merge_excess_gems(world, 2)
+        self.assertEqual(len(world.experience_gems), 2)
+        self.assertEqual(sorted((gem.pos_x, gem.amount) for gem in world.experience_gems), [(100, 1), (200, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import unittest
+import pygame
+import settings
+from business.world.tile_map import TileMap
+from presentation.ground_layer import GroundLayer
+from presentation.tileset import Tileset
+
+
+class TestGroundLayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        cls.tileset = Tileset("./assets/tiles/dungeon.png", settings.TILE_WIDTH, settings.TILE_HEIGHT, 15, 7)
+
+    def setUp(self):
+        self.tile_map = TileMap()
+        self.layer = GroundLayer(self.tileset, chunk_size=4)
+        self.layer.bake(self.tile_map)
+
+    def __draw_tiles(self, camera_rect):
+        # The ground drawn one tile at a time, as it was before the layer was baked
+        surface = pygame.Surface(camera_rect.size)
+        for row in range(settings.WORLD_ROWS):
+            for col in range(settings.WORLD_COLUMNS):
+                position = (col * settings.TILE_WIDTH - camera_rect.left, row * settings.TILE_HEIGHT - camera_rect.top)
+                surface.blit(self.tileset.get_tile(self.tile_map.get(row, col)), position)
+        return surface
+
+    def __draw_layer(self, camera_rect):
+        surface = pygame.Surface(camera_rect.size)
+        self.layer.draw(surface, camera_rect)
+        return surface
+
+    def test_draw_matches_drawing_every_tile(self):
+        camera_rect = pygame.Rect(170, 250, 300, 200)
+        for x, y in [(0, 0), (150, 100), (299, 199), (13, 187)]:
+            self.assertEqual(self.__draw_layer(camera_rect).get_at((x, y)), self.__draw_tiles(camera_rect).get_at((x, y)))
+
+    def test_changing_a_tile_rebakes_the_layer(self):
+        camera_rect = pygame.Rect(0, 0, 200, 200)
+        version = self.tile_map.version
+        self.tile_map.set(1, 1, 17)
+        self.assertEqual(self.tile_map.version, version + 1)
+        position = (settings.TILE_WIDTH + 20, settings.TILE_HEIGHT + 20)
+        self.assertEqual(self.__draw_layer(camera_rect).get_at(position), self.__draw_tiles(camera_rect).get_at(position))
+
+    def test_setting_the_same_tile_keeps_the_version(self):
+        version = self.tile_map.version
+        self.tile_map.set(0, 0, self.tile_map.get(0, 0))
+        self.assertEqual(self.tile_map.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
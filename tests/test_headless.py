@@ -0,0 +1,64 @@
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+from business.exceptions import DeadPlayerException, LevelUpException
+from game.headless import HeadlessSimulation, ScriptedInputHandler
+
+
+class TestScriptedInputHandler(unittest.TestCase):
+    def setUp(self):
+        self.world = MagicMock()
+        self.world.player.pos_x = 100
+        self.world.player.pos_y = 100
+
+    def test_idle_policy_keeps_the_player_still(self):
+        ScriptedInputHandler(self.world, "idle", random.Random(0)).process_input()
+        self.world.player.move.assert_called_once_with(0, 0)
+        self.world.player.sprite.idle_sprite_update.assert_called_once()
+
+    def test_kite_policy_walks_away_from_the_closest_monster(self):
+        near, far = MagicMock(pos_x=90, pos_y=120), MagicMock(pos_x=300, pos_y=0)
+        self.world.monsters = [far, near]
+        ScriptedInputHandler(self.world, "kite", random.Random(0)).process_input()
+        self.world.player.move.assert_called_once_with(1, -1)
+
+    def test_random_policy_only_changes_direction_every_half_second(self):
+        handler = ScriptedInputHandler(self.world, "random", random.Random(1))
+        for _ in range(30):
+            handler.process_input()
+        directions = {call.args for call in self.world.player.move.call_args_list}
+        self.assertEqual(len(directions), 1)
+
+
+class TestHeadlessSimulation(unittest.TestCase):
+    def setUp(self):
+        self.world = MagicMock()
+        self.world.monsters = []
+        self.world.bullets = []
+        self.world.experience_gems = []
+        self.input_handler = MagicMock()
+
+    @patch("game.headless.DeathHandler")
+    @patch("game.headless.CollisionHandler")
+    def test_run_picks_an_upgrade_on_level_up(self, _, death_handler):
+        upgrade = MagicMock()
+        self.world.player.inventory.get_possible_actions.return_value = [upgrade]
+        death_handler.check_deaths.side_effect = [LevelUpException(), None, None]
+        report = HeadlessSimulation(self.world, self.input_handler, random.Random(0)).run(3, sample_every=2)
+        upgrade.do_action.assert_called_once()
+        self.world.player.update_stats.assert_called_once()
+        self.assertEqual(report.level_ups, 1)
+        self.assertEqual(report.ticks, 3)
+        self.assertEqual([sample[0] for sample in report.samples], [0, 2, 3])
+
+    @patch("game.headless.DeathHandler")
+    @patch("game.headless.CollisionHandler")
+    def test_run_stops_when_the_player_dies(self, _, death_handler):
+        death_handler.check_deaths.side_effect = [None, DeadPlayerException()]
+        report = HeadlessSimulation(self.world, self.input_handler, random.Random(0)).run(10)
+        self.assertEqual(report.died_at, 1)
+        self.assertEqual(report.ticks, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
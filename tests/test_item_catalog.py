@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch, mock_open
+from business.weapons.exception import InvalidItemDataError
+from business.weapons.factories.passive_factory import PassiveItemFactory
+from business.weapons.item_catalog import ItemCatalog
+from business.weapons.upgrade import Upgrade
+
+
+class TestItemCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = ItemCatalog()
+        self.catalog.clear()
+
+    def tearDown(self):
+        self.catalog.clear()
+
+    def test_catalog_is_a_singleton(self):
+        self.assertIs(ItemCatalog(), self.catalog)
+
+    def test_data_file_is_parsed_once(self):
+        with patch('builtins.open', wraps=open) as mock_file:
+            for _ in range(3):
+                Upgrade("Green Wand")
+                PassiveItemFactory.get_all_passive_items()
+            self.assertEqual(mock_file.call_count, 1)
+
+    def test_items_are_indexed_by_name_and_type(self):
+        self.assertEqual(self.catalog.get_item("Green Wand")["type"], "weapon")
+        self.assertIn("Spinach", self.catalog.get_names("passive"))
+        self.assertNotIn("Spinach", self.catalog.get_names("weapon"))
+        self.assertEqual(len(self.catalog.get_item("Unknown item")), 0)
+
+    def test_items_are_read_only(self):
+        item = self.catalog.get_item("Green Wand")
+        with self.assertRaises(TypeError):
+            item["max_level"] = 100
+        with self.assertRaises(TypeError):
+            item["levels"][0]["damage"] = 100
+        self.assertIs(Upgrade("Green Wand").upgrades, item)
+
+    @patch('builtins.open', new_callable=mock_open, read_data='{"Wand": {"type": "weapon", "max_level": 2, "levels": [{"damage": "a lot"}]}}')
+    def test_invalid_levels_are_rejected(self, mock_file):
+        with self.assertRaises(InvalidItemDataError):
+            self.catalog.get_item("Wand")
+
+    @patch('builtins.open', new_callable=mock_open, read_data='{"Ring": {"type": "passive", "max_level": 2}}')
+    def test_passive_items_need_what_they_affect(self, mock_file):
+        with self.assertRaises(InvalidItemDataError):
+            self.catalog.get_item("Ring")
+
+
+if __name__ == "__main__":
+    unittest.main()
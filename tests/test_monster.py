@@ -1,4 +1,5 @@
 import unittest
+import pygame
 from unittest.mock import MagicMock, patch
 
 from business.entities.interfaces import IDamageable, IHasPosition
@@ -33,4 +34,28 @@ class TestMonster(unittest.TestCase):
 
     def test_take_damage_reduces_health(self):
         self.monster.take_damage(30)
-        self.assertEqual(self.monster.health, 70)
\ No newline at end of file
+        self.assertEqual(self.monster.health, 70)
+
+    def __create_world(self, blocker):
+        world = MagicMock()
+        world.player.pos_x = 100
+        world.player.pos_y = 5
+        world.find_crowd_blocker.return_value = blocker
+        return world
+
+    def test_update_moves_when_the_crowd_is_clear(self):
+        self.monster.sprite.rect = pygame.Rect(0, 0, 10, 10)
+        self.monster.update(self.__create_world(None))
+        self.assertEqual(self.monster.pos_x, 6)
+
+    def test_update_waits_behind_a_monster_closer_to_the_player(self):
+        self.monster.sprite.rect = pygame.Rect(0, 0, 10, 10)
+        blocker = Monster(50, 5, MagicMock(), MonsterStats(1,100,1,1,1), MagicMock())
+        self.monster.update(self.__create_world(blocker))
+        self.assertEqual(self.monster.pos_x, 5)
+
+    def test_update_pushes_past_a_monster_further_from_the_player(self):
+        self.monster.sprite.rect = pygame.Rect(0, 0, 10, 10)
+        blocker = Monster(-50, 5, MagicMock(), MonsterStats(1,100,1,1,1), MagicMock())
+        self.monster.update(self.__create_world(blocker))
+        self.assertEqual(self.monster.pos_x, 6)
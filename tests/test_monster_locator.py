@@ -0,0 +1,50 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+
+from business.world.monster_locator import MonsterLocator
+
+
+def make_monster(pos_x, pos_y):
+    return MagicMock(pos_x=pos_x, pos_y=pos_y)
+
+
+class TestMonsterLocator(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.monsters = [make_monster(rng.uniform(-500, 2000), rng.uniform(-500, 2000)) for _ in range(300)]
+        self.locator = MonsterLocator(self.monsters)
+
+    def distance(self, monster, pos_x, pos_y):
+        return ((monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2) ** 0.5
+
+    def test_nearest_matches_a_linear_scan(self):
+        for pos_x, pos_y in [(0, 0), (800, 900), (-3000, 5000), (1999, -499)]:
+            expected = sorted(self.monsters, key=lambda monster: self.distance(monster, pos_x, pos_y))[:5]
+            self.assertEqual(self.locator.find_nearest(pos_x, pos_y, 5), expected)
+            self.assertIs(self.locator.find_nearest(pos_x, pos_y)[0], expected[0])
+
+    def test_within_radius_and_area_keep_the_monster_order(self):
+        expected = [monster for monster in self.monsters if self.distance(monster, 700, 700) <= 250]
+        self.assertEqual(self.locator.find_within_radius(700, 700, 250), expected)
+        expected = [monster for monster in self.monsters if 100 <= monster.pos_x <= 1060 and 200 <= monster.pos_y <= 680]
+        self.assertEqual(self.locator.find_in_area(100, 200, 1060, 680), expected)
+
+    def test_positions_are_read_again_after_invalidating(self):
+        monster = make_monster(10, 10)
+        self.monsters.append(monster)
+        self.locator.invalidate()
+        self.assertIs(self.locator.find_nearest(10, 10)[0], monster)
+        monster.pos_x = monster.pos_y = 5000
+        self.assertIs(self.locator.find_nearest(10, 10)[0], monster)
+        self.locator.invalidate()
+        self.assertIsNot(self.locator.find_nearest(10, 10)[0], monster)
+
+    def test_no_monsters(self):
+        locator = MonsterLocator([])
+        self.assertEqual(locator.find_nearest(0, 0), [])
+        self.assertEqual(locator.find_in_area(0, 0, 100, 100), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
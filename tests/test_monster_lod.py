@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock
+
+import settings
+from business.entities.monster import Monster
+from business.weapons.stats import MonsterStats
+from business.world.monster_lod import MonsterLOD
+
+
+def at(pos_x, pos_y):
+    return MagicMock(pos_x=pos_x, pos_y=pos_y)
+
+
+class TestMonsterLOD(unittest.TestCase):
+    def setUp(self):
+        self.player = at(settings.WORLD_WIDTH / 2, settings.WORLD_HEIGHT / 2)
+        self.lod = MonsterLOD([(100, 1), (500, 3), (None, 6)])
+
+    def test_tiers_go_by_the_distance_outside_the_screen(self):
+        center_x, center_y = self.player.pos_x, self.player.pos_y
+        half_width = settings.SCREEN_WIDTH / 2
+        self.assertEqual(self.lod.get_update_interval(at(center_x + half_width + 100, center_y), self.player), 1)
+        self.assertEqual(self.lod.get_update_interval(at(center_x, center_y - settings.SCREEN_HEIGHT / 2 - 300), self.player), 3)
+        self.assertEqual(self.lod.get_update_interval(at(center_x + half_width + 501, center_y), self.player), 6)
+
+    def test_screen_stops_at_the_edge_of_the_world(self):
+        # The camera does not scroll left of x 0, so it shows up to the screen width
+        player = at(100, settings.WORLD_HEIGHT / 2)
+        visible = at(settings.SCREEN_WIDTH - 60, settings.WORLD_HEIGHT / 2)
+        self.assertEqual(self.lod.get_update_interval(visible, player), 1)
+        self.assertEqual(self.lod.split([visible], player), ([visible], []))
+        beyond = at(settings.SCREEN_WIDTH + 300, settings.WORLD_HEIGHT / 2)
+        self.assertEqual(self.lod.get_update_interval(beyond, player), 3)
+
+    def test_far_monsters_are_spread_over_their_ticks(self):
+        near = at(self.player.pos_x, self.player.pos_y)
+        far = [at(10_000, 0) for _ in range(6)]
+        updated = []
+        for _ in range(6):
+            full, coarse = self.lod.split([near] + far, self.player)
+            self.assertEqual(full, [near])
+            self.assertEqual(len(coarse), 1)
+            updated += [monster for monster, ticks in coarse if ticks == 6]
+        self.assertCountEqual(updated, far)
+
+    def test_coarse_update_covers_the_ticks(self):
+        monster = Monster(100, 0, MagicMock(), MonsterStats(2, 10, 1, 1000, 1), "green_slime")
+        world = MagicMock()
+        world.player = at(0, 0)
+        monster.update_coarse(world, 6)
+        self.assertEqual((monster.pos_x, monster.pos_y), (88, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import pygame
+from unittest.mock import MagicMock
+from business.entities.monster import Monster, MonsterStats
+from business.world.monster_store import MonsterStore
+
+
+@unittest.skipUnless(MonsterStore.is_available(), "numpy is not installed")
+class TestMonsterStore(unittest.TestCase):
+    def setUp(self):
+        self.store = MonsterStore(capacity=2)
+        self.player = MagicMock()
+        self.player.pos_x = 100
+        self.player.pos_y = 100
+        self.player.sprite.rect = pygame.Rect(90, 90, 20, 20)
+
+    def __add_monster(self, pos_x, pos_y, speed=2, health=10):
+        return self.store.add(Monster(pos_x, pos_y, MagicMock(), MonsterStats(speed, health, 3, 500, 9), "green_slime"))
+
+    def test_step_chases_the_player(self):
+        straight = self.__add_monster(0, 100)
+        diagonal = self.__add_monster(0, 0)
+        self.store.step(self.player)
+        self.assertAlmostEqual(straight.pos_x, 2)
+        self.assertAlmostEqual(straight.pos_y, 100)
+        self.assertAlmostEqual(diagonal.pos_x, 2 ** 0.5)
+        self.assertAlmostEqual(diagonal.pos_y, 2 ** 0.5)
+
+    def test_step_only_syncs_visible_sprites(self):
+        visible = self.__add_monster(150, 100)
+        hidden = self.__add_monster(5000, 5000)
+        self.store.step(self.player)
+        visible.sprite.update_pos.assert_called_once()
+        hidden.sprite.update_pos.assert_not_called()
+
+    def test_remove_moves_the_last_row_into_the_gap(self):
+        first = self.__add_monster(1, 1)
+        self.__add_monster(2, 2)
+        last = self.__add_monster(3, 3)
+        self.store.remove(first)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(last.row, 0)
+        self.assertEqual(last.pos_x, 3)
+
+    def test_view_takes_damage_and_serializes(self):
+        view = self.__add_monster(10, 20, health=10)
+        view.take_damage(4)
+        data = view.serialize()
+        self.assertEqual(data["health"], 6)
+        self.assertEqual(data["name"], "green_slime")
+        self.assertEqual(data["xp_drop"], 9)
+
+    def test_view_attack_respects_cooldown(self):
+        view = self.__add_monster(10, 20)
+        target = MagicMock()
+        view.attack(target)
+        view.attack(target)
+        target.take_damage.assert_called_once_with(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import MagicMock
+
+from business.entities.monster import Monster
+from business.weapons.attack_shape import NormalBullet
+from business.weapons.stats import MonsterStats, ProjectileStats
+from business.world.object_pool import ObjectPool, PoolRegistry
+
+
+class Pooled:
+    def __init__(self, value):
+        self.value = value
+
+
+class TestObjectPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ObjectPool()
+
+    def acquire(self, value):
+        return self.pool.acquire(lambda: Pooled(value), lambda obj: setattr(obj, "value", value))
+
+    def test_released_object_is_reset_and_reused(self):
+        first = self.acquire(1)
+        self.pool.release(first)
+        second = self.acquire(2)
+        self.assertIs(first, second)
+        self.assertEqual(second.value, 2)
+        self.assertEqual((self.pool.created, self.pool.reused), (1, 1))
+
+    def test_statistics(self):
+        objects = [self.acquire(i) for i in range(3)]
+        self.pool.release(objects[0])
+        self.assertEqual((self.pool.live, self.pool.free, self.pool.high_water), (2, 1, 3))
+
+    def test_objects_dropped_without_release_stop_counting_as_live(self):
+        self.acquire(1)
+        self.assertEqual(self.pool.live, 0)
+        self.assertEqual(self.pool.high_water, 1)
+
+
+class TestPooledEntities(unittest.TestCase):
+    def setUp(self):
+        PoolRegistry().clear()
+        self.stats = MonsterStats(speed=1, health=10, damage=1, attack_cooldown=1000, xp_drop=1)
+
+    def tearDown(self):
+        PoolRegistry().clear()
+
+    def test_reused_monster_is_reset(self):
+        monster = Monster.create(10, 20, self.stats, "green_slime")
+        monster.take_damage(5)
+        PoolRegistry().release(monster)
+        reused = Monster.create(30, 40, self.stats, "red_slime")
+        self.assertIs(reused, monster)
+        self.assertEqual((reused.pos_x, reused.pos_y, reused.health, reused.name), (30, 40, 10, "red_slime"))
+        self.assertEqual(reused.sprite.rect.center, (30, 40))
+        self.assertEqual(PoolRegistry().stats()["Monster"], (1, 0, 1))
+
+    def test_bullet_hits_a_reused_monster_again(self):
+        stats = ProjectileStats(damage=1, velocity=1, area_of_effect=1, reload_time=1, pierce=5, duration=1000)
+        bullet = NormalBullet.create(0, 0, "./assets/bullets/greenbullet.png", stats)
+        monster = Monster.create(0, 0, self.stats, "green_slime")
+        bullet.attack(monster)
+        bullet.attack(monster)
+        self.assertEqual(monster.health, 9)
+        PoolRegistry().release(monster)
+        reused = Monster.create(0, 0, self.stats, "green_slime")
+        bullet.attack(reused)
+        self.assertEqual(reused.health, 9)
+
+    def test_reused_bullet_does_not_compound_its_scaling(self):
+        stats = ProjectileStats(damage=1, velocity=1, area_of_effect=2, reload_time=1, pierce=1, duration=1000)
+        bullet = NormalBullet.create(0, 0, "./assets/bullets/greenbullet.png", stats)
+        size = bullet.sprite.rect.size
+        bullet.attack(MagicMock())
+        PoolRegistry().release(bullet)
+        reused = NormalBullet.create(5, 5, "./assets/bullets/bigbullet.png", stats, "Bigbullet")
+        self.assertIs(reused, bullet)
+        self.assertEqual(reused.sprite.rect.size, size)
+        self.assertEqual((reused.health, reused.bullet_type, reused.sprite.image_path), (1, "Bigbullet", "./assets/bullets/bigbullet.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import pygame
+from unittest.mock import MagicMock
+from business.world.spatial_hash import SpatialHash
+from business.world.crowd_separation import CrowdSeparation
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialHash(48, 48)
+
+    def test_query_returns_items_in_neighbouring_cells(self):
+        self.grid.insert("near", pygame.Rect(60, 60, 10, 10))
+        self.grid.insert("far", pygame.Rect(500, 500, 10, 10))
+        self.assertEqual(self.grid.query(pygame.Rect(10, 10, 10, 10)), ["near"])
+
+    def test_query_returns_each_item_once_in_insertion_order(self):
+        self.grid.insert("big", pygame.Rect(0, 0, 200, 200))
+        self.grid.insert("small", pygame.Rect(10, 10, 5, 5))
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 100, 100)), ["big", "small"])
+
+    def test_rebuild_replaces_previous_items(self):
+        self.grid.insert("old", pygame.Rect(0, 0, 10, 10))
+        self.grid.rebuild([("new", pygame.Rect(0, 0, 10, 10))])
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 10, 10)), ["new"])
+        self.assertEqual(len(self.grid), 1)
+
+
+class TestCrowdSeparation(unittest.TestCase):
+    def __create_monster(self, rect):
+        monster = MagicMock()
+        monster.sprite.rect = rect
+        return monster
+
+    def test_find_blocker_returns_first_overlapping_monster_in_update_order(self):
+        mover = self.__create_monster(pygame.Rect(0, 0, 48, 48))
+        first = self.__create_monster(pygame.Rect(40, 0, 48, 48))
+        second = self.__create_monster(pygame.Rect(30, 0, 48, 48))
+        crowd = CrowdSeparation()
+        crowd.rebuild([mover, first, second])
+        self.assertIs(crowd.find_blocker(mover, pygame.Rect(5, 5, 38, 38)), first)
+
+    def test_find_blocker_ignores_the_moving_monster(self):
+        mover = self.__create_monster(pygame.Rect(0, 0, 48, 48))
+        crowd = CrowdSeparation()
+        crowd.rebuild([mover])
+        self.assertIsNone(crowd.find_blocker(mover, pygame.Rect(5, 5, 38, 38)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import MagicMock
+
+from business.world.ingameclock import InGameClock
+from business.world.monster_spawner import MonsterSpawner
+from business.world.spawn_timeline import SpawnTimeline
+
+STATS = {"speed": 1, "health": 10, "damage": 1, "attack_cooldown": 1000, "xp_drop": 2}
+
+
+class TestSpawnTimeline(unittest.TestCase):
+    def setUp(self):
+        self.timeline = SpawnTimeline.from_dict({
+            "max_monsters": 5,
+            "waves": [
+                {"start": 60, "end": None, "monsters": [{"name": "red_slime", "every": 500, "stats": STATS}]},
+                {"start": 0, "end": 30, "monsters": [{"name": "green_slime", "every": 1000, "count": 2, "stats": STATS}]},
+            ],
+            "bursts": [{"at": 90, "name": "blue_slime", "count": 3, "stats": STATS}, {"at": 10, "name": "blue_slime", "count": 3, "stats": STATS}],
+        })
+
+    def test_waves_are_looked_up_by_time(self):
+        self.assertEqual(self.timeline.get_wave(0).rules[0].name, "green_slime")
+        self.assertIsNone(self.timeline.get_wave(45_000))
+        self.assertEqual(self.timeline.get_wave(3_600_000).rules[0].name, "red_slime")
+
+    def test_bursts_are_returned_once(self):
+        bursts, index = self.timeline.get_bursts(0, 20_000)
+        self.assertEqual([burst.at for burst in bursts], [10_000])
+        bursts, index = self.timeline.get_bursts(index, 20_000)
+        self.assertEqual(bursts, [])
+        self.assertEqual(self.timeline.get_burst_index(50_000), 1)
+
+    def test_the_game_timeline_loads_and_lasts_forever(self):
+        timeline = SpawnTimeline.load()
+        self.assertIsNotNone(timeline.get_wave(0))
+        self.assertIsNotNone(timeline.get_wave(3_600_000))
+
+
+class TestMonsterSpawner(unittest.TestCase):
+    def setUp(self):
+        InGameClock().reset()
+        self.timeline = SpawnTimeline.from_dict({
+            "max_monsters": 3,
+            "waves": [{"start": 0, "end": None, "monsters": [{"name": "green_slime", "every": 1000, "count": 2, "stats": STATS}]}],
+        })
+        self.spawner = MonsterSpawner(self.timeline)
+        self.spawner.spawn_monster = MagicMock()
+        self.world = MagicMock()
+        self.world.monsters = []
+
+    def tearDown(self):
+        InGameClock().reset()
+
+    def test_spawns_in_batches_up_to_the_cap(self):
+        InGameClock().update(0.5)
+        self.spawner.update(self.world)
+        InGameClock().update(1)
+        self.spawner.update(self.world)
+        self.assertEqual(self.spawner.spawn_monster.call_count, 2)
+        self.world.monsters = [MagicMock(), MagicMock()]
+        InGameClock().update(1)
+        self.spawner.update(self.world)
+        self.assertEqual(self.spawner.spawn_monster.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
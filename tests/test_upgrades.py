@@ -3,6 +3,7 @@ from unittest.mock import patch, mock_open
 from business.weapons.stats import ProjectileStats, PlayerStats
 from business.weapons.upgrade import Upgrade
 from business.weapons.exception import InvalidLevelUp
+from business.weapons.item_catalog import ItemCatalog
 
 class TestUpgrade(unittest.TestCase):
 
@@ -10,6 +11,10 @@ class TestUpgrade(unittest.TestCase):
         """Set up the initial stats for testing."""
         self.projectile_stats = ProjectileStats(10,10,10,10,10,10)  # damage, velocity, duration, reload_time, area_of_effect, projectile_count
         self.player_stats = PlayerStats(10,10,10,10,10,self.projectile_stats)  # max_health, recovery, projectile_stats
+        ItemCatalog().clear()  # Each test reads its own item data
+
+    def tearDown(self):
+        ItemCatalog().clear()
 
     @patch('builtins.open', new_callable=mock_open, read_data='{"Green Wand": {"type": "weapon", "max_level": 3, "levels": [{"damage": 5}]}}')
     def test_apply_weapon_upgrade(self, mock_file):
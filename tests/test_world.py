@@ -1,36 +1,47 @@
 import unittest
 import pygame
 import settings
+from collections import defaultdict
 from unittest.mock import MagicMock, patch, mock_open
 from business.entities.experience_gem import ExperienceGem
 from business.world.game_world import GameWorld
+from business.world.ingameclock import InGameClock
+from business.handlers.cooldown_scheduler import CooldownScheduler
 from business.world.interfaces import IMonsterSpawner, ITileMap
 from business.weapons.factories.weapon_factory import WeaponFactory
 from business.entities.interfaces import IPlayer
 from persistance.xpDAO import xpDAO
 from persistance.bulletDAO import BulletDAO
 from persistance.monsterDAO import MonsterDAO
+from persistance.save_snapshot import SaveSnapshot
 from presentation.sprite import MonsterSprite
 from business.entities.monster import Monster,MonsterStats
 from business.weapons.stats import PlayerStats
 from business.handlers.colission_handler import CollisionHandler
 from business.handlers.death_handler import DeathHandler
 from business.world.monster_spawner import MonsterSpawner
+from business.entities.player import Player
+from business.weapons.inventory import Inventory
+from game.gamestate import RunningState
+from presentation.input_handler import InputHandler
+from presentation.sprite import PlayerSprite
 
 class TestGameWorldIntegration(unittest.TestCase):
+    def setUp(self):
+        InGameClock().reset()
+        CooldownScheduler().clear()
+        self.clock_dao = MagicMock()
+        self.clock_dao.load_time.return_value = 0
 
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.dump') 
-    @patch('json.load')  
-    def test_save_experience_gems(self, mock_load, mock_dump, mock_file):
+    def test_save_experience_gems(self):
 
         pygame.init()
         screen = pygame.display.set_mode((640, 480))
         mock_player = MagicMock(spec=IPlayer)
         mock_spawner = MagicMock(spec=IMonsterSpawner)
         mock_tile_map = MagicMock(spec=ITileMap)
-        mock_load.return_value = {}  
-        mock_xp_dao = xpDAO('mock_path.json')
+        snapshot = MagicMock(wraps=SaveSnapshot('mock_path.json'))
+        mock_xp_dao = xpDAO(snapshot)
         game_world = GameWorld(
             spawner=mock_spawner,
             tile_map=mock_tile_map,
@@ -39,23 +50,46 @@ class TestGameWorldIntegration(unittest.TestCase):
             enemy_dao=MagicMock(), 
             inventory_dao=MagicMock(), 
             player_dao=MagicMock(),
-            clock_dao=MagicMock(),
-            bullet_dao=MagicMock()
+            clock_dao=self.clock_dao,
+            bullet_dao=MagicMock(),
+            save_snapshot=snapshot
         )
         experience_gem =ExperienceGem(10,20,100)
         game_world.add_experience_gem(experience_gem)
 
-        game_world.save_data()
-        expected_data = {
-            "Experience": [
-                {"pos_x": 10, "pos_y": 20, "amount": 100},
-            ]
-        }
-        mock_dump.assert_called_once_with(expected_data, mock_file(), indent=4)
+        with patch.object(SaveSnapshot, 'commit') as mock_commit:
+            game_world.save_data()
+        snapshot.update.assert_called_once()
+        saved_gems = snapshot.update.call_args.args[0]["Experience"]
+        self.assertEqual(list(saved_gems.rows("pos_x", "pos_y", "amount")), [(10, 20, 100)])
+        mock_commit.assert_called_once()
 
         
         pygame.quit()
 
+    def test_autosave_collects_the_state_for_the_save_thread(self):
+        snapshot = MagicMock(spec=SaveSnapshot)
+        snapshot.is_saving = False
+        player_dao = MagicMock()
+        game_world = GameWorld(
+            spawner=MagicMock(spec=IMonsterSpawner),
+            tile_map=MagicMock(spec=ITileMap),
+            player=MagicMock(spec=IPlayer),
+            xp_dao=MagicMock(),
+            enemy_dao=MagicMock(),
+            inventory_dao=MagicMock(),
+            player_dao=player_dao,
+            clock_dao=self.clock_dao,
+            bullet_dao=MagicMock(),
+            save_snapshot=snapshot
+        )
+        for _ in range(GameWorld.AUTOSAVE_TICKS - 1):
+            game_world.update()
+        snapshot.batch.assert_not_called()
+        game_world.update()
+        snapshot.batch.assert_called_once_with(True)
+        player_dao.save_player.assert_called_once()
+
     def test_bullet_kills_enemy_in_world(self):
         enemy_name = "black_slime"
         pygame.init()
@@ -84,7 +118,7 @@ class TestGameWorldIntegration(unittest.TestCase):
             enemy_dao=enemy_dao, 
             inventory_dao=MagicMock(), 
             player_dao=MagicMock(),
-            clock_dao=MagicMock(),
+            clock_dao=self.clock_dao,
             bullet_dao=bullet_dao
         )
         enemy=Monster(settings.SCREEN_WIDTH // 2,settings.SCREEN_HEIGHT // 2,MonsterSprite(settings.SCREEN_WIDTH // 2,settings.SCREEN_HEIGHT // 2,enemy_name),MonsterStats(1,1,1,1,1),enemy_name)
@@ -99,6 +133,47 @@ class TestGameWorldIntegration(unittest.TestCase):
         self.assertEqual(1,len(game_world.experience_gems))
         pygame.quit()
     
+    def test_entity_registry_follows_add_and_remove(self):
+        enemy_dao = MagicMock()
+        enemy_dao.load_monsters.return_value = []
+        game_world = GameWorld(
+            spawner=MagicMock(spec=IMonsterSpawner),
+            tile_map=MagicMock(spec=ITileMap),
+            player=MagicMock(spec=IPlayer),
+            xp_dao=MagicMock(),
+            enemy_dao=enemy_dao,
+            inventory_dao=MagicMock(),
+            player_dao=MagicMock(),
+            clock_dao=self.clock_dao,
+            bullet_dao=MagicMock()
+        )
+        monster = MagicMock()
+        game_world.add_monster(monster)
+        self.assertIs(game_world.get_entity_by_sprite(monster.sprite), monster)
+        game_world.remove_monster(monster)
+        self.assertIsNone(game_world.get_entity_by_sprite(monster.sprite))
+
+    def test_removed_bullet_handle_goes_stale_and_double_removal_is_ignored(self):
+        game_world = GameWorld(
+            spawner=MagicMock(spec=IMonsterSpawner),
+            tile_map=MagicMock(spec=ITileMap),
+            player=MagicMock(spec=IPlayer),
+            xp_dao=MagicMock(),
+            enemy_dao=MagicMock(),
+            inventory_dao=MagicMock(),
+            player_dao=MagicMock(),
+            clock_dao=self.clock_dao,
+            bullet_dao=MagicMock()
+        )
+        bullet = MagicMock()
+        handle = game_world.add_bullet(bullet)
+        game_world.remove_bullet(bullet)
+        game_world.remove_bullet(bullet)
+        self.assertIsNone(handle.entity)
+        self.assertEqual(list(game_world.bullets), [])
+        game_world.update()
+        self.assertEqual(list(game_world.bullets), [])
+
     def test_handle_bullet_monster_collision(self):
         mock_world = MagicMock()
         mock_bullet_sprite = MagicMock()
@@ -114,7 +189,55 @@ class TestGameWorldIntegration(unittest.TestCase):
         mock_monster.sprite = mock_monster_sprite
         mock_world.bullets = [mock_bullet]
         mock_world.monsters = [mock_monster]
+        mock_world.get_entity_by_sprite.side_effect = {mock_bullet_sprite: mock_bullet, mock_monster_sprite: mock_monster}.get
         bullet_masks = {mock_bullet_sprite: bullet_mask}
         monster_masks = {mock_monster_sprite: monster_mask}
         CollisionHandler.handle_bullet_monster_collisions(mock_world, bullet_masks, monster_masks)
-        mock_bullet.attack.assert_called_once_with(mock_monster)
\ No newline at end of file
+        mock_bullet.attack.assert_called_once_with(mock_monster)
+
+
+class TestRunningStateInterpolation(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        InGameClock().reset()
+        CooldownScheduler().clear()
+        center = (settings.WORLD_WIDTH // 2, settings.WORLD_HEIGHT // 2)
+        self.player = Player(*center, PlayerSprite(*center), Inventory([], []), 0, 1, 100)
+        clock_dao = MagicMock()
+        clock_dao.load_time.return_value = 0
+        empty_dao = MagicMock()
+        empty_dao.load_monsters.return_value = []
+        empty_dao.load_bullets.return_value = []
+        empty_dao.load_xp.return_value = []
+        self.world = GameWorld(
+            MagicMock(spec=IMonsterSpawner), MagicMock(spec=ITileMap), self.player,
+            empty_dao, empty_dao, MagicMock(), MagicMock(), clock_dao, empty_dao
+        )
+        self.game = MagicMock()
+        self.game.world = self.world
+        self.game.input_handler = InputHandler(self.world)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def __step(self, *keys):
+        pressed = defaultdict(bool, {key: True for key in keys})
+        with patch("presentation.input_handler.pygame.key.get_pressed", return_value=pressed):
+            RunningState().update(self.game)
+
+    def test_player_moved_by_the_input_is_interpolated(self):
+        start = self.player.sprite.rect.center
+        self.__step(pygame.K_d)
+        end = self.player.sprite.rect.center
+        self.assertGreater(end[0], start[0])
+        self.assertEqual(self.player.sprite.get_interpolated_rect(0).center, start)
+        self.assertLess(self.player.sprite.get_interpolated_rect(0.5).centerx, end[0])
+        self.assertEqual(self.player.sprite.get_interpolated_rect(1).center, end)
+
+    def test_next_step_interpolates_from_where_the_last_one_ended(self):
+        self.__step(pygame.K_d)
+        end = self.player.sprite.rect.center
+        self.__step()
+        self.assertEqual(self.player.sprite.get_interpolated_rect(0).center, end)
+        self.assertEqual(self.player.sprite.get_interpolated_rect(0.5).center, end)